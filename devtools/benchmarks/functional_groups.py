@@ -0,0 +1,83 @@
+"""Reports the per-molecule latency of the available functional group backends.
+
+Usage:
+
+    python devtools/benchmarks/functional_groups.py [SMILES_FILE] [--repeats N]
+
+where ``SMILES_FILE`` is an optional file containing one smiles pattern per line.
+"""
+import argparse
+import time
+
+from nonbonded.library.config import settings
+from nonbonded.library.utilities import checkmol
+from nonbonded.library.utilities.checkmol import (
+    FunctionalGroupBackend,
+    analyse_functional_groups_batch,
+)
+
+DEFAULT_SMILES = [
+    "CCO",
+    "CC(C)O",
+    "CC(C)=O",
+    "CCOC(C)=O",
+    "CCOCC",
+    "CCN(CC)CC",
+    "CC#N",
+    "ClCCl",
+    "c1ccccc1O",
+    "c1ccncc1",
+    "CC(N)=O",
+    "C=CCC",
+]
+
+
+def main():
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("smiles_file", nargs="?", default=None)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--n-processes", type=int, default=1)
+
+    arguments = parser.parse_args()
+
+    if arguments.smiles_file is None:
+        smiles = DEFAULT_SMILES
+    else:
+        with open(arguments.smiles_file) as file:
+            smiles = [line.strip() for line in file if len(line.strip()) > 0]
+
+    print(f"{'backend':<10} {'n molecules':>12} {'ms / molecule':>14}")
+
+    for backend in FunctionalGroupBackend:
+
+        timings = []
+
+        for _ in range(arguments.repeats):
+
+            # Clear the in-memory cache, and disable the persistent cache, so that
+            # every repeat measures a cold analysis.
+            checkmol._functional_group_cache.clear()
+            settings.FUNCTIONAL_GROUP_CACHE_SIZE = 0
+
+            start_time = time.perf_counter()
+
+            try:
+                analyse_functional_groups_batch(
+                    smiles, n_processes=arguments.n_processes, backend=backend
+                )
+            except (FileNotFoundError, ImportError) as e:
+                print(f"{backend.value:<10} skipped: {e}")
+                break
+
+            timings.append(time.perf_counter() - start_time)
+
+        if len(timings) == 0:
+            continue
+
+        latency = min(timings) / len(smiles) * 1000.0
+        print(f"{backend.value:<10} {len(smiles):>12} {latency:>14.3f}")
+
+
+if __name__ == "__main__":
+    main()
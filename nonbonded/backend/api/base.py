@@ -1,6 +1,9 @@
 import abc
-from typing import Callable, TypeVar
+import hashlib
+from typing import Callable, Optional, TypeVar
 
+from fastapi import Request, Response
+from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
 from nonbonded.backend.database.crud.crud import CRUDInterface
@@ -9,6 +12,50 @@ S = TypeVar("S")
 T = TypeVar("T")
 
 
+def _etag_matches(etag: str, if_none_match: Optional[str]) -> bool:
+    """Returns whether an ETag matches any of those in an ``If-None-Match`` header,
+    using the weak comparison required for conditional GET requests."""
+
+    if if_none_match is None:
+        return False
+
+    def strip_weak(value: str) -> str:
+        return value[2:] if value.startswith("W/") else value
+
+    return any(
+        value == "*" or strip_weak(value) == strip_weak(etag)
+        for value in (value.strip() for value in if_none_match.split(","))
+    )
+
+
+def conditional_response(request: Request, model: Optional[BaseModel]):
+    """Serializes a model into a response which carries a strong ETag (a hash of its
+    contents), or into an empty 304 response if the client already holds a copy of
+    the same contents.
+
+    Parameters
+    ----------
+    request
+        The incoming request.
+    model
+        The model to return. ``None`` values are returned unchanged.
+    """
+
+    if model is None:
+        return None
+
+    body = model.json().encode()
+    etag = f'"{hashlib.sha256(body).hexdigest()}"'
+
+    # Clients may store the response but must revalidate it before re-using it.
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+    if _etag_matches(etag, request.headers.get("if-none-match")):
+        return Response(status_code=304, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 class BaseCRUDEndpoint(abc.ABC):
     @classmethod
     @abc.abstractmethod
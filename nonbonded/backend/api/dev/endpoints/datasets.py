@@ -1,11 +1,11 @@
 import logging
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from fastapi.openapi.models import APIKey
 from sqlalchemy.orm import Session
 
 from nonbonded.backend.api import depends
-from nonbonded.backend.api.base import BaseCRUDEndpoint
+from nonbonded.backend.api.base import BaseCRUDEndpoint, conditional_response
 from nonbonded.backend.core.security import check_access_token
 from nonbonded.backend.database.crud.datasets import DataSetCRUD, QCDataSetCRUD
 from nonbonded.library.models.datasets import (
@@ -28,6 +28,7 @@ class DataSetEndpoints(BaseCRUDEndpoint):
     @staticmethod
     @router.get("/phys-prop/", response_model=DataSetCollection)
     async def get_all(
+        request: Request,
         db: Session = Depends(depends.get_db),
         skip: int = 0,
         limit: int = 100,
@@ -43,12 +44,14 @@ class DataSetEndpoints(BaseCRUDEndpoint):
             skip=skip, limit=limit, total_records=DataSetCRUD.n_total(db)
         )
 
-        return data_set_collection
+        return conditional_response(request, data_set_collection)
 
     @staticmethod
     @router.get("/phys-prop/{data_set_id}")
-    async def get(data_set_id, db: Session = Depends(depends.get_db)):
-        return DataSetEndpoints._read_function(db, data_set_id=data_set_id)
+    async def get(request: Request, data_set_id, db: Session = Depends(depends.get_db)):
+        return conditional_response(
+            request, DataSetEndpoints._read_function(db, data_set_id=data_set_id)
+        )
 
     @staticmethod
     @router.post("/phys-prop/")
@@ -77,6 +80,7 @@ class QCDataSetEndpoints(BaseCRUDEndpoint):
     @staticmethod
     @router.get("/qc/", response_model=QCDataSetCollection)
     async def get_all(
+        request: Request,
         db: Session = Depends(depends.get_db),
         skip: int = 0,
         limit: int = 100,
@@ -92,12 +96,17 @@ class QCDataSetEndpoints(BaseCRUDEndpoint):
             skip=skip, limit=limit, total_records=QCDataSetCRUD.n_total(db)
         )
 
-        return data_set_collection
+        return conditional_response(request, data_set_collection)
 
     @staticmethod
     @router.get("/qc/{qc_data_set_id}")
-    async def get(qc_data_set_id, db: Session = Depends(depends.get_db)):
-        return QCDataSetEndpoints._read_function(db, qc_data_set_id=qc_data_set_id)
+    async def get(
+        request: Request, qc_data_set_id, db: Session = Depends(depends.get_db)
+    ):
+        return conditional_response(
+            request,
+            QCDataSetEndpoints._read_function(db, qc_data_set_id=qc_data_set_id),
+        )
 
     @staticmethod
     @router.post("/qc/")
@@ -1,9 +1,9 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from fastapi.openapi.models import APIKey
 from sqlalchemy.orm import Session
 
 from nonbonded.backend.api import depends
-from nonbonded.backend.api.base import BaseCRUDEndpoint
+from nonbonded.backend.api.base import BaseCRUDEndpoint, conditional_response
 from nonbonded.backend.core.security import check_access_token
 from nonbonded.backend.database import models
 from nonbonded.backend.database.crud.projects import (
@@ -40,6 +40,7 @@ class ProjectEndpoints(BaseCRUDEndpoint):
     @staticmethod
     @router.get("/", response_model=ProjectCollection)
     async def get_all(
+        request: Request,
         skip: int = 0,
         limit: int = 100,
         children: bool = True,
@@ -54,12 +55,14 @@ class ProjectEndpoints(BaseCRUDEndpoint):
             skip=skip, limit=limit, total_records=ProjectCRUD.n_total(db)
         )
 
-        return project_collection
+        return conditional_response(request, project_collection)
 
     @staticmethod
     @router.get("/{project_id}", response_model=Project)
-    async def get(project_id, db: Session = Depends(depends.get_db)):
-        return ProjectEndpoints._read_function(db, project_id=project_id)
+    async def get(request: Request, project_id, db: Session = Depends(depends.get_db)):
+        return conditional_response(
+            request, ProjectEndpoints._read_function(db, project_id=project_id)
+        )
 
     @staticmethod
     @router.post("/")
@@ -96,14 +99,21 @@ class StudyEndpoints(BaseCRUDEndpoint):
 
     @staticmethod
     @router.get("/{project_id}/studies/", response_model=StudyCollection)
-    async def get_all(project_id, db: Session = Depends(depends.get_db)):
-        return {"studies": StudyCRUD.read_all(db, project_id)}
+    async def get_all(
+        request: Request, project_id, db: Session = Depends(depends.get_db)
+    ):
+        return conditional_response(
+            request, StudyCollection(studies=StudyCRUD.read_all(db, project_id))
+        )
 
     @staticmethod
     @router.get("/{project_id}/studies/{study_id}", response_model=Study)
-    async def get(project_id, study_id, db: Session = Depends(depends.get_db)):
-        return StudyEndpoints._read_function(
-            db, project_id=project_id, study_id=study_id
+    async def get(
+        request: Request, project_id, study_id, db: Session = Depends(depends.get_db)
+    ):
+        return conditional_response(
+            request,
+            StudyEndpoints._read_function(db, project_id=project_id, study_id=study_id),
         )
 
     @staticmethod
@@ -146,24 +156,33 @@ class OptimizationEndpoints(BaseCRUDEndpoint):
         response_model=OptimizationCollection,
     )
     async def get_all(
-        project_id: str, study_id: str, db: Session = Depends(depends.get_db)
+        request: Request,
+        project_id: str,
+        study_id: str,
+        db: Session = Depends(depends.get_db),
     ):
         db_optimizations = OptimizationCRUD.read_all(db, project_id, study_id)
-        return OptimizationCollection(optimizations=db_optimizations)
+        return conditional_response(
+            request, OptimizationCollection(optimizations=db_optimizations)
+        )
 
     @staticmethod
     @router.get("/{project_id}/studies/{study_id}/optimizations/{optimization_id}")
     async def get(
+        request: Request,
         project_id,
         study_id,
         optimization_id,
         db: Session = Depends(depends.get_db),
     ):
-        return OptimizationEndpoints._read_function(
-            db,
-            project_id=project_id,
-            study_id=study_id,
-            sub_study_id=optimization_id,
+        return conditional_response(
+            request,
+            OptimizationEndpoints._read_function(
+                db,
+                project_id=project_id,
+                study_id=study_id,
+                sub_study_id=optimization_id,
+            ),
         )
 
     @staticmethod
@@ -211,6 +230,7 @@ class OptimizationResultEndpoints(BaseCRUDEndpoint):
         "/{project_id}/studies/{study_id}/optimizations/{optimization_id}/results/"
     )
     async def get(
+        request: Request,
         project_id,
         study_id,
         optimization_id,
@@ -224,7 +244,7 @@ class OptimizationResultEndpoints(BaseCRUDEndpoint):
             sub_study_id=optimization_id,
         )
 
-        return db_optimization_result
+        return conditional_response(request, db_optimization_result)
 
     @staticmethod
     @router.post(
@@ -278,21 +298,30 @@ class BenchmarkEndpoints(BaseCRUDEndpoint):
         response_model=BenchmarkCollection,
     )
     async def get_all(
-        project_id: str, study_id: str, db: Session = Depends(depends.get_db)
+        request: Request,
+        project_id: str,
+        study_id: str,
+        db: Session = Depends(depends.get_db),
     ):
         db_benchmarks = BenchmarkCRUD.read_all(db, project_id, study_id)
-        return BenchmarkCollection(benchmarks=db_benchmarks)
+        return conditional_response(
+            request, BenchmarkCollection(benchmarks=db_benchmarks)
+        )
 
     @staticmethod
     @router.get("/{project_id}/studies/{study_id}/benchmarks/{benchmark_id}")
     async def get(
+        request: Request,
         project_id,
         study_id,
         benchmark_id,
         db: Session = Depends(depends.get_db),
     ):
-        return BenchmarkEndpoints._read_function(
-            db, project_id=project_id, study_id=study_id, sub_study_id=benchmark_id
+        return conditional_response(
+            request,
+            BenchmarkEndpoints._read_function(
+                db, project_id=project_id, study_id=study_id, sub_study_id=benchmark_id
+            ),
         )
 
     @staticmethod
@@ -339,6 +368,7 @@ class BenchmarkResultEndpoints(BaseCRUDEndpoint):
     @staticmethod
     @router.get("/{project_id}/studies/{study_id}/benchmarks/{benchmark_id}/results/")
     async def get(
+        request: Request,
         project_id,
         study_id,
         benchmark_id,
@@ -352,7 +382,7 @@ class BenchmarkResultEndpoints(BaseCRUDEndpoint):
             sub_study_id=benchmark_id,
         )
 
-        return db_benchmark_result
+        return conditional_response(request, db_benchmark_result)
 
     @staticmethod
     @router.post("/{project_id}/studies/{study_id}/benchmarks/{benchmark_id}/results/")
@@ -7,7 +7,13 @@ from nonbonded.library.models import authors
 class AuthorCRUD:
     @staticmethod
     def read_all(db: Session, skip: int = 0, limit: int = 100):
-        return db.query(models.Author).offset(skip).limit(limit).all()
+        return (
+            db.query(models.Author)
+            .order_by(models.Author.id)
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
 
     @staticmethod
     def create(db: Session, author: authors.Author) -> models.Author:
@@ -81,7 +81,14 @@ class DataSetCRUD:
         db: Session, skip: int = 0, limit: int = 100, include_children: bool = True
     ):
 
-        data_sets = db.query(models.DataSet).offset(skip).limit(limit).all()
+        # Order the data sets so that consecutive pages never overlap.
+        data_sets = (
+            db.query(models.DataSet)
+            .order_by(models.DataSet.id)
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
         return [DataSetCRUD.db_to_model(x, include_children) for x in data_sets]
 
     @staticmethod
@@ -174,7 +181,13 @@ class QCDataSetCRUD:
         db: Session, skip: int = 0, limit: int = 100, include_children: bool = True
     ):
 
-        qc_data_sets = db.query(models.QCDataSet).offset(skip).limit(limit).all()
+        qc_data_sets = (
+            db.query(models.QCDataSet)
+            .order_by(models.QCDataSet.id)
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
         return [QCDataSetCRUD.db_to_model(x, include_children) for x in qc_data_sets]
 
     @staticmethod
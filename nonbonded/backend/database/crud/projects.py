@@ -898,7 +898,14 @@ class ProjectCRUD:
         db: Session, skip: int = 0, limit: int = 100, include_children: bool = True
     ):
 
-        db_projects = db.query(models.Project).offset(skip).limit(limit).all()
+        # Order the projects so that consecutive pages never overlap.
+        db_projects = (
+            db.query(models.Project)
+            .order_by(models.Project.id)
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
         return [ProjectCRUD.db_to_model(x, include_children) for x in db_projects]
 
     @staticmethod
@@ -101,6 +101,8 @@ class Statistic(Base):
 
     category = Column(String)
 
+    bootstrap_iterations = Column(Integer, nullable=True)
+
     __mapper_args__ = {"polymorphic_on": type, "polymorphic_identity": "base"}
 
 
@@ -0,0 +1,90 @@
+import click
+
+from nonbonded.library.utilities.cache import FunctionalGroupCache, ResponseCache
+
+
+@click.group(help="A collection of sub-commands for managing the local caches.")
+def cache():
+    """The stub group for the cache commands."""
+
+
+@click.command(help="Analyse and cache the functional groups of a set of molecules.")
+@click.argument(
+    "data_set_paths",
+    nargs=-1,
+    type=click.Path(exists=True, dir_okay=False),
+)
+@click.option(
+    "--smiles",
+    "smiles",
+    multiple=True,
+    type=click.STRING,
+    help="The smiles pattern of an additional molecule to cache.",
+)
+@click.option(
+    "--chunk-size",
+    default=500,
+    type=click.IntRange(min=1),
+    help="The maximum number of molecules to pass to a single checkmol call.",
+    show_default=True,
+)
+def warm(data_set_paths, smiles, chunk_size):
+
+    from nonbonded.library.utilities.checkmol import analyse_functional_groups_batch
+    from nonbonded.library.utilities.streaming import iter_data_set_entries
+
+    smiles = [*smiles]
+
+    for data_set_path in data_set_paths:
+
+        smiles.extend(
+            component.smiles
+            for entry in iter_data_set_entries(data_set_path)
+            for component in entry.components
+        )
+
+    groups = analyse_functional_groups_batch(
+        smiles, chunk_size=chunk_size, cache=FunctionalGroupCache.default()
+    )
+
+    n_failed = sum(1 for value in groups.values() if value is None)
+    print(f"Cached the functional groups of {len(groups) - n_failed} molecules.")
+
+    if n_failed > 0:
+        print(f"checkmol could not analyse {n_failed} of the molecules.")
+
+
+@click.command(help="Print the location, size and contents of the caches.")
+def info():
+
+    functional_group_cache = FunctionalGroupCache.default()
+    cache_size, entry_counts = functional_group_cache.info()
+
+    print(f"Functional group cache: {functional_group_cache.file_path}")
+    print(f"    size: {cache_size / 1024:.1f} KiB")
+    print(f"    maximum entries: {functional_group_cache.max_size}")
+
+    for version, entry_count in entry_counts.items():
+        print(f"    {version}: {entry_count} entries")
+
+    response_cache = ResponseCache.default()
+    cache_size, entry_count = response_cache.info()
+
+    print(f"Response cache: {response_cache.file_path}")
+    print(f"    size: {cache_size / 1024:.1f} KiB")
+    print(f"    maximum entries: {response_cache.max_size}")
+    print(f"    {entry_count} entries")
+
+
+@click.command(help="Remove all entries from the caches.")
+def clear():
+
+    for local_cache in [FunctionalGroupCache.default(), ResponseCache.default()]:
+
+        local_cache.clear()
+        print(f"Cleared {local_cache.file_path}")
+
+
+cache.add_command(warm)
+cache.add_command(info)
+cache.add_command(clear)
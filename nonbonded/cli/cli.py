@@ -1,6 +1,6 @@
 import click
 
-from nonbonded.cli import rest
+from nonbonded.cli import cache, convert, rest
 from nonbonded.cli.projects.projects import benchmark, optimization, project, study
 
 
@@ -17,3 +17,5 @@ cli.add_command(optimization)
 # cli.add_command(dataset)
 
 cli.add_command(rest.rest)
+cli.add_command(cache.cache)
+cli.add_command(convert.convert)
@@ -0,0 +1,120 @@
+import os
+from collections import defaultdict
+
+import click
+
+from nonbonded.library.models.datasets import DataSetCollection
+from nonbonded.library.models.results import BenchmarkResult, OptimizationResult
+from nonbonded.library.utilities.serialization import SerializationFormat, detect_format
+
+# The names (without extension) of the files which can be converted, and the type
+# of model which they store.
+_CONVERTIBLE_FILES = {
+    "test-set-collection": DataSetCollection,
+    "benchmark-results": BenchmarkResult,
+    "optimization-results": OptimizationResult,
+}
+
+
+@click.command(
+    help="Converts the data sets and results stored in one or more benchmark or "
+    "optimization directories into a different file format."
+)
+@click.argument(
+    "directories",
+    nargs=-1,
+    type=click.Path(exists=True, file_okay=False),
+)
+@click.option(
+    "--format",
+    "file_format",
+    default=SerializationFormat.Parquet.value,
+    type=click.Choice([file_format.value for file_format in SerializationFormat]),
+    help="The format to convert the files to.",
+    show_default=True,
+)
+@click.option(
+    "--compression",
+    default=None,
+    type=click.STRING,
+    help="The (optional) type of compression to apply to the converted files.",
+)
+@click.option(
+    "--remove-original",
+    is_flag=True,
+    default=False,
+    help="Whether to remove the original files once they have been converted and "
+    "the converted files have been read back and checked.",
+)
+def convert(directories, file_format, compression, remove_original):
+
+    file_format = SerializationFormat(file_format)
+
+    # Plan every conversion up front so that conflicting files are reported before
+    # any file is written.
+    conversions = []
+
+    for directory in directories:
+
+        for root, _, file_names in os.walk(directory):
+
+            input_paths = defaultdict(list)
+
+            for file_name in sorted(file_names):
+
+                stem, extension = os.path.splitext(file_name)
+
+                if stem not in _CONVERTIBLE_FILES or extension not in {
+                    ".json",
+                    ".msgpack",
+                    ".parquet",
+                }:
+                    continue
+
+                input_path = os.path.join(root, file_name)
+
+                if detect_format(input_path) == file_format:
+                    continue
+
+                input_paths[stem].append(input_path)
+
+            for stem, stem_paths in input_paths.items():
+
+                output_path = os.path.join(root, f"{stem}.{file_format.value}")
+
+                if os.path.exists(output_path):
+
+                    print(
+                        f"Skipping {', '.join(stem_paths)} as {output_path} already "
+                        f"exists."
+                    )
+                    continue
+
+                if len(stem_paths) > 1:
+
+                    raise click.ClickException(
+                        f"{' and '.join(stem_paths)} would both be converted to "
+                        f"{output_path}. Remove all but one of them and try again."
+                    )
+
+                conversions.append((stem, stem_paths[0], output_path))
+
+    for stem, input_path, output_path in conversions:
+
+        model = _CONVERTIBLE_FILES[stem].from_file(input_path)
+        model.to_file(output_path, file_format, compression)
+
+        print(f"Converted {input_path} to {output_path}.")
+
+        if not remove_original:
+            continue
+
+        if _CONVERTIBLE_FILES[stem].from_file(output_path) != model:
+
+            raise click.ClickException(
+                f"{output_path} does not contain the same contents as {input_path}, "
+                f"which has been kept."
+            )
+
+        os.unlink(input_path)
+        print(f"Removed {input_path}.")
@@ -9,11 +9,17 @@ from nonbonded.library.models.datasets import DataSetCollection
 def list_data_sets():
     """Lists all of the data sets which are available from the RESTful API."""
 
-    data_sets = DataSetCollection.from_rest()
+    # Only the descriptions of the data sets are needed and so their entries are not
+    # retrieved.
+    data_sets = (
+        data_set
+        for page in DataSetCollection.iter_rest(children=False)
+        for data_set in page.data_sets
+    )
 
     text_wrapper = TextWrapper(initial_indent="    ", subsequent_indent="    ")
 
-    for index, data_set in enumerate(data_sets.data_sets):
+    for index, data_set in enumerate(data_sets):
 
         print(f"{index}) {data_set.id}\n")
         print("\n".join(text_wrapper.wrap(data_set.description.split("\n")[0])))
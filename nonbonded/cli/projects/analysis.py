@@ -11,6 +11,42 @@ from nonbonded.library.models.projects import Benchmark, Optimization
 def _analyse_options() -> List[click.option]:
 
     return [
+        optgroup.group(
+            "Statistics",
+            help="Options for computing the statistics of the results.",
+        ),
+        optgroup.option(
+            "--random-seed",
+            type=click.INT,
+            default=None,
+            help="The seed to use when bootstrapping the confidence intervals of each "
+            "statistic. If not provided the statistics will not be reproducible.",
+        ),
+        optgroup.option(
+            "--bootstrap-iterations",
+            type=click.IntRange(min=1),
+            default=1000,
+            show_default=True,
+            help="The number of bootstrap iterations to perform when computing the "
+            "confidence intervals of each statistic, or the maximum number of "
+            "iterations if a `--convergence-tolerance` is provided.",
+        ),
+        optgroup.option(
+            "--convergence-tolerance",
+            type=click.FloatRange(min=0.0),
+            default=None,
+            help="If provided, the confidence intervals of each statistic will be "
+            "bootstrapped in batches until they and the standard error change by "
+            "less than this tolerance (in units of the standard error).",
+        ),
+        optgroup.option(
+            "--n-processes",
+            type=click.IntRange(min=1),
+            default=1,
+            show_default=True,
+            help="The number of processes to distribute the categorization of the "
+            "data and the statistics calculations across.",
+        ),
         optgroup.group(
             "Backwards compatibility",
             help="Options to allow for backwards compatibility with previous results.",
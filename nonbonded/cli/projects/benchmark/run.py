@@ -110,7 +110,7 @@ def _prepare_restart(
 
     # Load in the data set.
     if existing_results is None:
-        data_set = DataSetCollection.parse_file(
+        data_set = DataSetCollection.from_file(
             "test-set-collection.json"
         ).to_evaluator()
     else:
@@ -6,6 +6,7 @@ import click
 from nonbonded.cli.utilities import generate_click_command
 from nonbonded.library.models.projects import Benchmark, Optimization
 from nonbonded.library.models.results import BenchmarkResult, OptimizationResult
+from nonbonded.library.utilities.serialization import detect_format, find_file
 
 
 def _upload_options() -> List[click.option]:
@@ -23,12 +24,12 @@ def upload_command(model_type: Type[Union[Optimization, Benchmark]]):
         results_name = (
             "optimization" if issubclass(model_type, Optimization) else "benchmark"
         )
-        results_path = os.path.join("analysis", f"{results_name}-results.json")
-
-        results = result_type.parse_file(results_path).upload()
+        results_path = find_file(
+            os.path.join("analysis", f"{results_name}-results.json")
+        )
 
-        with open(results_path, "w") as file:
-            file.write(results.json())
+        results = result_type.from_file(results_path).upload()
+        results.to_file(results_path, detect_format(results_path))
 
     model_string = (
         "an optimization" if issubclass(model_type, Optimization) else "a benchmark"
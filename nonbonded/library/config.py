@@ -1,11 +1,28 @@
+import os
 from typing import Optional
 
 from pydantic import BaseSettings
 
 
+def _default_cache_directory() -> str:
+    return os.path.join(
+        os.environ.get("XDG_CACHE_HOME", os.path.join("~", ".cache")), "nonbonded"
+    )
+
+
 class Settings(BaseSettings):
     API_URL: str = "https://nonbonded.herokuapp.com/api/dev"
     ACCESS_TOKEN: Optional[str] = None
 
+    REQUEST_TIMEOUT: float = 60.0
+    REQUEST_MAX_RETRIES: int = 3
+    REQUEST_BACKOFF_FACTOR: float = 0.5
+    REQUEST_POOL_SIZE: int = 10
+
+    CACHE_DIRECTORY: str = _default_cache_directory()
+    FUNCTIONAL_GROUP_CACHE_SIZE: int = 100000
+    FUNCTIONAL_GROUP_BACKEND: str = "checkmol"
+    RESPONSE_CACHE_SIZE: int = 1000
+
 
 settings = Settings()
@@ -2,7 +2,7 @@ import abc
 import errno
 import logging
 import os
-from typing import TypeVar
+from typing import Optional, TypeVar
 
 from nonbonded.library.models.projects import Benchmark, Optimization
 from nonbonded.library.utilities.provenance import summarise_conda_environment
@@ -35,7 +35,14 @@ class AnalysisFactory(abc.ABC):
 
     @classmethod
     @abc.abstractmethod
-    def analyze(cls, reindex: bool):
+    def analyze(
+        cls,
+        reindex: bool,
+        random_seed: Optional[int] = None,
+        n_processes: int = 1,
+        bootstrap_iterations: int = 1000,
+        convergence_tolerance: Optional[float] = None,
+    ):
         """Generates statistics from the output of a particular sub-study.
 
         Parameters
@@ -44,6 +51,19 @@ class AnalysisFactory(abc.ABC):
             Whether to re-index the evaluated data sets before analysis to match
             the database indices. This option is expected to only be used for
             analysing the results of past studies not generated using the framework.
+        random_seed
+            The seed to use when bootstrapping the statistics. If `None`, the
+            statistics will not be reproducible.
+        n_processes
+            The number of processes to distribute the categorization of the data
+            and the bootstrapping across.
+        bootstrap_iterations
+            The number of bootstrap iterations to perform, or the maximum number if
+            ``convergence_tolerance`` is provided.
+        convergence_tolerance
+            If provided, the statistics will be bootstrapped in batches until their
+            standard errors and confidence intervals change by less than this
+            tolerance (in units of the standard error).
         """
         raise NotImplementedError()
 
@@ -13,7 +13,14 @@ logger = logging.getLogger(__name__)
 
 class BenchmarkAnalysisFactory(AnalysisFactory):
     @classmethod
-    def analyze(cls, reindex):
+    def analyze(
+        cls,
+        reindex,
+        random_seed=None,
+        n_processes=1,
+        bootstrap_iterations=1000,
+        convergence_tolerance=None,
+    ):
 
         from openff.evaluator.client import RequestResult
 
@@ -25,7 +32,7 @@ class BenchmarkAnalysisFactory(AnalysisFactory):
         os.makedirs(output_directory, exist_ok=True)
 
         # Load the reference data set
-        reference_data_sets = DataSetCollection.parse_file("test-set-collection.json")
+        reference_data_sets = DataSetCollection.from_file("test-set-collection.json")
 
         # Load in the request results.
         request_results: RequestResult = RequestResult.from_json("results.json")
@@ -53,6 +60,10 @@ class BenchmarkAnalysisFactory(AnalysisFactory):
             reference_data_set=reference_data_sets,
             estimated_data_set=estimated_data_set,
             analysis_environments=benchmark.analysis_environments,
+            bootstrap_iterations=bootstrap_iterations,
+            random_seed=random_seed,
+            n_processes=n_processes,
+            convergence_tolerance=convergence_tolerance,
         )
         benchmark_results.calculation_environment = cls._parse_calculation_environment()
         benchmark_results.analysis_environment = summarise_current_versions()
@@ -4,6 +4,8 @@ import os
 from collections import defaultdict
 from glob import glob
 
+import numpy
+
 from nonbonded.library.factories.analysis import AnalysisFactory
 from nonbonded.library.factories.analysis.targets.evaluator import (
     EvaluatorAnalysisFactory,
@@ -51,7 +53,14 @@ class OptimizationAnalysisFactory(AnalysisFactory):
         return refit_force_field
 
     @classmethod
-    def analyze(cls, reindex):
+    def analyze(
+        cls,
+        reindex,
+        random_seed=None,
+        n_processes=1,
+        bootstrap_iterations=1000,
+        convergence_tolerance=None,
+    ):
 
         # Load in the definition of the optimization to optimize.
         optimization = Optimization.parse_file("optimization.json")
@@ -81,6 +90,16 @@ class OptimizationAnalysisFactory(AnalysisFactory):
                 "optimization has completed."
             )
 
+        # Spawn an independent random stream for each target at each iteration so
+        # that the bootstrapped statistics of different targets and iterations are
+        # not correlated.
+        seed_sequences = [
+            iteration_seed_sequence.spawn(len(optimization.targets))
+            for iteration_seed_sequence in numpy.random.SeedSequence(random_seed).spawn(
+                n_iterations
+            )
+        ]
+
         # Analyse the results of each iteration.
         target_results = defaultdict(dict)
 
@@ -88,7 +107,9 @@ class OptimizationAnalysisFactory(AnalysisFactory):
 
             logger.info(f"Analysing the results of iteration {iteration}")
 
-            for target in optimization.targets:
+            for target, seed_sequence in zip(
+                optimization.targets, seed_sequences[iteration]
+            ):
 
                 logger.info(f"Analysing the {target.id} target.")
 
@@ -102,7 +123,12 @@ class OptimizationAnalysisFactory(AnalysisFactory):
                 if target_analyzer is None:
                     raise NotImplementedError
 
-                target_analyzer_kwargs = {}
+                target_analyzer_kwargs = {
+                    "random_seed": seed_sequence,
+                    "n_processes": n_processes,
+                    "bootstrap_iterations": bootstrap_iterations,
+                    "convergence_tolerance": convergence_tolerance,
+                }
 
                 if issubclass(target_analyzer, EvaluatorAnalysisFactory):
                     target_analyzer_kwargs["reindex"] = reindex
@@ -8,7 +8,11 @@ from nonbonded.library.models.datasets import DataSet
 from nonbonded.library.models.projects import Optimization
 from nonbonded.library.models.results import DataSetResult, EvaluatorTargetResult
 from nonbonded.library.models.targets import EvaluatorTarget
-from nonbonded.library.statistics.statistics import StatisticType
+from nonbonded.library.statistics.statistics import (
+    ConfidenceIntervalMethod,
+    RandomState,
+    StatisticType,
+)
 from nonbonded.library.utilities.migration import reindex_results
 
 _logger = logging.getLogger(__name__)
@@ -22,6 +26,13 @@ class EvaluatorAnalysisFactory(TargetAnalysisFactory):
         target: EvaluatorTarget,
         target_directory: str,
         result_directory: str,
+        random_seed: RandomState = None,
+        n_processes: int = 1,
+        bootstrap_iterations: int = 1000,
+        convergence_tolerance: Optional[float] = None,
+        confidence_interval_method: ConfidenceIntervalMethod = (
+            ConfidenceIntervalMethod.Bootstrap
+        ),
         reindex: bool = False,
     ) -> Optional[EvaluatorTargetResult]:
 
@@ -75,7 +86,12 @@ class EvaluatorAnalysisFactory(TargetAnalysisFactory):
             reference_data_set=reference_data_set,
             estimated_data_set=estimated_data_set,
             analysis_environments=optimization.analysis_environments,
+            bootstrap_iterations=bootstrap_iterations,
             statistic_types=[StatisticType.RMSE],
+            random_seed=random_seed,
+            n_processes=n_processes,
+            convergence_tolerance=convergence_tolerance,
+            confidence_interval_method=confidence_interval_method,
         )
 
         objective_function = cls._read_objective_function(result_directory)
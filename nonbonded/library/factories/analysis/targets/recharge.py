@@ -3,13 +3,20 @@ import os
 from collections import defaultdict
 from typing import Optional
 
+import numpy
+
 from nonbonded.library.factories.analysis.targets import TargetAnalysisFactory
 from nonbonded.library.models.datasets import Component
 from nonbonded.library.models.projects import Optimization
 from nonbonded.library.models.results import RechargeTargetResult, Statistic
 from nonbonded.library.models.targets import RechargeTarget
-from nonbonded.library.statistics.statistics import StatisticType, bootstrap_residuals
-from nonbonded.library.utilities.checkmol import components_to_categories
+from nonbonded.library.statistics.statistics import (
+    ConfidenceIntervalMethod,
+    RandomState,
+    StatisticType,
+    compute_grouped_residual_statistics,
+)
+from nonbonded.library.utilities.checkmol import components_to_categories_batch
 
 
 class RechargeAnalysisFactory(TargetAnalysisFactory):
@@ -20,6 +27,13 @@ class RechargeAnalysisFactory(TargetAnalysisFactory):
         target: RechargeTarget,
         target_directory: str,
         result_directory: str,
+        random_seed: RandomState = None,
+        n_processes: int = 1,
+        bootstrap_iterations: int = 1000,
+        convergence_tolerance: Optional[float] = None,
+        confidence_interval_method: ConfidenceIntervalMethod = (
+            ConfidenceIntervalMethod.Bootstrap
+        ),
     ) -> Optional[RechargeTargetResult]:
 
         residuals_path = os.path.join(result_directory, "residuals.json")
@@ -36,35 +50,55 @@ class RechargeAnalysisFactory(TargetAnalysisFactory):
 
         smiles_per_category[None] = [*squared_residuals]
 
-        for smiles in squared_residuals:
+        smiles_categories = components_to_categories_batch(
+            [
+                [Component(smiles=smiles, mole_fraction=0.0, exact_amount=1)]
+                for smiles in squared_residuals
+            ],
+            optimization.analysis_environments,
+            n_processes=n_processes,
+        )
 
-            categories = components_to_categories(
-                [Component(smiles=smiles, mole_fraction=0.0, exact_amount=1)],
-                optimization.analysis_environments,
-            )
+        for smiles, categories in zip(squared_residuals, smiles_categories):
 
             for category in categories:
                 smiles_per_category[category].append(smiles)
 
-        # Compute RMSE statistics for this target.
-        statistic_entries = []
-
-        for category in smiles_per_category:
+        # Compute RMSE statistics for every category of this target at once.
+        categories = [*smiles_per_category]
 
-            category_residuals = [
-                squared_residuals[smiles] for smiles in smiles_per_category[category]
+        category_residuals = numpy.array(
+            [
+                squared_residuals[smiles]
+                for category in categories
+                for smiles in smiles_per_category[category]
             ]
+        )
+        category_offsets = numpy.cumsum(
+            [0, *(len(smiles_per_category[category]) for category in categories)]
+        )
 
-            rmse, rmse_std, rmse_ci = bootstrap_residuals(category_residuals)
+        rmse, _, rmse_ci, n_iterations = compute_grouped_residual_statistics(
+            category_residuals,
+            category_offsets,
+            bootstrap_iterations=bootstrap_iterations,
+            random_state=random_seed,
+            n_processes=n_processes,
+            convergence_tolerance=convergence_tolerance,
+            confidence_interval_method=confidence_interval_method,
+        )
 
-            statistic_entry = Statistic(
+        statistic_entries = [
+            Statistic(
                 statistic_type=StatisticType.RMSE,
                 category=category,
-                value=rmse,
-                lower_95_ci=rmse_ci[0],
-                upper_95_ci=rmse_ci[1],
+                value=rmse[category_index],
+                lower_95_ci=rmse_ci[category_index, 0],
+                upper_95_ci=rmse_ci[category_index, 1],
+                bootstrap_iterations=n_iterations[category_index],
             )
-            statistic_entries.append(statistic_entry)
+            for category_index, category in enumerate(categories)
+        ]
 
         objective_function = cls._read_objective_function(result_directory)
 
@@ -5,6 +5,10 @@ from typing import Optional
 from nonbonded.library.models.projects import Optimization
 from nonbonded.library.models.results import TargetResult
 from nonbonded.library.models.targets import OptimizationTarget
+from nonbonded.library.statistics.statistics import (
+    ConfidenceIntervalMethod,
+    RandomState,
+)
 
 
 class TargetAnalysisFactory(abc.ABC):
@@ -39,6 +43,47 @@ class TargetAnalysisFactory(abc.ABC):
         target: OptimizationTarget,
         target_directory: str,
         result_directory: str,
+        random_seed: RandomState = None,
+        n_processes: int = 1,
+        bootstrap_iterations: int = 1000,
+        convergence_tolerance: Optional[float] = None,
+        confidence_interval_method: ConfidenceIntervalMethod = (
+            ConfidenceIntervalMethod.Bootstrap
+        ),
     ) -> Optional[TargetResult]:
+        """Analyzes the results of a particular optimization target at a single
+        optimization iteration.
+
+        Parameters
+        ----------
+        optimization
+            The optimization which the target is part of.
+        target
+            The target to analyze.
+        target_directory
+            The directory which contains the target inputs.
+        result_directory
+            The directory which contains the output of the target at the
+            iteration of interest.
+        random_seed
+            The seed (or seed sequence) to use when bootstrapping the target
+            statistics. If `None`, the statistics will not be reproducible.
+        n_processes
+            The number of processes to distribute the categorization of the data
+            and the bootstrapping across.
+        bootstrap_iterations
+            The number of bootstrap iterations to perform, or the maximum number if
+            ``convergence_tolerance`` is provided.
+        convergence_tolerance
+            If provided, the statistics will be bootstrapped in batches until their
+            standard errors and confidence intervals change by less than this
+            tolerance (in units of the standard error).
+        confidence_interval_method
+            The method to use to estimate the confidence intervals of each statistic.
+
+        Returns
+        -------
+            The analyzed results, or `None` if no results could be found.
+        """
 
         raise NotImplementedError()
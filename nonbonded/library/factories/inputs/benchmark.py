@@ -2,6 +2,7 @@ import os
 from typing import List, Optional, Union
 
 from nonbonded.library.factories.inputs import InputFactory
+from nonbonded.library.factories.inputs.retrieval import retrieve_model
 from nonbonded.library.models.datasets import DataSet, DataSetCollection, QCDataSet
 from nonbonded.library.models.projects import Benchmark
 from nonbonded.library.models.results import BenchmarkResult, OptimizationResult
@@ -34,7 +35,8 @@ class BenchmarkInputFactory(InputFactory):
             optimization_result = (
                 optimization_result
                 if optimization_result is not None
-                else OptimizationResult.from_rest(
+                else retrieve_model(
+                    OptimizationResult,
                     project_id=benchmark.project_id,
                     study_id=benchmark.study_id,
                     model_id=benchmark.optimization_id,
@@ -75,7 +77,8 @@ class BenchmarkInputFactory(InputFactory):
             The benchmark to retrieve the results for.
         """
 
-        results = BenchmarkResult.from_rest(
+        results = retrieve_model(
+            BenchmarkResult,
             project_id=benchmark.project_id,
             study_id=benchmark.study_id,
             model_id=benchmark.id,
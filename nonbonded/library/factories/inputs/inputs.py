@@ -9,6 +9,12 @@ from nonbonded.library.factories.inputs.evaluator import (
     EvaluatorServerConfig,
     QueueWorkerResources,
 )
+from nonbonded.library.factories.inputs.retrieval import (
+    RetrievalPlan,
+    has_retrieved_models,
+    retrieve_model,
+    use_retrieved_models,
+)
 from nonbonded.library.models.datasets import DataSet, QCDataSet
 from nonbonded.library.models.projects import Benchmark, Optimization, Project, Study
 from nonbonded.library.models.results import OptimizationResult
@@ -111,12 +117,13 @@ class InputFactory:
             ]
         )
         data_sets.extend(
-            data_set_type.from_rest(
+            retrieve_model(
+                data_set_type,
                 **{
                     (
                         "data_set_id" if data_set_type == DataSet else "qc_data_set_id"
                     ): data_set_id
-                }
+                },
             )
             for data_set_id in (expected_ids - found_ids)
         )
@@ -308,6 +315,30 @@ class InputFactory:
                 "optimization directly."
             )
 
+        if not has_retrieved_models():
+
+            # Retrieve everything referenced by the model and its children up front
+            # and concurrently, rather than one at a time as each input is generated.
+            retrieval_plan = RetrievalPlan.from_model(
+                model, include_results, reference_data_sets, optimization_result
+            )
+
+            with use_retrieved_models(retrieval_plan.retrieve()):
+
+                cls.generate(
+                    model,
+                    conda_environment,
+                    max_time,
+                    evaluator_preset,
+                    evaluator_port,
+                    n_evaluator_workers,
+                    include_results,
+                    reference_data_sets,
+                    optimization_result,
+                )
+
+            return
+
         os.makedirs(model.id, exist_ok=True)
 
         with temporary_cd(model.id):
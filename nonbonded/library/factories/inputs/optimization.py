@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING, List, Optional, Union
 import numpy
 
 from nonbonded.library.factories.inputs import InputFactory
+from nonbonded.library.factories.inputs.retrieval import retrieve_model
 from nonbonded.library.models.datasets import DataSet, DataSetCollection, QCDataSet
 from nonbonded.library.models.forcefield import ForceField
 from nonbonded.library.models.projects import Optimization
@@ -35,7 +36,8 @@ class OptimizationInputFactory(InputFactory):
         optimization_result = (
             optimization_result
             if optimization_result is not None
-            else OptimizationResult.from_rest(
+            else retrieve_model(
+                OptimizationResult,
                 project_id=optimization.project_id,
                 study_id=optimization.study_id,
                 model_id=optimization.optimization_id,
@@ -340,7 +342,8 @@ class OptimizationInputFactory(InputFactory):
             The optimization to retrieve the results for.
         """
 
-        results = OptimizationResult.from_rest(
+        results = retrieve_model(
+            OptimizationResult,
             project_id=optimization.project_id,
             study_id=optimization.study_id,
             model_id=optimization.id,
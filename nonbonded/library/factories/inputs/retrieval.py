@@ -0,0 +1,286 @@
+"""Utilities for retrieving, up front and concurrently, every data set and result
+which is referenced by a model before its inputs are generated."""
+import asyncio
+import contextlib
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Type, TypeVar, Union
+
+from nonbonded.library.config import settings
+from nonbonded.library.models import BaseREST
+from nonbonded.library.models.datasets import DataSet, QCDataSet
+from nonbonded.library.models.projects import Benchmark, Optimization, Project, Study
+from nonbonded.library.models.results import BenchmarkResult, OptimizationResult
+from nonbonded.library.models.targets import EvaluatorTarget, RechargeTarget
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T", bound=BaseREST)
+
+# A key which uniquely identifies a model which can be retrieved from the RESTful
+# API, composed of the type of model and the keyword arguments to pass to its
+# ``from_rest`` function, sorted by keyword.
+RetrievalKey = Tuple[Type[BaseREST], Tuple[Tuple[str, str], ...]]
+
+_retrieved_models: ContextVar[Optional[Dict[RetrievalKey, BaseREST]]] = ContextVar(
+    "retrieved_models", default=None
+)
+
+
+def _retrieval_key(model_type: Type[T], **kwargs: str) -> RetrievalKey:
+    return model_type, tuple(sorted(kwargs.items()))
+
+
+class RetrievalPlan:
+    """A plan of every data set, QC data set, optimization result and benchmark
+    result which must be retrieved from the RESTful API in order to generate the
+    inputs for a model (and all of its children)."""
+
+    def __init__(self):
+        self._keys: Set[RetrievalKey] = set()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    @property
+    def keys(self) -> List[RetrievalKey]:
+        """The (de-duplicated) keys of the models to retrieve."""
+        return sorted(self._keys, key=lambda key: (key[0].__name__, key[1]))
+
+    def add(self, model_type: Type[T], **kwargs: str):
+        """Adds a model to the plan.
+
+        Parameters
+        ----------
+        model_type
+            The type of model to retrieve.
+        kwargs
+            The keyword arguments to pass to the ``from_rest`` function of the model
+            type in order to retrieve it.
+        """
+        self._keys.add(_retrieval_key(model_type, **kwargs))
+
+    def _add_optimization_result(
+        self,
+        model: Union[Optimization, Benchmark],
+        optimization_result: Optional[OptimizationResult],
+    ):
+        """Adds the optimization result which provides the force field of a model,
+        unless the model specifies its own force field or the result is available
+        locally."""
+
+        if model.force_field is not None or (
+            optimization_result is not None
+            and optimization_result.id == model.optimization_id
+            and optimization_result.study_id == model.study_id
+            and optimization_result.project_id == model.project_id
+        ):
+            return
+
+        self.add(
+            OptimizationResult,
+            project_id=model.project_id,
+            study_id=model.study_id,
+            model_id=model.optimization_id,
+        )
+
+    def _add_model(
+        self,
+        model: Union[Project, Study, Optimization, Benchmark],
+        include_results: bool,
+        optimization_result: Optional[OptimizationResult],
+    ):
+
+        if isinstance(model, Project):
+
+            for study in model.studies:
+                self._add_model(study, include_results, optimization_result)
+
+        elif isinstance(model, Study):
+
+            for child in [*model.optimizations, *model.benchmarks]:
+                self._add_model(child, include_results, optimization_result)
+
+        elif isinstance(model, Optimization):
+
+            for target in model.targets:
+
+                if isinstance(target, EvaluatorTarget):
+
+                    for data_set_id in target.data_set_ids:
+                        self.add(DataSet, data_set_id=data_set_id)
+
+                elif isinstance(target, RechargeTarget):
+
+                    for data_set_id in target.qc_data_set_ids:
+                        self.add(QCDataSet, qc_data_set_id=data_set_id)
+
+                else:
+                    raise NotImplementedError()
+
+            self._add_optimization_result(model, optimization_result)
+
+            if include_results:
+
+                self.add(
+                    OptimizationResult,
+                    project_id=model.project_id,
+                    study_id=model.study_id,
+                    model_id=model.id,
+                )
+
+        elif isinstance(model, Benchmark):
+
+            for data_set_id in model.test_set_ids:
+                self.add(DataSet, data_set_id=data_set_id)
+
+            self._add_optimization_result(model, optimization_result)
+
+            if include_results:
+
+                self.add(
+                    BenchmarkResult,
+                    project_id=model.project_id,
+                    study_id=model.study_id,
+                    model_id=model.id,
+                )
+
+        else:
+            raise NotImplementedError()
+
+    @classmethod
+    def from_model(
+        cls,
+        model: Union[Project, Study, Optimization, Benchmark],
+        include_results: bool = False,
+        reference_data_sets: Optional[List[Union[DataSet, QCDataSet]]] = None,
+        optimization_result: Optional[OptimizationResult] = None,
+    ) -> "RetrievalPlan":
+        """Walks a model and its children collecting every model which they
+        reference but which is not available locally.
+
+        Parameters
+        ----------
+        model
+            The model to plan the retrieval for.
+        include_results
+            Whether to also retrieve any previously generated results.
+        reference_data_sets
+            Any locally available reference data sets.
+        optimization_result
+            The locally available optimization result (if any) referenced by the
+            model.
+        """
+
+        plan = cls()
+        plan._add_model(model, include_results, optimization_result)
+
+        for data_set in [] if reference_data_sets is None else reference_data_sets:
+
+            plan._keys.discard(
+                _retrieval_key(DataSet, data_set_id=data_set.id)
+                if isinstance(data_set, DataSet)
+                else _retrieval_key(QCDataSet, qc_data_set_id=data_set.id)
+            )
+
+        return plan
+
+    async def retrieve_async(
+        self, max_concurrency: Optional[int] = None
+    ) -> Dict[RetrievalKey, BaseREST]:
+        """Retrieves every model in this plan, with at most ``max_concurrency``
+        requests in flight at any one time.
+
+        Parameters
+        ----------
+        max_concurrency
+            The maximum number of concurrent requests. Defaults to
+            ``settings.REQUEST_POOL_SIZE``, the number of pooled connections.
+
+        Returns
+        -------
+            The retrieved models stored by their retrieval key.
+        """
+
+        max_concurrency = (
+            settings.REQUEST_POOL_SIZE if max_concurrency is None else max_concurrency
+        )
+
+        keys = self.keys
+
+        if len(keys) == 0:
+            return {}
+
+        loop = asyncio.get_running_loop()
+
+        # The requests themselves are made by the shared (pooled and retrying)
+        # session on a bounded set of worker threads.
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+
+            futures = [
+                loop.run_in_executor(
+                    executor,
+                    functools.partial(model_type.from_rest, **dict(key_arguments)),
+                )
+                for model_type, key_arguments in keys
+            ]
+
+            models = await asyncio.gather(*futures)
+
+        return {key: model for key, model in zip(keys, models)}
+
+    def retrieve(
+        self, max_concurrency: Optional[int] = None
+    ) -> Dict[RetrievalKey, BaseREST]:
+        """A synchronous wrapper around ``retrieve_async``."""
+
+        logger.info(f"Retrieving {len(self)} data sets and results.")
+        return asyncio.run(self.retrieve_async(max_concurrency))
+
+
+@contextlib.contextmanager
+def use_retrieved_models(models: Dict[RetrievalKey, BaseREST]) -> Iterator[None]:
+    """A context manager within which ``retrieve_model`` will return any of a set of
+    already retrieved models rather than requesting them again.
+
+    Parameters
+    ----------
+    models
+        The retrieved models stored by their retrieval key.
+    """
+
+    token = _retrieved_models.set(models)
+
+    try:
+        yield
+    finally:
+        _retrieved_models.reset(token)
+
+
+def has_retrieved_models() -> bool:
+    """Returns whether there is a set of already retrieved models in use."""
+    return _retrieved_models.get() is not None
+
+
+def retrieve_model(model_type: Type[T], **kwargs: str) -> T:
+    """Returns a model which was already retrieved as part of a ``RetrievalPlan``
+    if available, or otherwise retrieves it from the RESTful API.
+
+    Parameters
+    ----------
+    model_type
+        The type of model to retrieve.
+    kwargs
+        The keyword arguments to pass to the ``from_rest`` function of the model
+        type in order to retrieve it.
+    """
+
+    retrieved_models = _retrieved_models.get()
+    key = _retrieval_key(model_type, **kwargs)
+
+    if retrieved_models is not None and key in retrieved_models:
+        return retrieved_models[key]
+
+    return model_type.from_rest(**kwargs)
@@ -1,3 +1,4 @@
+import itertools
 import logging
 import os
 from typing import List
@@ -5,7 +6,6 @@ from typing import List
 from typing_extensions import Literal
 
 from nonbonded.library.factories.plots import PlotFactory
-from nonbonded.library.models.datasets import DataSetCollection
 from nonbonded.library.models.projects import Benchmark
 from nonbonded.library.models.results import BenchmarkResult
 from nonbonded.library.plotting.seaborn.benchmark import (
@@ -14,6 +14,12 @@ from nonbonded.library.plotting.seaborn.benchmark import (
     plot_scatter_results,
 )
 from nonbonded.library.statistics.statistics import StatisticType
+from nonbonded.library.utilities.serialization import find_file
+from nonbonded.library.utilities.streaming import (
+    iter_data_set_entries,
+    iter_result_entries,
+    load_without_entries,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -23,8 +29,11 @@ class BenchmarkPlotFactory(PlotFactory):
     def _load_sub_study(cls, directory):
 
         benchmark = Benchmark.parse_file(os.path.join(directory, "benchmark.json"))
-        benchmark_result = BenchmarkResult.parse_file(
-            os.path.join(directory, "analysis", "benchmark-results.json")
+
+        # The result entries are streamed from disk only when they are plotted.
+        benchmark_result = load_without_entries(
+            BenchmarkResult,
+            find_file(os.path.join(directory, "analysis", "benchmark-results.json")),
         )
 
         return benchmark, benchmark_result
@@ -38,18 +47,19 @@ class BenchmarkPlotFactory(PlotFactory):
         file_type: Literal["png", "pdf"],
     ):
 
-        data_sets = {}
-
-        # Load in the benchmarked data sets
-        for directory in directories:
-
-            reference_data_sets = DataSetCollection.parse_file(
-                os.path.join(directory, "test-set-collection.json")
+        # Stream the benchmarked data sets and results from disk.
+        reference_entries = itertools.chain.from_iterable(
+            iter_data_set_entries(
+                find_file(os.path.join(directory, "test-set-collection.json"))
             )
-
-            data_sets.update(
-                {data_set.id: data_set for data_set in reference_data_sets.data_sets}
+            for directory in directories
+        )
+        result_entries = [
+            iter_result_entries(
+                find_file(os.path.join(directory, "analysis", "benchmark-results.json"))
             )
+            for directory in directories
+        ]
 
         # Plot overall statistics about the optimization.
         for statistic_type in [StatisticType.RMSE, StatisticType.R2]:
@@ -59,4 +69,6 @@ class BenchmarkPlotFactory(PlotFactory):
         plot_categorized_rmse(sub_studies, results, "", file_type)
 
         # Plot the results as a scatter plot.
-        plot_scatter_results(sub_studies, results, [*data_sets.values()], "", file_type)
+        plot_scatter_results(
+            sub_studies, result_entries, reference_entries, "", file_type
+        )
@@ -24,7 +24,7 @@ class OptimizationPlotFactory(PlotFactory):
             os.path.join(directory, "optimization.json")
         )
 
-        optimization_result = OptimizationResult.parse_file(
+        optimization_result = OptimizationResult.from_file(
             os.path.join(directory, "analysis", "optimization-results.json")
         )
 
@@ -0,0 +1,686 @@
+"""A columnar, array backed representation of a physical property data set which
+avoids building (and validating) a pydantic model for every entry and component."""
+from typing import TYPE_CHECKING, Iterator, List, Optional, Union
+
+import numpy
+import pandas
+
+from nonbonded.library.models.authors import Author
+
+if TYPE_CHECKING:
+    from nonbonded.library.models.datasets import DataSet, DataSetEntry
+
+
+def _parse_id(value) -> Optional[int]:
+    """Parses an entry id in the same way as ``DataSetEntry.from_series``."""
+
+    if pandas.isna(value):
+        return None
+
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+class ColumnarDataSet:
+    """A data set of physical property measurements stored as a set of columns, one
+    per attribute of a ``DataSetEntry``.
+
+    Numeric attributes are stored as numpy arrays, while string attributes which take
+    only a handful of distinct values (the property type, phase and DOI) are stored as
+    ``pandas.Categorical`` codes. The components of every entry are flattened into a
+    single component table, where the components of entry ``i`` occupy the rows
+    ``component_offsets[i]:component_offsets[i + 1]``.
+
+    Notes
+    -----
+    * Entries without an id are stored with an id of -1 and a ``has_id`` value of
+      false.
+    * Entries without a std error are stored with a std error of NaN.
+    """
+
+    def __init__(
+        self,
+        identifier: str,
+        description: str,
+        authors: List[Author],
+        ids: numpy.ndarray,
+        has_id: numpy.ndarray,
+        property_types: pandas.Categorical,
+        temperatures: numpy.ndarray,
+        pressures: numpy.ndarray,
+        phases: pandas.Categorical,
+        values: numpy.ndarray,
+        std_errors: numpy.ndarray,
+        dois: pandas.Categorical,
+        component_offsets: numpy.ndarray,
+        component_smiles: pandas.Categorical,
+        component_mole_fractions: numpy.ndarray,
+        component_exact_amounts: numpy.ndarray,
+        component_roles: pandas.Categorical,
+    ):
+        """
+
+        Parameters
+        ----------
+        identifier
+            The unique identifier associated with the set.
+        description
+            A description of why and how this set was chosen.
+        authors
+            The authors who prepared the set.
+        ids
+            The id of each entry, or -1 where an entry has no id.
+        has_id
+            Whether each entry has an id.
+        property_types
+            The type of property that each value corresponds to.
+        temperatures
+            The temperature (K) at which each value was measured.
+        pressures
+            The pressure (kPa) at which each value was measured.
+        phases
+            The phase that each property was measured in.
+        values
+            The value of each entry in the default unit for its property.
+        std_errors
+            The std error of each entry in the default unit for its property, or
+            NaN where an entry has no std error.
+        dois
+            The DOI which encodes the source of each measurement.
+        component_offsets
+            The index of the first component of each entry in the component table,
+            followed by the total number of components.
+        component_smiles
+            The smiles representation of each component.
+        component_mole_fractions
+            The mole fraction of each component.
+        component_exact_amounts
+            The exact amount of each component.
+        component_roles
+            The role of each component.
+        """
+
+        self.id = identifier
+        self.description = description
+        self.authors = authors
+
+        self.ids = numpy.asarray(ids, dtype=numpy.int64)
+        self.has_id = numpy.asarray(has_id, dtype=bool)
+        self.property_types = pandas.Categorical(property_types)
+        self.temperatures = numpy.asarray(temperatures, dtype=numpy.float64)
+        self.pressures = numpy.asarray(pressures, dtype=numpy.float64)
+        self.phases = pandas.Categorical(phases)
+        self.values = numpy.asarray(values, dtype=numpy.float64)
+        self.std_errors = numpy.asarray(std_errors, dtype=numpy.float64)
+        self.dois = pandas.Categorical(dois)
+
+        self.component_offsets = numpy.asarray(component_offsets, dtype=numpy.int64)
+        self.component_smiles = pandas.Categorical(component_smiles)
+        self.component_mole_fractions = numpy.asarray(
+            component_mole_fractions, dtype=numpy.float64
+        )
+        self.component_exact_amounts = numpy.asarray(
+            component_exact_amounts, dtype=numpy.int64
+        )
+        self.component_roles = pandas.Categorical(component_roles)
+
+        n_entries = len(self.ids)
+        n_components = len(self.component_smiles)
+
+        entry_columns = [
+            self.has_id,
+            self.property_types,
+            self.temperatures,
+            self.pressures,
+            self.phases,
+            self.values,
+            self.std_errors,
+            self.dois,
+        ]
+        component_columns = [
+            self.component_mole_fractions,
+            self.component_exact_amounts,
+            self.component_roles,
+        ]
+
+        if any(len(column) != n_entries for column in entry_columns):
+            raise ValueError("All of the entry columns must have the same length.")
+        if any(len(column) != n_components for column in component_columns):
+            raise ValueError("All of the component columns must have the same length.")
+
+        if (
+            len(self.component_offsets) != n_entries + 1
+            or self.component_offsets[0] != 0
+            or self.component_offsets[-1] != n_components
+            or numpy.any(numpy.diff(self.component_offsets) < 1)
+        ):
+            raise ValueError(
+                "The component offsets must start at zero, end at the number of "
+                "components and assign at least one component to each entry."
+            )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def n_components(self) -> numpy.ndarray:
+        """The number of components in each entry."""
+        return numpy.diff(self.component_offsets)
+
+    @property
+    def component_entry_indices(self) -> numpy.ndarray:
+        """The index of the entry which each row of the component table belongs to."""
+        return numpy.repeat(numpy.arange(len(self)), self.n_components)
+
+    @property
+    def has_std_error(self) -> numpy.ndarray:
+        """Whether each entry has a std error."""
+        return ~numpy.isnan(self.std_errors)
+
+    @classmethod
+    def from_entries(
+        cls,
+        entries: List["DataSetEntry"],
+        identifier: str,
+        description: str,
+        authors: List[Author],
+    ) -> "ColumnarDataSet":
+        """Creates a columnar data set from a list of data set entries.
+
+        Parameters
+        ----------
+        entries
+            The entries to store.
+        identifier
+            The unique identifier associated with the set.
+        description
+            A description of why and how this set was chosen.
+        authors
+            The authors who prepared the set.
+        """
+
+        components = [component for entry in entries for component in entry.components]
+
+        return cls(
+            identifier=identifier,
+            description=description,
+            authors=authors,
+            ids=[-1 if entry.id is None else entry.id for entry in entries],
+            has_id=[entry.id is not None for entry in entries],
+            property_types=[entry.property_type for entry in entries],
+            temperatures=[entry.temperature for entry in entries],
+            pressures=[entry.pressure for entry in entries],
+            phases=[entry.phase for entry in entries],
+            values=[entry.value for entry in entries],
+            std_errors=[
+                numpy.nan if entry.std_error is None else entry.std_error
+                for entry in entries
+            ],
+            dois=[entry.doi for entry in entries],
+            component_offsets=numpy.cumsum(
+                [0, *(len(entry.components) for entry in entries)]
+            ),
+            component_smiles=[component.smiles for component in components],
+            component_mole_fractions=[
+                component.mole_fraction for component in components
+            ],
+            component_exact_amounts=[
+                component.exact_amount for component in components
+            ],
+            component_roles=[component.role for component in components],
+        )
+
+    @classmethod
+    def from_data_set(cls, data_set: "DataSet") -> "ColumnarDataSet":
+        """Creates a columnar data set from a ``DataSet``.
+
+        Parameters
+        ----------
+        data_set
+            The data set to convert.
+        """
+
+        return cls.from_entries(
+            data_set.entries,
+            identifier=data_set.id,
+            description=data_set.description,
+            authors=data_set.authors,
+        )
+
+    @classmethod
+    def from_pandas(
+        cls,
+        data_frame: pandas.DataFrame,
+        identifier: str,
+        description: str,
+        authors: List[Author],
+    ) -> "ColumnarDataSet":
+        """Creates a columnar data set from a data frame in the format produced by
+        ``DataSet.to_pandas``.
+
+        The property and uncertainty headers are parsed once for the whole frame, and
+        the per-component columns are reshaped using array operations rather than
+        row by row.
+
+        Parameters
+        ----------
+        data_frame
+            The data frame to convert.
+        identifier
+            The unique identifier associated with the set.
+        description
+            A description of why and how this set was chosen.
+        authors
+            The authors who prepared the set.
+
+        Raises
+        ------
+        ValueError
+            If any row of the frame does not describe a valid ``DataSetEntry``.
+        """
+
+        from nonbonded.library.models.datasets import DataSetEntry
+
+        n_rows = len(data_frame)
+        row_indices = numpy.arange(n_rows)
+
+        if n_rows == 0:
+            return cls.from_entries([], identifier, description, authors)
+
+        property_headers = [
+            header for header in data_frame if header.find(" Value ") >= 0
+        ]
+
+        if len(property_headers) == 0:
+            raise ValueError("The data frame does not contain any property values.")
+
+        # Each row stores its value in the first property column which it defines.
+        property_values = data_frame[property_headers].to_numpy(dtype=numpy.float64)
+        has_property = ~numpy.isnan(property_values)
+
+        if not numpy.all(has_property.any(axis=1)):
+            raise ValueError("One or more rows do not contain a property value.")
+
+        header_indices = has_property.argmax(axis=1)
+
+        uncertainty_values = numpy.column_stack(
+            [
+                data_frame[header.replace("Value", "Uncertainty")].to_numpy(
+                    dtype=numpy.float64
+                )
+                if header.replace("Value", "Uncertainty") in data_frame
+                else numpy.full(n_rows, numpy.nan)
+                for header in property_headers
+            ]
+        )
+
+        property_types = numpy.array(
+            [header.split(" ")[0] for header in property_headers], dtype=object
+        )[header_indices]
+
+        if not {*property_types}.issubset(DataSetEntry.default_units()):
+            raise ValueError("One or more rows contain an unsupported property type.")
+
+        ids = (
+            [_parse_id(value) for value in data_frame["Id"]]
+            if "Id" in data_frame
+            else [None] * n_rows
+        )
+
+        temperatures = data_frame["Temperature (K)"].to_numpy(dtype=numpy.float64)
+        pressures = data_frame["Pressure (kPa)"].to_numpy(dtype=numpy.float64)
+
+        if not numpy.all(temperatures > 0.0) or not numpy.all(pressures > 0.0):
+            raise ValueError("The temperatures and pressures must be positive.")
+
+        phases = data_frame["Phase"].to_numpy(dtype=object)
+        dois = data_frame["Source"].to_numpy(dtype=object)
+
+        n_components = data_frame["N Components"].to_numpy(dtype=numpy.float64)
+
+        if not numpy.all(n_components >= 1) or not numpy.all(
+            numpy.mod(n_components, 1) == 0
+        ):
+            raise ValueError("Each row must contain at least one component.")
+
+        n_components = n_components.astype(numpy.int64)
+        max_components = n_components.max()
+
+        def component_columns(header: str, dtype, default) -> numpy.ndarray:
+            """Stacks the ``header i`` columns into a (n_rows, max_components)
+            array, filling missing values with ``default``."""
+
+            columns = numpy.full((n_rows, max_components), default, dtype=dtype)
+
+            for i in range(max_components):
+
+                if f"{header} {i + 1}" not in data_frame:
+                    continue
+
+                column = data_frame[f"{header} {i + 1}"]
+                columns[:, i] = column.where(column.notna(), default).to_numpy(
+                    dtype=dtype
+                )
+
+            return columns
+
+        # Flatten the component columns row-major, which keeps the components of each
+        # entry contiguous and in order.
+        has_component = numpy.arange(max_components) < n_components[:, None]
+
+        component_smiles = component_columns("Component", object, None)[has_component]
+        component_roles = component_columns("Role", object, None)[has_component]
+        mole_fractions = component_columns("Mole Fraction", numpy.float64, 0.0)[
+            has_component
+        ]
+        exact_amounts = component_columns("Exact Amount", numpy.float64, 0.0)[
+            has_component
+        ]
+
+        for name, values in [
+            ("phases", phases),
+            ("sources", dois),
+            ("component smiles", component_smiles),
+            ("component roles", component_roles),
+        ]:
+
+            if not all(isinstance(value, str) and len(value) > 0 for value in values):
+                raise ValueError(f"The {name} must be non-empty strings.")
+
+        return cls(
+            identifier=identifier,
+            description=description,
+            authors=authors,
+            ids=[-1 if value is None else value for value in ids],
+            has_id=[value is not None for value in ids],
+            property_types=property_types,
+            temperatures=temperatures,
+            pressures=pressures,
+            phases=phases,
+            values=property_values[row_indices, header_indices],
+            std_errors=uncertainty_values[row_indices, header_indices],
+            dois=dois,
+            component_offsets=numpy.concatenate([[0], numpy.cumsum(n_components)]),
+            component_smiles=component_smiles,
+            component_mole_fractions=mole_fractions,
+            component_exact_amounts=exact_amounts.astype(numpy.int64),
+            component_roles=component_roles,
+        )
+
+    def iter_entries(self) -> Iterator["DataSetEntry"]:
+        """Iterates over the entries in this set as ``DataSetEntry`` objects.
+
+        Notes
+        -----
+        * The entries are built using the trusted ``construct`` path and so are
+          not re-validated.
+        """
+
+        from nonbonded.library.models.datasets import Component, DataSetEntry
+
+        offsets = self.component_offsets.tolist()
+
+        components = [
+            Component.construct(
+                smiles=smiles,
+                mole_fraction=mole_fraction,
+                exact_amount=exact_amount,
+                role=role,
+            )
+            for smiles, mole_fraction, exact_amount, role in zip(
+                numpy.asarray(self.component_smiles).tolist(),
+                self.component_mole_fractions.tolist(),
+                self.component_exact_amounts.tolist(),
+                numpy.asarray(self.component_roles).tolist(),
+            )
+        ]
+
+        entry_columns = zip(
+            self.ids.tolist(),
+            self.has_id.tolist(),
+            numpy.asarray(self.property_types).tolist(),
+            self.temperatures.tolist(),
+            self.pressures.tolist(),
+            numpy.asarray(self.phases).tolist(),
+            self.values.tolist(),
+            self.std_errors.tolist(),
+            numpy.asarray(self.dois).tolist(),
+        )
+
+        for index, (
+            entry_id,
+            has_id,
+            property_type,
+            temperature,
+            pressure,
+            phase,
+            value,
+            std_error,
+            doi,
+        ) in enumerate(entry_columns):
+
+            yield DataSetEntry.construct(
+                id=entry_id if has_id else None,
+                property_type=property_type,
+                temperature=temperature,
+                pressure=pressure,
+                phase=phase,
+                value=value,
+                std_error=None if numpy.isnan(std_error) else std_error,
+                doi=doi,
+                components=components[offsets[index] : offsets[index + 1]],
+            )
+
+    def to_data_set(self, validate: bool = False) -> "DataSet":
+        """Converts this set into a ``DataSet``.
+
+        Parameters
+        ----------
+        validate
+            Whether to validate the created entries. By default the entries are
+            assumed to be valid, as is the case when this set was itself created
+            from a ``DataSet``.
+        """
+
+        from nonbonded.library.models.datasets import DataSet
+
+        entries = [*self.iter_entries()]
+
+        if validate:
+
+            return DataSet(
+                id=self.id,
+                description=self.description,
+                authors=self.authors,
+                entries=[entry.dict() for entry in entries],
+            )
+
+        return DataSet.construct(
+            id=self.id,
+            description=self.description,
+            authors=self.authors,
+            entries=entries,
+        )
+
+    def to_pandas(self) -> pandas.DataFrame:
+        """Converts this set into a data frame with the same rows, columns and
+        column order as would be produced by building a ``pandas.Series`` from each
+        entry using ``DataSetEntry.to_series``.
+
+        Each property type is converted to its export unit using a single factor, and
+        the frame is built column-wise.
+        """
+
+        from nonbonded.library.models.datasets import pandas_unit_conversion
+
+        n_entries = len(self)
+
+        if n_entries == 0:
+            return pandas.DataFrame()
+
+        n_components = self.n_components
+        property_codes = self.property_types.codes
+
+        columns = {
+            "Id": [
+                entry_id if has_id else None
+                for entry_id, has_id in zip(self.ids.tolist(), self.has_id.tolist())
+            ],
+            "Temperature (K)": self.temperatures,
+            "Pressure (kPa)": self.pressures,
+            "Phase": numpy.asarray(self.phases, dtype=object),
+            "N Components": n_components,
+        }
+
+        # The order in which a value column or the columns of the i'th component
+        # first appear, as sorted by the index of the first entry which defines them.
+        column_groups = []
+
+        for code, property_type in enumerate(self.property_types.categories):
+
+            is_property = property_codes == code
+
+            if not numpy.any(is_property):
+                continue
+
+            expected_unit, conversion_factor = pandas_unit_conversion(property_type)
+
+            values = numpy.where(
+                is_property, self.values * conversion_factor, numpy.nan
+            )
+            std_errors = numpy.full(n_entries, numpy.nan, dtype=object)
+            std_errors[is_property] = [
+                None if numpy.isnan(std_error) else std_error
+                for std_error in (self.std_errors[is_property] * conversion_factor)
+            ]
+
+            column_groups.append(
+                (
+                    int(numpy.argmax(is_property)),
+                    0,
+                    {
+                        f"{property_type} Value ({expected_unit})": values,
+                        f"{property_type} Uncertainty ({expected_unit})": std_errors,
+                    },
+                )
+            )
+
+        for index in range(n_components.max()):
+
+            has_component = n_components > index
+
+            exact_amounts = numpy.full(n_entries, numpy.nan, dtype=object)
+            exact_amounts[has_component] = self.component_exact_amounts[
+                self.component_offsets[:-1][has_component] + index
+            ].tolist()
+
+            mole_fractions = self.component_column(self.component_mole_fractions, index)
+            mole_fractions[~has_component] = numpy.nan
+
+            column_groups.append(
+                (
+                    int(numpy.argmax(has_component)),
+                    1 + index,
+                    {
+                        f"Component {index + 1}": self.component_column(
+                            self.component_smiles, index
+                        ),
+                        f"Mole Fraction {index + 1}": mole_fractions,
+                        f"Exact Amount {index + 1}": exact_amounts,
+                        f"Role {index + 1}": self.component_column(
+                            self.component_roles, index
+                        ),
+                    },
+                )
+            )
+
+        # The value columns of the first entry always form the first group, and are
+        # followed by its source column.
+        (_, _, first_columns), *column_groups = sorted(
+            column_groups, key=lambda group: group[:2]
+        )
+
+        columns.update(first_columns)
+        columns["Source"] = numpy.asarray(self.dois, dtype=object)
+
+        for _, _, group_columns in column_groups:
+            columns.update(group_columns)
+
+        # Object columns are passed as lists so that pandas infers their type in the
+        # same way as it would for a frame built from a list of series.
+        return pandas.DataFrame(
+            {
+                header: column.tolist()
+                if isinstance(column, numpy.ndarray) and column.dtype == object
+                else column
+                for header, column in columns.items()
+            }
+        )
+
+    def select(
+        self, selection: Union[numpy.ndarray, List[int], slice]
+    ) -> "ColumnarDataSet":
+        """Returns a new set which contains only a subset of the entries in this set.
+
+        Parameters
+        ----------
+        selection
+            Either a boolean mask with one value per entry, or the indices of the
+            entries to retain.
+        """
+
+        entry_indices = numpy.arange(len(self))[selection]
+
+        n_components = self.n_components[entry_indices]
+        component_indices = (
+            numpy.repeat(self.component_offsets[entry_indices], n_components)
+            + numpy.arange(n_components.sum())
+            - numpy.repeat(numpy.cumsum(n_components) - n_components, n_components)
+        )
+
+        return ColumnarDataSet(
+            identifier=self.id,
+            description=self.description,
+            authors=self.authors,
+            ids=self.ids[entry_indices],
+            has_id=self.has_id[entry_indices],
+            property_types=self.property_types[entry_indices],
+            temperatures=self.temperatures[entry_indices],
+            pressures=self.pressures[entry_indices],
+            phases=self.phases[entry_indices],
+            values=self.values[entry_indices],
+            std_errors=self.std_errors[entry_indices],
+            dois=self.dois[entry_indices],
+            component_offsets=numpy.concatenate([[0], numpy.cumsum(n_components)]),
+            component_smiles=self.component_smiles[component_indices],
+            component_mole_fractions=self.component_mole_fractions[component_indices],
+            component_exact_amounts=self.component_exact_amounts[component_indices],
+            component_roles=self.component_roles[component_indices],
+        )
+
+    def component_column(
+        self, values: Union[numpy.ndarray, pandas.Categorical], index: int
+    ) -> numpy.ndarray:
+        """Returns the value of a component attribute for the ``index``'th component
+        of each entry, or ``None`` where an entry has fewer components.
+
+        Parameters
+        ----------
+        values
+            One of the component columns of this set, e.g. ``component_smiles``.
+        index
+            The (zero based) index of the component to retrieve.
+        """
+
+        values = numpy.asarray(values)
+
+        column = numpy.full(len(self), None, dtype=object)
+        has_component = self.n_components > index
+
+        column[has_component] = values[
+            self.component_offsets[:-1][has_component] + index
+        ]
+
+        return column
@@ -1,9 +1,10 @@
 import abc
-from typing import TYPE_CHECKING, Dict, List, Optional, Type
+import functools
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Type
 
 import pandas
-import requests
-from pydantic import Field, conlist, validator
+from pydantic import Field, PrivateAttr, conlist, validator
 from typing_extensions import Literal
 
 from nonbonded.library.config import settings
@@ -19,6 +20,9 @@ from nonbonded.library.utilities.exceptions import (
 if TYPE_CHECKING:
     from openff.evaluator.datasets import PhysicalProperty, PhysicalPropertyDataSet
 
+    from nonbonded.library.models.columnar import ColumnarDataSet
+    from nonbonded.library.models.index import DataSetIndex, DataSetView
+
     PositiveFloat = float
 
 else:
@@ -169,13 +173,10 @@ class DataSetEntry(BaseORM):
 
     def to_series(self) -> "pandas.Series":
 
-        from openff.evaluator import properties, unit
-
-        expected_unit = getattr(properties, self.property_type).default_unit()
-        internal_unit = unit.Unit(self.units)
+        expected_unit, conversion_factor = pandas_unit_conversion(self.property_type)
 
-        value_header = f"{self.property_type} Value ({expected_unit:~})"
-        std_error_header = f"{self.property_type} Uncertainty ({expected_unit:~})"
+        value_header = f"{self.property_type} Value ({expected_unit})"
+        std_error_header = f"{self.property_type} Uncertainty ({expected_unit})"
 
         data_row = {
             "Id": self.id,
@@ -183,11 +184,11 @@ class DataSetEntry(BaseORM):
             "Pressure (kPa)": self.pressure,
             "Phase": self.phase,
             "N Components": len(self.components),
-            value_header: (self.value * internal_unit).to(expected_unit).magnitude,
+            value_header: self.value * conversion_factor,
             std_error_header: (
                 self.std_error
                 if self.std_error is None
-                else (self.std_error * internal_unit).to(expected_unit).magnitude
+                else self.std_error * conversion_factor
             ),
             "Source": self.doi,
         }
@@ -206,27 +207,103 @@ class DataSetEntry(BaseORM):
         return pandas.Series(data_row)
 
     def to_evaluator(self) -> "PhysicalProperty":
+        return _EvaluatorPropertyBuilder().build(self)
 
-        from openff.evaluator import properties, substances, unit
-        from openff.evaluator.attributes import UNDEFINED
-        from openff.evaluator.datasets import MeasurementSource, PropertyPhase
-        from openff.evaluator.thermodynamics import ThermodynamicState
 
-        if not hasattr(properties, self.property_type):
-            raise UnrecognisedPropertyType(self.property_type)
+# The units (and conversion factors from the internal units) which values of each
+# property type are exported to pandas in when `openff-evaluator` is not available.
+_DEFAULT_PANDAS_UNITS = {
+    property_type: (property_unit, 1.0)
+    for property_type, property_unit in DataSetEntry.default_units().items()
+}
+
+
+@functools.lru_cache()
+def pandas_unit_conversion(property_type: str) -> Tuple[str, float]:
+    """Returns the unit which values of a given property type are stored in when
+    exported to a pandas data frame, and the factor which converts a value from the
+    internal unit of the property type to that unit.
+
+    The unit is the ``default_unit`` of the matching ``openff.evaluator`` property
+    class when that package is available, and otherwise the internal unit.
+
+    Parameters
+    ----------
+    property_type
+        The type of property.
+
+    Returns
+    -------
+        The abbreviated export unit and the conversion factor.
+    """
+
+    try:
+        from openff.evaluator import properties, unit
+    except ImportError:
+        return _DEFAULT_PANDAS_UNITS[property_type]
+
+    expected_unit = getattr(properties, property_type).default_unit()
+    internal_unit = unit.Unit(DataSetEntry.default_units()[property_type])
+
+    conversion_factor = (1.0 * internal_unit).to(expected_unit).magnitude
+
+    return f"{expected_unit:~}", float(conversion_factor)
+
+
+class _EvaluatorPropertyBuilder:
+    """Builds ``openff-evaluator`` physical properties from data set entries.
+
+    The substance, thermodynamic state, phase and source objects are built once for
+    each distinct value and are then shared between all of the properties which
+    reference them.
+    """
+
+    def __init__(self):
+
+        self._property_classes: Dict[str, Type["PhysicalProperty"]] = {}
+        self._internal_units = {}
+
+        self._substances = {}
+        self._states = {}
+        self._phases = {}
+        self._sources = {}
+
+    def _property_class(self, property_type: str) -> Type["PhysicalProperty"]:
+
+        from openff.evaluator import properties, unit
+
+        if property_type not in self._property_classes:
+
+            if not hasattr(properties, property_type):
+                raise UnrecognisedPropertyType(property_type)
+
+            self._property_classes[property_type] = getattr(properties, property_type)
+            self._internal_units[property_type] = unit.Unit(
+                DataSetEntry.default_units()[property_type]
+            )
 
-        property_class: Type[PhysicalProperty] = getattr(properties, self.property_type)
+        return self._property_classes[property_type]
 
-        thermodynamic_state = ThermodynamicState(
-            temperature=self.temperature * unit.kelvin,
-            pressure=self.pressure * unit.kilopascal,
+    def _substance(self, components: List[Component]):
+
+        from openff.evaluator import substances
+
+        substance_key = tuple(
+            (
+                component.smiles,
+                component.role,
+                component.mole_fraction,
+                component.exact_amount,
+            )
+            for component in components
         )
 
-        phase = PropertyPhase.from_string(self.phase)
+        if substance_key in self._substances:
+            return self._substances[substance_key]
 
         substance = substances.Substance()
 
-        for component in self.components:
+        for component in components:
 
             off_component = substances.Component(
                 smiles=component.smiles, role=substances.Component.Role[component.role]
@@ -242,22 +319,143 @@ class DataSetEntry(BaseORM):
                 exact_amount = substances.ExactAmount(component.exact_amount)
                 substance.add_component(off_component, exact_amount)
 
-        internal_unit = unit.Unit(self.units)
+        self._substances[substance_key] = substance
+        return substance
+
+    def _state(self, temperature: float, pressure: float):
+
+        from openff.evaluator import unit
+        from openff.evaluator.thermodynamics import ThermodynamicState
+
+        if (temperature, pressure) not in self._states:
+
+            self._states[(temperature, pressure)] = ThermodynamicState(
+                temperature=temperature * unit.kelvin,
+                pressure=pressure * unit.kilopascal,
+            )
+
+        return self._states[(temperature, pressure)]
+
+    def _phase(self, phase: str):
+
+        from openff.evaluator.datasets import PropertyPhase
+
+        if phase not in self._phases:
+            self._phases[phase] = PropertyPhase.from_string(phase)
+
+        return self._phases[phase]
+
+    def _source(self, doi: str):
+
+        from openff.evaluator.datasets import MeasurementSource
+
+        if doi not in self._sources:
+            self._sources[doi] = MeasurementSource(doi=doi)
+
+        return self._sources[doi]
+
+    def build(self, entry: DataSetEntry) -> "PhysicalProperty":
+        """Builds the physical property which corresponds to a data set entry."""
+
+        from openff.evaluator.attributes import UNDEFINED
+
+        property_class = self._property_class(entry.property_type)
+        internal_unit = self._internal_units[entry.property_type]
 
         physical_property = property_class(
-            thermodynamic_state=thermodynamic_state,
-            phase=phase,
-            substance=substance,
-            value=self.value * internal_unit,
+            thermodynamic_state=self._state(entry.temperature, entry.pressure),
+            phase=self._phase(entry.phase),
+            substance=self._substance(entry.components),
+            value=entry.value * internal_unit,
             uncertainty=UNDEFINED
-            if self.std_error is None
-            else self.std_error * internal_unit,
-            source=MeasurementSource(doi=self.doi),
+            if entry.std_error is None
+            else entry.std_error * internal_unit,
+            source=self._source(entry.doi),
         )
-        physical_property.id = str(self.id)
+        physical_property.id = str(entry.id)
 
         return physical_property
 
+    def build_all(self, entries: List[DataSetEntry]) -> List["PhysicalProperty"]:
+        """Builds the physical properties which correspond to a list of entries."""
+        return [self.build(entry) for entry in entries]
+
+
+def _build_evaluator_properties(
+    entries: List[DataSetEntry],
+) -> List["PhysicalProperty"]:
+    """Builds the physical properties which correspond to a batch of entries. This
+    function is used by the worker processes of ``_entries_to_evaluator``."""
+    return _EvaluatorPropertyBuilder().build_all(entries)
+
+
+def _entries_to_evaluator(
+    entries: List[DataSetEntry], n_processes: int = 1, batch_size: int = 5000
+) -> "PhysicalPropertyDataSet":
+    """Converts a list of data set entries into an ``openff-evaluator`` data set.
+
+    Parameters
+    ----------
+    entries
+        The entries to convert.
+    n_processes
+        The number of processes to build the properties across. The substance and
+        state objects are only shared between the entries handled by the same
+        process.
+    batch_size
+        The number of entries to convert (and add to the data set) at once.
+    """
+
+    from openff.evaluator.datasets import PhysicalPropertyDataSet
+
+    evaluator_set = PhysicalPropertyDataSet()
+
+    batches = [
+        entries[batch_start : batch_start + batch_size]
+        for batch_start in range(0, len(entries), batch_size)
+    ]
+
+    if n_processes <= 1 or len(batches) <= 1:
+
+        builder = _EvaluatorPropertyBuilder()
+
+        for batch in batches:
+            evaluator_set.add_properties(*builder.build_all(batch))
+
+    else:
+
+        with ProcessPoolExecutor(max_workers=n_processes) as executor:
+
+            for physical_properties in executor.map(
+                _build_evaluator_properties, batches
+            ):
+                evaluator_set.add_properties(*physical_properties)
+
+    return evaluator_set
+
+
+def _is_index_current(
+    indexed_entries: Optional[List[Tuple[List[DataSetEntry], int]]],
+    entries: List[List[DataSetEntry]],
+) -> bool:
+    """Returns whether each of a set of lists of entries is the same list, and has
+    the same length, as the list which was indexed in its place.
+
+    The indexed lists are compared by identity. Because a reference to each indexed
+    list is retained, a new list can never be mistaken for one which was indexed.
+    """
+
+    return (
+        indexed_entries is not None
+        and len(indexed_entries) == len(entries)
+        and all(
+            indexed_list is entries_list and indexed_length == len(entries_list)
+            for (indexed_list, indexed_length), entries_list in zip(
+                indexed_entries, entries
+            )
+        )
+    )
+
 
 class DataSet(_BaseSet):
     """A data set of physical property measurements which have been collected from
@@ -271,6 +469,30 @@ class DataSet(_BaseSet):
 
     entries: List[DataSetEntry] = Field(..., description="The entries in the data set.")
 
+    _index: Optional["DataSetIndex"] = PrivateAttr(None)
+    _indexed_entries: Optional[List[Tuple[List[DataSetEntry], int]]] = PrivateAttr(None)
+
+    @property
+    def index(self) -> "DataSetIndex":
+        """A lazily built index over the entries in this set. The index is rebuilt
+        whenever the list of entries is replaced or changes length."""
+
+        from nonbonded.library.models.index import DataSetIndex
+
+        if self._index is None or not _is_index_current(
+            self._indexed_entries, [self.entries]
+        ):
+
+            self._index = DataSetIndex([*self.entries])
+            self._indexed_entries = [(self.entries, len(self.entries))]
+
+        return self._index
+
+    def filter(self, **kwargs) -> "DataSetView":
+        """Returns a view over the entries in this set which match a set of filters.
+        See ``DataSetIndex.filter`` for the supported filters."""
+        return self.index.filter(**kwargs)
+
     @classmethod
     def from_pandas(
         cls,
@@ -298,32 +520,50 @@ class DataSet(_BaseSet):
         for property_type, property_unit in property_units.items():
             assert internal_units[property_type] == property_unit
 
+        from nonbonded.library.models.columnar import ColumnarDataSet
+
         data_set = cls(
-            id=identifier,
-            description=description,
-            authors=authors,
-            entries=[DataSetEntry.from_series(row) for _, row in data_frame.iterrows()],
+            id=identifier, description=description, authors=authors, entries=[]
         )
 
-        return data_set
+        try:
 
-    def to_pandas(self) -> pandas.DataFrame:
+            columnar_set = ColumnarDataSet.from_pandas(
+                data_frame, identifier, description, authors
+            )
 
-        data_rows = [entry.to_series() for entry in self.entries]
-        data_frame = pandas.DataFrame(data_rows)
+        except (ValueError, TypeError):
 
-        return data_frame
+            # Fall back to parsing each row individually so that any invalid rows
+            # raise the same errors as they would when loaded as single entries.
+            data_set.entries = [
+                DataSetEntry.from_series(row) for _, row in data_frame.iterrows()
+            ]
+            return data_set
 
-    def to_evaluator(self) -> "PhysicalPropertyDataSet":
+        # The rows have already been validated in bulk.
+        data_set.entries = [*columnar_set.iter_entries()]
+        return data_set
+
+    def to_pandas(self) -> pandas.DataFrame:
+        return self.to_columnar().to_pandas()
 
-        from openff.evaluator.datasets import PhysicalPropertyDataSet
+    def to_columnar(self) -> "ColumnarDataSet":
+        """Converts this set into a columnar, array backed representation."""
 
-        physical_properties = [entry.to_evaluator() for entry in self.entries]
+        from nonbonded.library.models.columnar import ColumnarDataSet
 
-        evaluator_set = PhysicalPropertyDataSet()
-        evaluator_set.add_properties(*physical_properties)
+        return ColumnarDataSet.from_data_set(self)
 
-        return evaluator_set
+    def to_evaluator(self, n_processes: int = 1) -> "PhysicalPropertyDataSet":
+        """Converts this set into an ``openff-evaluator`` data set.
+
+        Parameters
+        ----------
+        n_processes
+            The number of processes to use when converting very large sets.
+        """
+        return _entries_to_evaluator(self.entries, n_processes)
 
     @classmethod
     def _get_endpoint(cls, *, data_set_id: str):
@@ -339,7 +579,7 @@ class DataSet(_BaseSet):
         return f"{settings.API_URL}/datasets/phys-prop/{self.id}"
 
     @classmethod
-    def from_rest(cls, *, data_set_id: str, requests_class=requests) -> "DataSet":
+    def from_rest(cls, *, data_set_id: str, requests_class=None) -> "DataSet":
         # noinspection PyTypeChecker
         return super(DataSet, cls).from_rest(
             data_set_id=data_set_id, requests_class=requests_class
@@ -354,26 +594,56 @@ class DataSetCollection(BaseRESTCollection):
         description="The stored collection of physical property data sets.",
     )
 
+    _index: Optional["DataSetIndex"] = PrivateAttr(None)
+    _indexed_entries: Optional[List[Tuple[List[DataSetEntry], int]]] = PrivateAttr(None)
+
     @validator("data_sets")
     def validate_entries(cls, value: List[DataSet]) -> List[DataSet]:
         assert len(value) == len({data_set.id for data_set in value})
         return value
 
+    @property
+    def index(self) -> "DataSetIndex":
+        """A lazily built index over the entries of every set in this collection. The
+        index is rebuilt whenever the list of entries of any set is replaced or
+        changes length."""
+
+        from nonbonded.library.models.index import DataSetIndex
+
+        entries = [data_set.entries for data_set in self.data_sets]
+
+        if self._index is None or not _is_index_current(self._indexed_entries, entries):
+
+            self._index = DataSetIndex(
+                [entry for entries_list in entries for entry in entries_list]
+            )
+            self._indexed_entries = [
+                (entries_list, len(entries_list)) for entries_list in entries
+            ]
+
+        return self._index
+
+    def filter(self, **kwargs) -> "DataSetView":
+        """Returns a view over the entries in this collection which match a set of
+        filters. See ``DataSetIndex.filter`` for the supported filters."""
+        return self.index.filter(**kwargs)
+
     @classmethod
     def _get_endpoint(cls, **kwargs):
         return f"{settings.API_URL}/datasets/phys-prop/"
 
-    def to_evaluator(self) -> "PhysicalPropertyDataSet":
+    def to_evaluator(self, n_processes: int = 1) -> "PhysicalPropertyDataSet":
+        """Converts the entries of all of the sets in this collection into a single
+        ``openff-evaluator`` data set.
 
-        from openff.evaluator.datasets import PhysicalPropertyDataSet
+        Parameters
+        ----------
+        n_processes
+            The number of processes to use when converting very large collections.
+        """
 
         entries = [entry for data_set in self.data_sets for entry in data_set.entries]
-        physical_properties = [entry.to_evaluator() for entry in entries]
-
-        evaluator_set = PhysicalPropertyDataSet()
-        evaluator_set.add_properties(*physical_properties)
-
-        return evaluator_set
+        return _entries_to_evaluator(entries, n_processes)
 
 
 class QCDataSet(_BaseSet):
@@ -411,7 +681,7 @@ class QCDataSet(_BaseSet):
         return f"{settings.API_URL}/datasets/qc/{self.id}"
 
     @classmethod
-    def from_rest(cls, *, qc_data_set_id: str, requests_class=requests) -> "QCDataSet":
+    def from_rest(cls, *, qc_data_set_id: str, requests_class=None) -> "QCDataSet":
         # noinspection PyTypeChecker
         return super(QCDataSet, cls).from_rest(
             qc_data_set_id=qc_data_set_id, requests_class=requests_class
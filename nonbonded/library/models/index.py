@@ -0,0 +1,295 @@
+"""An index over the entries of a data set (or collection of data sets) which allows
+entries to be looked up and filtered without scanning every entry."""
+import functools
+from collections import defaultdict
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    overload,
+)
+
+import numpy
+
+from nonbonded.library.utilities.molecules import canonical_smiles
+
+if TYPE_CHECKING:
+    from nonbonded.library.models.datasets import DataSetEntry
+
+
+class DataSetView(Sequence["DataSetEntry"]):
+    """A lightweight, read-only view over a subset of the entries of an indexed data
+    set. The view only stores the positions of the selected entries and so never
+    copies the entries themselves."""
+
+    def __init__(self, index: "DataSetIndex", positions: numpy.ndarray):
+        """
+
+        Parameters
+        ----------
+        index
+            The index of the data set being viewed.
+        positions
+            The (sorted) positions of the viewed entries in the indexed data set.
+        """
+
+        self._index = index
+        self.positions = positions
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    @overload
+    def __getitem__(self, item: int) -> "DataSetEntry":
+        ...
+
+    @overload
+    def __getitem__(self, item: slice) -> "DataSetView":
+        ...
+
+    def __getitem__(self, item):
+
+        if isinstance(item, slice):
+            return DataSetView(self._index, self.positions[item])
+
+        return self._index.entries[self.positions[item]]
+
+    def __iter__(self) -> Iterator["DataSetEntry"]:
+
+        entries = self._index.entries
+        return (entries[position] for position in self.positions.tolist())
+
+    @property
+    def ids(self) -> List[Optional[int]]:
+        """The ids of the viewed entries."""
+        return [entry.id for entry in self]
+
+    def filter(self, **kwargs) -> "DataSetView":
+        """Further filters the entries in this view. See ``DataSetIndex.filter`` for
+        the supported filters."""
+        return self._index.filter(_positions=self.positions, **kwargs)
+
+
+class DataSetIndex:
+    """A lazily built index over a list of data set entries.
+
+    Each of the lookup tables (entries by id, by property type and number of
+    components, and by the canonical smiles of their components, as well as sorted
+    temperature and pressure arrays for range queries) is only built the first time
+    that it is needed.
+
+    Notes
+    -----
+    * The index does not track changes made to the entries after it was created.
+    """
+
+    def __init__(self, entries: List["DataSetEntry"]):
+        """
+
+        Parameters
+        ----------
+        entries
+            The entries to index.
+        """
+
+        self.entries = entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @functools.cached_property
+    def entries_by_id(self) -> Dict[int, "DataSetEntry"]:
+        """The indexed entries stored by their unique id. Entries without an id are
+        not included."""
+        return {entry.id: entry for entry in self.entries if entry.id is not None}
+
+    @functools.cached_property
+    def _positions_by_id(self) -> Dict[int, int]:
+
+        return {
+            entry.id: position
+            for position, entry in enumerate(self.entries)
+            if entry.id is not None
+        }
+
+    @functools.cached_property
+    def _positions_by_type(self) -> Dict[Tuple[str, int], numpy.ndarray]:
+
+        positions = defaultdict(list)
+
+        for position, entry in enumerate(self.entries):
+            positions[(entry.property_type, len(entry.components))].append(position)
+
+        return {key: numpy.array(value) for key, value in positions.items()}
+
+    @functools.cached_property
+    def _positions_by_smiles(self) -> Dict[str, numpy.ndarray]:
+
+        positions = defaultdict(set)
+
+        for position, entry in enumerate(self.entries):
+
+            for component in entry.components:
+                positions[canonical_smiles(component.smiles)].add(position)
+
+        return {key: numpy.array(sorted(value)) for key, value in positions.items()}
+
+    @functools.cached_property
+    def _temperatures(self) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        return self._sorted_values([entry.temperature for entry in self.entries])
+
+    @functools.cached_property
+    def _pressures(self) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        return self._sorted_values([entry.pressure for entry in self.entries])
+
+    @staticmethod
+    def _sorted_values(values: List[float]) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        """Returns a set of values in ascending order, and the positions of the
+        entries which they correspond to."""
+
+        values = numpy.array(values, dtype=float)
+        order = numpy.argsort(values, kind="stable")
+
+        return values[order], order
+
+    @staticmethod
+    def _range_positions(
+        sorted_values: Tuple[numpy.ndarray, numpy.ndarray],
+        value_range: Tuple[Optional[float], Optional[float]],
+    ) -> numpy.ndarray:
+        """Returns the positions of the entries whose value lies within an
+        (inclusive) range, where either bound may be ``None``."""
+
+        values, order = sorted_values
+        lower, upper = value_range
+
+        start = 0 if lower is None else numpy.searchsorted(values, lower, "left")
+        end = (
+            len(values) if upper is None else numpy.searchsorted(values, upper, "right")
+        )
+
+        return numpy.sort(order[start:end])
+
+    def get(self, entry_id: int) -> Optional["DataSetEntry"]:
+        """Returns the entry with a given id, or ``None`` if there is no such entry."""
+        return self.entries_by_id.get(entry_id)
+
+    def filter(
+        self,
+        ids: Optional[Iterable[int]] = None,
+        property_type: Optional[Union[str, Iterable[str]]] = None,
+        n_components: Optional[int] = None,
+        smiles: Optional[Union[str, Iterable[str]]] = None,
+        temperature_range: Optional[Tuple[Optional[float], Optional[float]]] = None,
+        pressure_range: Optional[Tuple[Optional[float], Optional[float]]] = None,
+        _positions: Optional[numpy.ndarray] = None,
+    ) -> DataSetView:
+        """Returns a view over the entries which match all of a set of filters.
+
+        Parameters
+        ----------
+        ids
+            The ids of the entries to retain. Ids which do not match an entry are
+            ignored.
+        property_type
+            The type(s) of property to retain.
+        n_components
+            The number of components which retained entries must have.
+        smiles
+            The smiles pattern(s) of components which retained entries must contain.
+            When multiple patterns are provided, entries which contain any of the
+            components are retained. Patterns are compared in their canonical form.
+        temperature_range
+            The (inclusive) lower and upper temperatures (K) of the entries to retain.
+            Either bound may be ``None``.
+        pressure_range
+            The (inclusive) lower and upper pressures (kPa) of the entries to retain.
+            Either bound may be ``None``.
+
+        Returns
+        -------
+            A view over the entries, in the order that they appear in the index.
+        """
+
+        selected = numpy.arange(len(self.entries)) if _positions is None else _positions
+
+        def intersect(positions: numpy.ndarray):
+            return numpy.intersect1d(selected, positions, assume_unique=True)
+
+        if ids is not None:
+
+            selected = intersect(
+                numpy.array(
+                    [
+                        self._positions_by_id[entry_id]
+                        for entry_id in {*ids}
+                        if entry_id in self._positions_by_id
+                    ],
+                    dtype=int,
+                )
+            )
+
+        if property_type is not None or n_components is not None:
+
+            property_types = (
+                None
+                if property_type is None
+                else {property_type}
+                if isinstance(property_type, str)
+                else {*property_type}
+            )
+
+            selected = intersect(
+                numpy.concatenate(
+                    [
+                        numpy.empty(0, dtype=int),
+                        *(
+                            positions
+                            for (
+                                entry_type,
+                                entry_n_components,
+                            ), positions in self._positions_by_type.items()
+                            if (property_types is None or entry_type in property_types)
+                            and (
+                                n_components is None
+                                or entry_n_components == n_components
+                            )
+                        ),
+                    ]
+                )
+            )
+
+        if smiles is not None:
+
+            smiles = [smiles] if isinstance(smiles, str) else [*smiles]
+
+            selected = intersect(
+                numpy.unique(
+                    numpy.concatenate(
+                        [
+                            numpy.empty(0, dtype=int),
+                            *(
+                                self._positions_by_smiles.get(
+                                    canonical_smiles(pattern), numpy.empty(0, dtype=int)
+                                )
+                                for pattern in smiles
+                            ),
+                        ]
+                    )
+                )
+            )
+
+        if temperature_range is not None:
+            selected = intersect(
+                self._range_positions(self._temperatures, temperature_range)
+            )
+        if pressure_range is not None:
+            selected = intersect(self._range_positions(self._pressures, pressure_range))
+
+        return DataSetView(self, numpy.sort(selected))
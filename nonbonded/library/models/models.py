@@ -1,6 +1,8 @@
 import abc
 import logging
-from typing import Callable, Optional, Type, TypeVar
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Iterator, List, Optional, Type, TypeVar
+from urllib.parse import urlencode
 
 import requests
 from pydantic import Field
@@ -8,9 +10,69 @@ from pydantic.main import BaseModel
 
 from nonbonded.library.config import settings
 
+if TYPE_CHECKING:
+    from nonbonded.library.utilities.serialization import SerializationFormat
+
+S = TypeVar("S", bound="BaseORM")
 T = TypeVar("T", bound="BaseREST")
 
 
+def _resolve_requests_class(requests_class=None):
+    """Returns the object (e.g. the ``requests`` module or a ``requests.Session``)
+    which should be used to make requests to the RESTful API, defaulting to the
+    shared, connection pooled session when none is provided."""
+
+    if requests_class is not None:
+        return requests_class
+
+    from nonbonded.library.utilities.session import get_session
+
+    return get_session()
+
+
+def _get_text(requests_class, url: str, params: Optional[dict] = None) -> str:
+    """Retrieves the body of a GET request to the RESTful API.
+
+    Responses which the API assigned an ETag to are stored in the local response
+    cache, and are revalidated using a conditional request (rather than being
+    downloaded again in full) whenever the same URL is requested again. The cache
+    is disabled when the ``RESPONSE_CACHE_SIZE`` setting is zero.
+    """
+
+    from nonbonded.library.utilities.cache import ResponseCache
+
+    cache = ResponseCache.default() if settings.RESPONSE_CACHE_SIZE > 0 else None
+    cached_response = None
+
+    if cache is not None:
+
+        # The key is built without preparing a request so that relative API URLs
+        # (e.g. those used when testing) are also supported.
+        cache_key = url if not params else f"{url}?{urlencode(params, doseq=True)}"
+        cached_response = cache.get(cache_key)
+
+    headers = {} if cached_response is None else {"If-None-Match": cached_response[0]}
+    request = requests_class.get(url, params=params, headers=headers)
+
+    if cached_response is not None and request.status_code == 304:
+        return cached_response[1]
+
+    try:
+        request.raise_for_status()
+    except requests.exceptions.HTTPError as error:
+        logging.exception(error.response.text)
+        raise
+    except Exception:  # pragma: no cover
+        raise
+
+    etag = request.headers.get("ETag")
+
+    if cache is not None and etag is not None:
+        cache.set(cache_key, etag, request.text)
+
+    return request.text
+
+
 class CollectionMeta(BaseModel):
     """A data model which stores metadata about a retrieved collection, such as
     pagination information."""
@@ -27,18 +89,46 @@ class BaseORM(BaseModel, abc.ABC):
     class Config:
         orm_mode = True
 
-    def to_file(self, file_path: str):
-        """JSON serializes this object and saves the output to the specified
+    def to_file(
+        self,
+        file_path: str,
+        file_format: Optional["SerializationFormat"] = None,
+        compression: Optional[str] = None,
+    ):
+        """Serializes this object and saves the output to the specified
         file path.
 
         Parameters
         ----------
         file_path: str
-            The path to save the JSON serialized object to.
+            The path to save the serialized object to.
+        file_format
+            The format to save the object in. By default this is inferred from the
+            extension of the file path, falling back to JSON.
+        compression
+            The (optional) type of compression to apply to msgpack or Parquet files.
         """
 
-        with open(file_path, "w") as file:
-            file.write(self.json())
+        from nonbonded.library.utilities.serialization import save_model
+
+        save_model(self, file_path, file_format, compression)
+
+    @classmethod
+    def from_file(cls: Type[S], file_path: str) -> S:
+        """Loads an object which was saved using ``to_file``, automatically detecting
+        the format it was saved in.
+
+        Parameters
+        ----------
+        file_path: str
+            The path to the saved object. If this file does not exist, but one with
+            the same name and the extension of another supported format does, that
+            file will be loaded instead.
+        """
+
+        from nonbonded.library.utilities.serialization import load_model
+
+        return load_model(cls, file_path)
 
 
 class BaseREST(BaseORM, abc.ABC):
@@ -78,7 +168,7 @@ class BaseREST(BaseORM, abc.ABC):
         return_object = self.__class__.parse_raw(request.text)
         return return_object
 
-    def upload(self, requests_class=requests) -> T:
+    def upload(self, requests_class=None) -> T:
         """Attempt to upload this object to the RESTful API for the first time.
         This function should only be used for the initial upload. To update an
         existing instance, used the ``update`` function instead.
@@ -96,23 +186,26 @@ class BaseREST(BaseORM, abc.ABC):
         changed some of the ids. The returned object should **always** be used in
         place of the initial one.
         """
+        requests_class = _resolve_requests_class(requests_class)
         return self._upload(requests_class.post, self._post_endpoint())
 
-    def update(self, requests_class=requests) -> T:
+    def update(self, requests_class=None) -> T:
         """Attempt to update this object on the RESTful API. This function assumes
         that this object has already been uploaded using the ``upload`` function.
 
         An exception will be raised if this object has not already been uploaded.
         """
+        requests_class = _resolve_requests_class(requests_class)
         return self._upload(requests_class.put, self._put_endpoint())
 
-    def delete(self, requests_class=requests):
+    def delete(self, requests_class=None):
         """Attempt to delete this object on the RESTful API. This function assumes
         that this object has already been uploaded using the ``upload`` function.
 
         An exception will be raised if this object has not already been uploaded.
         """
 
+        requests_class = _resolve_requests_class(requests_class)
         request = requests_class.delete(
             url=self._delete_endpoint(), headers={"access_token": settings.ACCESS_TOKEN}
         )
@@ -129,18 +222,8 @@ class BaseREST(BaseORM, abc.ABC):
         """Attempts to retrieve an instance of this object from the RESTful API
         based on its unique identifier(s)
         """
-        requests_class = kwargs.pop("requests_class", requests)
-        request = requests_class.get(cls._get_endpoint(**kwargs))
-
-        try:
-            request.raise_for_status()
-        except requests.exceptions.HTTPError as error:
-            logging.exception(error.response.text)
-            raise
-        except Exception:  # pragma: no cover
-            raise
-
-        return cls.parse_raw(request.text)
+        requests_class = _resolve_requests_class(kwargs.pop("requests_class", None))
+        return cls.parse_raw(_get_text(requests_class, cls._get_endpoint(**kwargs)))
 
 
 class BaseRESTCollection(BaseORM, abc.ABC):
@@ -160,16 +243,89 @@ class BaseRESTCollection(BaseORM, abc.ABC):
     def from_rest(cls: Type[T], **kwargs) -> T:
         """Attempts to retrieve an instance of this object from the RESTful API
         based on its unique identifier(s)
+
+        Notes
+        -----
+        * Only the first page of the collection, as defined by the RESTful API, is
+          retrieved. Use ``iter_rest`` to retrieve the full collection.
         """
-        requests_class = kwargs.pop("requests_class", requests)
-        request = requests_class.get(cls._get_endpoint(**kwargs))
+        requests_class = _resolve_requests_class(kwargs.pop("requests_class", None))
+        return cls._get_page(requests_class, None, **kwargs)
 
-        try:
-            request.raise_for_status()
-        except requests.exceptions.HTTPError as error:
-            logging.exception(error.response.text)
-            raise
-        except Exception:  # pragma: no cover
-            raise
+    @classmethod
+    def _get_page(cls: Type[T], requests_class, params: Optional[dict], **kwargs) -> T:
+        """Retrieves a single page of this collection from the RESTful API."""
+
+        return cls.parse_raw(
+            _get_text(requests_class, cls._get_endpoint(**kwargs), params)
+        )
+
+    def _items(self) -> List:
+        """The items stored in this collection."""
+
+        (field_name,) = [name for name in self.__fields__ if name != "metadata"]
+        return getattr(self, field_name)
+
+    @classmethod
+    def iter_rest(
+        cls: Type[T],
+        page_size: int = 100,
+        children: bool = True,
+        requests_class=None,
+        **kwargs,
+    ) -> Iterator[T]:
+        """Lazily retrieves the full contents of this collection from the RESTful
+        API one page at a time, retrieving the next page in the background while
+        the current one is being consumed.
+
+        Parameters
+        ----------
+        page_size
+            The maximum number of items to retrieve in each page.
+        children
+            Whether to retrieve the children of each item (e.g. the entries of a
+            data set) or only their top level fields.
+        requests_class
+            The object used to make the requests. Defaults to the shared session.
+        kwargs
+            The identifier(s) of the collection, e.g. the id of the project which
+            contains a collection of studies.
+
+        Returns
+        -------
+            An iterator over the pages of the collection, each stored in a
+            collection object.
+        """
+
+        assert page_size > 0, "the page size must be greater than zero"
+
+        requests_class = _resolve_requests_class(requests_class)
+
+        def get_page(skip: int) -> T:
+
+            params = {"skip": skip, "limit": page_size, "children": children}
+            return cls._get_page(requests_class, params, **kwargs)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+
+            skip = 0
+            next_page = executor.submit(get_page, skip)
+
+            while next_page is not None:
+
+                page = next_page.result()
+                n_items = len(page._items())
+
+                skip += n_items
+
+                # Collections retrieved from APIs which do not support pagination
+                # will not include any metadata and so are returned in full.
+                next_page = (
+                    executor.submit(get_page, skip)
+                    if page.metadata is not None
+                    and n_items > 0
+                    and skip < page.metadata.total_records
+                    else None
+                )
 
-        return cls.parse_raw(request.text)
+                yield page
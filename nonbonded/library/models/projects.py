@@ -3,7 +3,6 @@
 import abc
 from typing import TYPE_CHECKING, List, Optional, Union
 
-import requests
 from pydantic import Field, conlist, root_validator, validator
 from typing_extensions import Literal
 
@@ -210,7 +209,7 @@ class Optimization(SubStudy):
         project_id: str,
         study_id: str,
         sub_study_id: str,
-        requests_class=requests,
+        requests_class=None,
     ) -> "Optimization":
         # noinspection PyTypeChecker
         return super(Optimization, cls).from_rest(
@@ -293,7 +292,7 @@ class Benchmark(SubStudy):
         project_id: str,
         study_id: str,
         sub_study_id: str,
-        requests_class=requests,
+        requests_class=None,
     ) -> "Benchmark":
         # noinspection PyTypeChecker
         return super(Benchmark, cls).from_rest(
@@ -383,7 +382,7 @@ class Study(BaseREST):
 
     @classmethod
     def from_rest(
-        cls, *, project_id: str, study_id: str, requests_class=requests
+        cls, *, project_id: str, study_id: str, requests_class=None
     ) -> "Study":
 
         # noinspection PyTypeChecker
@@ -459,7 +458,7 @@ class Project(BaseREST):
         return f"{settings.API_URL}/projects/{self.id}"
 
     @classmethod
-    def from_rest(cls, *, project_id: str, requests_class=requests) -> "Project":
+    def from_rest(cls, *, project_id: str, requests_class=None) -> "Project":
         # noinspection PyTypeChecker
         return super(Project, cls).from_rest(
             project_id=project_id, requests_class=requests_class
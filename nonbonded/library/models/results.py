@@ -3,7 +3,6 @@ import logging
 from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
 
 import pandas
-import requests
 from pydantic import Field, conint, validator
 from typing_extensions import Literal
 
@@ -12,8 +11,16 @@ from nonbonded.library.models import BaseORM, BaseREST
 from nonbonded.library.models.datasets import DataSet, DataSetCollection, DataSetEntry
 from nonbonded.library.models.forcefield import ForceField
 from nonbonded.library.models.validators.string import IdentifierStr, NonEmptyStr
-from nonbonded.library.statistics.statistics import StatisticType, compute_statistics
-from nonbonded.library.utilities.checkmol import components_to_categories
+from nonbonded.library.statistics.statistics import (
+    ConfidenceIntervalMethod,
+    RandomState,
+    StatisticType,
+    compute_grouped_statistics,
+)
+from nonbonded.library.utilities.checkmol import (
+    category_cache_info,
+    components_to_categories_batch,
+)
 from nonbonded.library.utilities.environments import ChemicalEnvironment
 
 if TYPE_CHECKING:
@@ -49,6 +56,12 @@ class Statistic(BaseORM):
         None, description="The category which this statistic has been placed into."
     )
 
+    bootstrap_iterations: Optional[PositiveInt] = Field(
+        None,
+        description="The number of bootstrap iterations which were performed when "
+        "computing the confidence intervals of the statistic.",
+    )
+
 
 class DataSetStatistic(Statistic):
 
@@ -105,21 +118,18 @@ class DataSetResult(BaseORM):
         reference_data_set: Union[DataSet, DataSetCollection],
         estimated_data_set: "PhysicalPropertyDataSet",
         analysis_environments: List[ChemicalEnvironment],
+        n_processes: int = 1,
     ) -> Tuple[List[DataSetResultEntry], pandas.DataFrame]:
 
         from openff.evaluator.datasets import PhysicalProperty
 
-        if isinstance(reference_data_set, DataSet):
-            reference_entries_by_id: Dict[str, DataSetEntry] = {
-                int(x.id): x for x in reference_data_set.entries
-            }
-        elif isinstance(reference_data_set, DataSetCollection):
-            reference_entries_by_id: Dict[str, DataSetEntry] = {
-                int(y.id): y for x in reference_data_set.data_sets for y in x.entries
-            }
-        else:
+        if not isinstance(reference_data_set, (DataSet, DataSetCollection)):
             raise NotImplementedError()
 
+        reference_entries_by_id: Dict[
+            int, DataSetEntry
+        ] = reference_data_set.index.entries_by_id
+
         estimated_entries_by_id: Dict[str, PhysicalProperty] = {
             int(x.id): x for x in estimated_data_set
         }
@@ -129,6 +139,27 @@ class DataSetResult(BaseORM):
 
         internal_units = DataSetEntry.default_units()
 
+        # Categorize every estimated entry up front so that `checkmol` is only run
+        # once per batch rather than once per component.
+        estimated_identifiers = [
+            identifier
+            for identifier in reference_entries_by_id
+            if identifier in estimated_entries_by_id
+        ]
+        categories_by_id = dict(
+            zip(
+                estimated_identifiers,
+                components_to_categories_batch(
+                    [
+                        reference_entries_by_id[identifier].components
+                        for identifier in estimated_identifiers
+                    ],
+                    analysis_environments,
+                    n_processes=n_processes,
+                ),
+            )
+        )
+
         for identifier in reference_entries_by_id:
 
             if identifier not in estimated_entries_by_id:
@@ -156,9 +187,7 @@ class DataSetResult(BaseORM):
                 estimated_std_error=estimated_entry.uncertainty.to(
                     internal_unit
                 ).magnitude,
-                categories=components_to_categories(
-                    reference_entry.components, analysis_environments
-                ),
+                categories=categories_by_id[identifier],
             )
 
             results_entries.append(results_entry)
@@ -183,43 +212,83 @@ class DataSetResult(BaseORM):
 
         results_frame = pandas.DataFrame(results_rows)
 
+        logger.debug(f"Category cache usage: {category_cache_info()}")
+
         return results_entries, results_frame
 
     @classmethod
     def _results_frame_to_statistics(
         cls,
         results_frame: pandas.DataFrame,
-        property_type: str,
-        n_components: int,
-        category: Optional[str],
         bootstrap_iterations: int,
         statistic_types: List[StatisticType],
+        random_seed: RandomState = None,
+        n_processes: int = 1,
+        convergence_tolerance: Optional[float] = None,
+        confidence_interval_method: ConfidenceIntervalMethod = (
+            ConfidenceIntervalMethod.Bootstrap
+        ),
     ) -> List[DataSetStatistic]:
+        """Computes the statistics of each property type (and number of components)
+        both over the entire set and per category in a single vectorized pass."""
+
+        # Each row contributes to the statistics of its property type as a whole
+        # and, when it has been categorized, to those of its category.
+        bulk_frame = results_frame.assign(Category=None)
+        category_frame = results_frame[results_frame["Category"].notna()]
+
+        grouped_frame = pandas.concat([bulk_frame, category_frame], ignore_index=True)
+
+        group_columns = ["Property Type", "N Components", "Category"]
+        group_codes = grouped_frame.groupby(
+            group_columns, sort=False, dropna=False
+        ).ngroup()
+
+        # Look up the key of each group by its code rather than assuming the order
+        # in which the groups were numbered, as older versions of pandas number any
+        # groups with a null key last.
+        group_keys = (
+            grouped_frame[group_columns]
+            .assign(Group=group_codes.values)
+            .drop_duplicates("Group")
+            .set_index("Group")
+        )
 
-        bulk_statistics, _, bulk_statistics_ci = compute_statistics(
-            measured_values=results_frame["Reference Value"].values,
-            measured_std=results_frame["Reference Std"].values,
-            estimated_values=results_frame["Estimated Value"].values,
-            estimated_std=results_frame["Estimated Std"].values,
+        statistics_frame = compute_grouped_statistics(
+            measured_values=grouped_frame["Reference Value"].values,
+            measured_std=grouped_frame["Reference Std"].values,
+            estimated_values=grouped_frame["Estimated Value"].values,
+            estimated_std=grouped_frame["Estimated Std"].values,
+            group_codes=group_codes.values,
             bootstrap_iterations=bootstrap_iterations,
             statistic_types=statistic_types,
-        )
-
-        statistics_entries = []
-
-        for statistic_type in bulk_statistics:
-            statistics_entry = DataSetStatistic(
-                statistic_type=statistic_type,
-                property_type=property_type,
-                n_components=n_components,
-                category=category,
-                value=bulk_statistics[statistic_type],
-                lower_95_ci=bulk_statistics_ci[statistic_type][0],
-                upper_95_ci=bulk_statistics_ci[statistic_type][1],
+            random_state=random_seed,
+            n_processes=n_processes,
+            convergence_tolerance=convergence_tolerance,
+            confidence_interval_method=confidence_interval_method,
+        ).join(group_keys, on="Group")
+
+        return [
+            DataSetStatistic(
+                statistic_type=statistic_row["Statistic Type"],
+                property_type=statistic_row["Property Type"],
+                n_components=statistic_row["N Components"],
+                category=(
+                    None
+                    if pandas.isna(statistic_row["Category"])
+                    else statistic_row["Category"]
+                ),
+                value=statistic_row["Value"],
+                lower_95_ci=statistic_row["Lower CI"],
+                upper_95_ci=statistic_row["Upper CI"],
+                bootstrap_iterations=(
+                    None
+                    if pandas.isna(statistic_row["Iterations"])
+                    else statistic_row["Iterations"]
+                ),
             )
-            statistics_entries.append(statistics_entry)
-
-        return statistics_entries
+            for statistic_row in statistics_frame.to_dict("records")
+        ]
 
     @classmethod
     def from_evaluator(
@@ -229,70 +298,67 @@ class DataSetResult(BaseORM):
         analysis_environments: List[ChemicalEnvironment],
         bootstrap_iterations: int = 1000,
         statistic_types: List[StatisticType] = None,
+        random_seed: RandomState = None,
+        n_processes: int = 1,
+        convergence_tolerance: Optional[float] = None,
+        confidence_interval_method: ConfidenceIntervalMethod = (
+            ConfidenceIntervalMethod.Bootstrap
+        ),
     ) -> "DataSetResult":
+        """Analyzes a set of estimated properties against the reference data set
+        they were estimated for.
+
+        Parameters
+        ----------
+        reference_data_set
+            The reference data set(s).
+        estimated_data_set
+            The estimated properties.
+        analysis_environments
+            The chemical environments to categorize the properties by.
+        bootstrap_iterations
+            The number of bootstrap iterations to perform when computing the
+            confidence intervals of each statistic, or the maximum number if
+            ``convergence_tolerance`` is provided.
+        statistic_types
+            The statistics to compute. By default the RMSE, R^2 and MSE are computed.
+        random_seed
+            The seed (or seed sequence) from which the random stream used to
+            bootstrap each group of statistics will be spawned. If `None`, the results will not be
+            reproducible.
+        n_processes
+            The number of processes to distribute the categorization of the
+            properties and the bootstrapping across.
+        convergence_tolerance
+            If provided, the statistics of each group will be bootstrapped in
+            batches until their standard errors and confidence intervals change by
+            less than this tolerance (in units of the standard error).
+        confidence_interval_method
+            The method to use to estimate the confidence intervals of each statistic.
+            The analytic and jackknife methods are substantially cheaper than
+            bootstrapping and are intended for fast feedback loops.
+        """
 
         if statistic_types is None:
             statistic_types = [StatisticType.RMSE, StatisticType.R2, StatisticType.MSE]
 
         results_entries, results_frame = cls._evaluator_to_results_entries(
-            reference_data_set, estimated_data_set, analysis_environments
+            reference_data_set, estimated_data_set, analysis_environments, n_processes
         )
 
-        property_types = results_frame[
-            ["Property Type", "N Components"]
-        ].drop_duplicates()
-        property_types = list(property_types.to_records(index=False))
-
-        categories = results_frame["Category"].unique()
-
-        if len(categories) == 1 and categories[0] is None:
-            categories = []
-
-        statistic_entries = []
-
-        for (property_type, n_components) in property_types:
-
-            property_results_frame = results_frame[
-                (results_frame["Property Type"] == property_type)
-                & (results_frame["N Components"] == n_components)
-            ]
-
-            # Calculate statistics over the entire set (i.e. not by category).
-            statistic_entries.extend(
-                cls._results_frame_to_statistics(
-                    property_results_frame,
-                    property_type,
-                    n_components,
-                    None,
-                    bootstrap_iterations,
-                    statistic_types,
-                )
+        statistic_entries = (
+            []
+            if len(results_frame) == 0
+            else cls._results_frame_to_statistics(
+                results_frame,
+                bootstrap_iterations,
+                statistic_types,
+                random_seed,
+                n_processes,
+                convergence_tolerance,
+                confidence_interval_method,
             )
-
-            # Calculate statistics per category
-            for category in categories:
-
-                category_results_frame = property_results_frame[
-                    property_results_frame["Category"] == category
-                ]
-
-                if len(category_results_frame) == 0:
-                    continue
-
-                statistic_entries.extend(
-                    cls._results_frame_to_statistics(
-                        category_results_frame,
-                        property_type,
-                        n_components,
-                        category,
-                        bootstrap_iterations,
-                        statistic_types,
-                    )
-                )
-
-        assert len(statistic_entries) <= len(property_types) * (
-            len(categories) + 1
-        ) * len(statistic_types)
+        )
 
         data_set_result = DataSetResult(
             statistic_entries=statistic_entries,
@@ -370,7 +436,7 @@ class SubStudyResult(BaseREST, abc.ABC):
         project_id: str,
         study_id: str,
         model_id: str,
-        requests_class=requests,
+        requests_class=None,
     ):
         # noinspection PyTypeChecker
         return super(SubStudyResult, cls).from_rest(
@@ -403,6 +469,9 @@ class BenchmarkResult(SubStudyResult):
         estimated_data_set: "PhysicalPropertyDataSet",
         analysis_environments: List[ChemicalEnvironment],
         bootstrap_iterations: int = 1000,
+        random_seed: RandomState = None,
+        n_processes: int = 1,
+        convergence_tolerance: Optional[float] = None,
     ) -> "BenchmarkResult":
 
         benchmark_result = BenchmarkResult(
@@ -414,6 +483,9 @@ class BenchmarkResult(SubStudyResult):
                 estimated_data_set=estimated_data_set,
                 analysis_environments=analysis_environments,
                 bootstrap_iterations=bootstrap_iterations,
+                random_seed=random_seed,
+                n_processes=n_processes,
+                convergence_tolerance=convergence_tolerance,
             ),
         )
 
@@ -1,14 +1,14 @@
 import os
 import re
 import warnings
-from typing import List
+from typing import Iterable, List, Union
 
 import numpy
 from typing_extensions import Literal
 
-from nonbonded.library.models.datasets import DataSet
+from nonbonded.library.models.datasets import DataSet, DataSetEntry
 from nonbonded.library.models.projects import Benchmark
-from nonbonded.library.models.results import BenchmarkResult
+from nonbonded.library.models.results import BenchmarkResult, DataSetResultEntry
 from nonbonded.library.plotting.seaborn.utilities import plot_scatter
 from nonbonded.library.plotting.utilities import (
     combine_data_set_results,
@@ -250,8 +250,8 @@ def plot_categorized_rmse(
 
 def plot_scatter_results(
     benchmarks: List[Benchmark],
-    benchmark_results: List[BenchmarkResult],
-    data_sets: List[DataSet],
+    benchmark_results: List[Union[BenchmarkResult, Iterable[DataSetResultEntry]]],
+    data_sets: Union[List[DataSet], Iterable[DataSetEntry]],
     output_directory: str,
     file_type: Literal["png", "pdf"] = "png",
     highlight_categories: List[str] = None,
@@ -264,9 +264,11 @@ def plot_scatter_results(
     benchmarks
         The benchmarks which have been performed.
     benchmark_results
-        The analyzed outputs of the benchmarks.
+        The analyzed outputs of the benchmarks, or iterables (such as streams) over
+        the result entries of each benchmark.
     data_sets
-        The reference data sets benchmarked against.
+        The reference data sets benchmarked against, or an iterable (such as a
+        stream) over their entries.
     output_directory
         The directory in which to save the plots.
     file_type
@@ -1,12 +1,17 @@
+import functools
 import re
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
 import numpy
 import pandas
 
 from nonbonded.library.models.datasets import DataSet, DataSetEntry
 from nonbonded.library.models.projects import Benchmark
-from nonbonded.library.models.results import BenchmarkResult, TargetResultType
+from nonbonded.library.models.results import (
+    BenchmarkResult,
+    DataSetResultEntry,
+    TargetResultType,
+)
 from nonbonded.library.models.targets import (
     EvaluatorTarget,
     OptimizationTarget,
@@ -49,6 +54,7 @@ def property_type_to_title(property_type: str, n_components: int):
     return f"${abbreviation}$ {unit_string}"
 
 
+@functools.lru_cache(1000)
 def format_category(category: Optional[str]) -> str:
     """Formats a category ready for plotting."""
 
@@ -62,9 +68,9 @@ def format_category(category: Optional[str]) -> str:
 
 
 def combine_data_set_results(
-    data_sets: List[DataSet],
+    data_sets: Union[List[DataSet], Iterable[DataSetEntry]],
     benchmarks: List[Benchmark],
-    benchmark_results: List[BenchmarkResult],
+    benchmark_results: List[Union[BenchmarkResult, Iterable[DataSetResultEntry]]],
 ) -> pandas.DataFrame:
     """Combines a set of benchmarked results with their corresponding reference
     data set values into a pandas data frame which can be readily plotted.
@@ -72,11 +78,13 @@ def combine_data_set_results(
     Parameters
     ----------
     data_sets
-        The data sets which contain the reference data points.
+        The data sets which contain the reference data points, or an iterable
+        (such as a stream) over the reference data points themselves.
     benchmarks
         The benchmarks associated with each result.
     benchmark_results
-        The results to map.
+        The results to map. Each result may alternatively be provided as an
+        iterable (such as a stream) over its result entries.
 
     Returns
     -------
@@ -94,8 +102,18 @@ def combine_data_set_results(
             * "Reference Std": The uncertainty in the reference value.
             * "Category": The category assigned to the data point.
     """
-    reference_data_points: Dict[int, DataSetEntry] = {
-        entry.id: entry for data_set in data_sets for entry in data_set.entries
+
+    # Retain only the parts of the reference data points which are plotted, so that
+    # streamed data points need never be held in memory at once.
+    reference_data_points: Dict[int, Tuple[str, int, float, Optional[float]]] = {
+        entry.id: (
+            entry.property_type,
+            len(entry.components),
+            entry.value,
+            entry.std_error,
+        )
+        for data_set in data_sets
+        for entry in (data_set.entries if isinstance(data_set, DataSet) else [data_set])
     }
 
     # Re-shape the data into a pandas data frame for easier plotting.
@@ -103,12 +121,20 @@ def combine_data_set_results(
 
     for benchmark, benchmark_result in zip(benchmarks, benchmark_results):
 
-        for result_entry in benchmark_result.data_set_result.result_entries:
+        result_entries = (
+            benchmark_result.data_set_result.result_entries
+            if isinstance(benchmark_result, BenchmarkResult)
+            else benchmark_result
+        )
 
-            reference_data_point = reference_data_points[result_entry.reference_id]
+        for result_entry in result_entries:
 
-            reference_value = reference_data_point.value
-            reference_std = reference_data_point.std_error
+            (
+                reference_property_type,
+                reference_n_components,
+                reference_value,
+                reference_std,
+            ) = reference_data_points[result_entry.reference_id]
 
             estimated_value = result_entry.estimated_value
             estimated_std = result_entry.estimated_std_error
@@ -121,15 +147,11 @@ def combine_data_set_results(
 
                 category = re.sub("[<>~]", "+", format_category(category))
 
-                property_type = (
-                    f"{reference_data_point.property_type}-"
-                    f"{len(reference_data_point.components)}"
-                )
+                property_type = f"{reference_property_type}-{reference_n_components}"
 
                 # Generate a meaningful title for the plot.
                 property_title = property_type_to_title(
-                    reference_data_point.property_type,
-                    len(reference_data_point.components),
+                    reference_property_type, reference_n_components
                 )
 
                 data_row = {
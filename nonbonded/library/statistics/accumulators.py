@@ -0,0 +1,242 @@
+"""Online accumulators which allow common statistics to be computed from data that
+arrives in chunks, without needing to retain every data point in memory."""
+
+from typing import Dict, Iterable, List, Optional
+
+import numpy
+
+from nonbonded.library.statistics.statistics import StatisticType
+
+
+class StatisticsAccumulator:
+    """Accumulates the moments required to compute the RMSE, MSE and R^2 between a
+    set of measured and estimated values, using Welford style updates of the means,
+    (co-)moments and residual moments.
+
+    Chunks of data points are added using ``update`` and the statistics may be
+    queried at any time. Accumulators built from separate shards of the same data
+    (e.g. chunks of a large results file, or sharded benchmark runs) can be
+    combined exactly using ``merge`` (or ``+``).
+
+    Notes
+    -----
+    Chunks are combined using the pairwise update formulae of Chan et al. which are
+    numerically stable and independent of the order in which chunks arrive.
+    """
+
+    def __init__(self):
+
+        self.n_data_points = 0
+
+        self._mean_measured = 0.0
+        self._mean_estimated = 0.0
+
+        self._m2_measured = 0.0
+        self._m2_estimated = 0.0
+        self._co_moment = 0.0
+
+        self._mean_residual = 0.0
+        self._m2_residual = 0.0
+
+        self._sum_variance = 0.0
+
+    @classmethod
+    def _from_chunk(
+        cls,
+        measured_values: numpy.ndarray,
+        estimated_values: numpy.ndarray,
+        variances: numpy.ndarray,
+    ) -> "StatisticsAccumulator":
+        """Creates an accumulator from a single chunk of data points."""
+
+        accumulator = cls()
+
+        accumulator.n_data_points = len(measured_values)
+
+        if accumulator.n_data_points == 0:
+            return accumulator
+
+        accumulator._mean_measured = measured_values.mean()
+        accumulator._mean_estimated = estimated_values.mean()
+
+        measured_deviations = measured_values - accumulator._mean_measured
+        estimated_deviations = estimated_values - accumulator._mean_estimated
+
+        accumulator._m2_measured = (measured_deviations * measured_deviations).sum()
+        accumulator._m2_estimated = (estimated_deviations * estimated_deviations).sum()
+        accumulator._co_moment = (measured_deviations * estimated_deviations).sum()
+
+        residuals = estimated_values - measured_values
+
+        accumulator._mean_residual = residuals.mean()
+
+        residual_deviations = residuals - accumulator._mean_residual
+        accumulator._m2_residual = (residual_deviations * residual_deviations).sum()
+
+        accumulator._sum_variance = variances.sum()
+
+        return accumulator
+
+    def update(
+        self,
+        measured_values: Iterable[float],
+        estimated_values: Iterable[float],
+        measured_std: Optional[Iterable[float]] = None,
+        estimated_std: Optional[Iterable[float]] = None,
+    ) -> "StatisticsAccumulator":
+        """Adds a chunk of data points to the accumulator in place.
+
+        Parameters
+        ----------
+        measured_values
+            The measured values in the chunk.
+        estimated_values
+            The estimated values in the chunk.
+        measured_std
+            The (optional) std error in the measured values. Missing (NaN) values
+            are treated as zero.
+        estimated_std
+            The (optional) std error in the estimated values. Missing (NaN) values
+            are treated as zero.
+
+        Returns
+        -------
+            This accumulator to allow chaining.
+        """
+
+        measured_values = numpy.asarray(measured_values, dtype=numpy.float64)
+        estimated_values = numpy.asarray(estimated_values, dtype=numpy.float64)
+
+        if measured_values.shape != estimated_values.shape:
+            raise ValueError(
+                "The measured and estimated values must have the same shape."
+            )
+
+        variances = numpy.zeros(len(measured_values))
+
+        for std_values in (measured_std, estimated_std):
+
+            if std_values is None:
+                continue
+
+            std_values = numpy.asarray(std_values, dtype=numpy.float64)
+            variances += numpy.where(numpy.isnan(std_values), 0.0, std_values) ** 2
+
+        self._merge_in_place(
+            self._from_chunk(measured_values, estimated_values, variances)
+        )
+        return self
+
+    def _merge_in_place(self, other: "StatisticsAccumulator"):
+        """Merges the moments of another accumulator into this one."""
+
+        if other.n_data_points == 0:
+            return
+
+        n_self, n_other = self.n_data_points, other.n_data_points
+        n_total = n_self + n_other
+
+        weight = n_self * n_other / n_total
+
+        delta_measured = other._mean_measured - self._mean_measured
+        delta_estimated = other._mean_estimated - self._mean_estimated
+        delta_residual = other._mean_residual - self._mean_residual
+
+        self._m2_measured += (
+            other._m2_measured + delta_measured * delta_measured * weight
+        )
+        self._m2_estimated += (
+            other._m2_estimated + delta_estimated * delta_estimated * weight
+        )
+        self._co_moment += other._co_moment + delta_measured * delta_estimated * weight
+        self._m2_residual += (
+            other._m2_residual + delta_residual * delta_residual * weight
+        )
+
+        self._mean_measured += delta_measured * n_other / n_total
+        self._mean_estimated += delta_estimated * n_other / n_total
+        self._mean_residual += delta_residual * n_other / n_total
+
+        self._sum_variance += other._sum_variance
+
+        self.n_data_points = n_total
+
+    def merge(self, other: "StatisticsAccumulator") -> "StatisticsAccumulator":
+        """Returns a new accumulator which combines the data points of this and
+        another accumulator."""
+
+        merged = StatisticsAccumulator()
+        merged._merge_in_place(self)
+        merged._merge_in_place(other)
+
+        return merged
+
+    def __add__(self, other: "StatisticsAccumulator") -> "StatisticsAccumulator":
+        return self.merge(other)
+
+    @property
+    def mse(self) -> float:
+        """The mean signed error between the estimated and measured values."""
+        return self._mean_residual if self.n_data_points > 0 else numpy.nan
+
+    @property
+    def rmse(self) -> float:
+        """The root mean squared error between the estimated and measured values."""
+
+        if self.n_data_points == 0:
+            return numpy.nan
+
+        return numpy.sqrt(
+            self._m2_residual / self.n_data_points
+            + self._mean_residual * self._mean_residual
+        )
+
+    @property
+    def r2(self) -> float:
+        """The coefficient of determination (the square of the Pearson correlation
+        coefficient) between the measured and estimated values. As with
+        ``scipy.stats.linregress`` this is defined to be zero when either set of
+        values has no variance."""
+
+        if self.n_data_points == 0:
+            return numpy.nan
+
+        if self._m2_measured <= 0.0 or self._m2_estimated <= 0.0:
+            return 0.0
+
+        r = self._co_moment / numpy.sqrt(self._m2_measured * self._m2_estimated)
+        return float(numpy.clip(r, -1.0, 1.0) ** 2)
+
+    @property
+    def mean_variance(self) -> float:
+        """The mean of the combined (measured plus estimated) variance of each data
+        point, as computed from the std errors provided to ``update``."""
+        return (
+            self._sum_variance / self.n_data_points
+            if self.n_data_points > 0
+            else numpy.nan
+        )
+
+    def statistics(
+        self, statistic_types: Optional[List[StatisticType]] = None
+    ) -> Dict[StatisticType, float]:
+        """Returns the current value of a set of statistics.
+
+        Parameters
+        ----------
+        statistic_types
+            The statistics to return. If `None`, all statistics will be returned.
+        """
+
+        if statistic_types is None:
+            statistic_types = [StatisticType.R2, StatisticType.RMSE, StatisticType.MSE]
+
+        values = {
+            StatisticType.R2: self.r2,
+            StatisticType.RMSE: self.rmse,
+            StatisticType.MSE: self.mse,
+        }
+
+        return {
+            statistic_type: values[statistic_type] for statistic_type in statistic_types
+        }
@@ -1,7 +1,11 @@
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
-from typing import Iterable, Tuple
+from typing import Callable, Iterable, List, Optional, Tuple, Union
 
 import numpy
+import pandas
+
+RandomState = Optional[Union[int, numpy.random.SeedSequence, numpy.random.Generator]]
 
 
 class StatisticType(Enum):
@@ -11,54 +15,708 @@ class StatisticType(Enum):
     MSE = "MSE"
 
 
-def _compute_statistics(measured_values, estimated_values, statistics):
-    """Calculates a collection of common statistics comparing the measured
-    and estimated values.
+class ConfidenceIntervalMethod(Enum):
+    """The methods available for estimating the standard error and confidence
+    intervals of a statistic.
+
+    * ``Bootstrap`` - resample the data with replacement. This is the most robust
+      option, but costs O(n_iterations * n) per statistic.
+    * ``Analytic`` - a normal approximation for the MSE and RMSE (the latter via the
+      delta method) and a Fisher z-transformation for R^2. These cost O(n).
+    * ``Jackknife`` - a vectorized leave-one-out jackknife with normal confidence
+      intervals. This costs O(n).
+
+    The ``Analytic`` and ``Jackknife`` options are intended for hot paths, such as
+    interactive plotting or monitoring an optimization, where a full bootstrap is
+    too expensive.
+    """
+
+    Bootstrap = "bootstrap"
+    Analytic = "analytic"
+    Jackknife = "jackknife"
+
+
+#: The approximate maximum number of bytes which may be allocated by the arrays
+#: of resampled data points when performing a batch of bootstrap iterations.
+BOOTSTRAP_MEMORY_LIMIT = 64 * 1024 ** 2
+
+#: The number of bootstrap iterations to perform between successive convergence
+#: checks when bootstrapping adaptively.
+ADAPTIVE_BOOTSTRAP_BATCH_ITERATIONS = 100
+
+# The relative change in a bootstrapped statistic which is attributed to round-off
+# error rather than a lack of convergence.
+_CONVERGENCE_ROUND_OFF = 1.0e-10
+
+# The (approximate) number of temporary float arrays with shape=(n_iterations,
+# n_data_points) which are simultaneously alive while computing the statistics of
+# a batch of bootstrapped samples.
+_N_BOOTSTRAP_ARRAYS = 6
+
+
+def _bootstrap_batch_size(
+    n_data_points: int, bootstrap_iterations: int, memory_limit: int
+) -> int:
+    """Returns the number of bootstrap iterations which can be performed in a
+    single batch while approximately remaining within a given memory limit.
+
+    Parameters
+    ----------
+    n_data_points
+        The number of data points being resampled.
+    bootstrap_iterations
+        The total number of bootstrap iterations to perform.
+    memory_limit
+        The maximum number of bytes which the resampled arrays may occupy.
+    """
+
+    bytes_per_iteration = max(1, n_data_points) * 8 * _N_BOOTSTRAP_ARRAYS
+    return int(max(1, min(bootstrap_iterations, memory_limit // bytes_per_iteration)))
+
+
+def _bootstrap_percentile_indices(
+    bootstrap_iterations: int, percentile: float
+) -> Tuple[int, int]:
+    """Returns the indices of the sorted bootstrap samples which correspond to the
+    lower and upper bounds of a confidence interval."""
+
+    lower_percentile_index = int(bootstrap_iterations * (1 - percentile) / 2)
+    upper_percentile_index = int(bootstrap_iterations * (1 + percentile) / 2)
+
+    return lower_percentile_index, min(upper_percentile_index, bootstrap_iterations - 1)
+
+
+def _compute_grouped_batched_statistics(
+    measured_values, estimated_values, group_starts, group_sizes, statistics
+):
+    """Calculates a collection of common statistics comparing batches of measured
+    and estimated values which have been partitioned into contiguous groups, using
+    closed form array reductions.
 
     Parameters
     ----------
     measured_values: numpy.ndarray
-        The experimentally measured values with shape=(number of data points)
+        The experimentally measured values with shape=(n_batches, n_data_points)
     estimated_values: numpy.ndarray
-        The computationally estimated values with shape=(number of data points)
+        The computationally estimated values with shape=(n_batches, n_data_points)
+    group_starts: numpy.ndarray
+        The index of the first data point in each group with shape=(n_groups).
+    group_sizes: numpy.ndarray
+        The (non-zero) number of data points in each group with shape=(n_groups).
     statistics: list of StatisticType
         The statistics to compute. If `None`, all statistics will be computed
 
     Returns
     -------
     numpy.ndarray
-        An array of the summarised statistics, containing the
-        R^2, RMSE, and MSE
+        An array of the summarised statistics with
+        shape=(n_batches, n_groups, n_statistics).
     list of StatisticType
         Human readable labels for each of the statistics.
     """
-    import scipy.stats
 
     if statistics is None:
         statistics = [StatisticType.R2, StatisticType.RMSE, StatisticType.MSE]
 
+    def group_sum(values):
+        return numpy.add.reduceat(values, group_starts, axis=-1)
+
+    def group_mean(values):
+        return group_sum(values) / group_sizes
+
     summary_statistics = {}
 
     if StatisticType.R2 in statistics:
 
+        measured_deviations = measured_values - numpy.repeat(
+            group_mean(measured_values), group_sizes, axis=-1
+        )
+        estimated_deviations = estimated_values - numpy.repeat(
+            group_mean(estimated_values), group_sizes, axis=-1
+        )
+
+        ss_measured = group_sum(measured_deviations * measured_deviations)
+        ss_estimated = group_sum(estimated_deviations * estimated_deviations)
+        ss_cross = group_sum(measured_deviations * estimated_deviations)
+
+        # Mirror ``scipy.stats.linregress`` by defining r = 0 when either set of
+        # values has no variance.
+        is_defined = (ss_measured > 0.0) & (ss_estimated > 0.0)
+
         with numpy.errstate(divide="ignore", invalid="ignore"):
-            (_, _, r, _, _) = scipy.stats.linregress(measured_values, estimated_values)
+            r = numpy.where(
+                is_defined, ss_cross / numpy.sqrt(ss_measured * ss_estimated), 0.0
+            )
 
-        summary_statistics[StatisticType.R2] = r ** 2
+        summary_statistics[StatisticType.R2] = numpy.clip(r, -1.0, 1.0) ** 2
 
-    if StatisticType.RMSE in statistics:
+    if StatisticType.RMSE in statistics or StatisticType.MSE in statistics:
+        residuals = estimated_values - measured_values
 
+    if StatisticType.RMSE in statistics:
         summary_statistics[StatisticType.RMSE] = numpy.sqrt(
-            numpy.mean((estimated_values - measured_values) ** 2)
+            group_mean(residuals * residuals)
         )
 
     if StatisticType.MSE in statistics:
+        summary_statistics[StatisticType.MSE] = group_mean(residuals)
+
+    return (
+        numpy.stack([summary_statistics[x] for x in statistics], axis=-1),
+        statistics,
+    )
+
+
+def _compute_batched_statistics(measured_values, estimated_values, statistics):
+    """Calculates a collection of common statistics comparing batches of measured
+    and estimated values using closed form array reductions.
+
+    Parameters
+    ----------
+    measured_values: numpy.ndarray
+        The experimentally measured values with shape=(n_batches, n_data_points)
+    estimated_values: numpy.ndarray
+        The computationally estimated values with shape=(n_batches, n_data_points)
+    statistics: list of StatisticType
+        The statistics to compute. If `None`, all statistics will be computed
+
+    Returns
+    -------
+    numpy.ndarray
+        An array of the summarised statistics with shape=(n_batches, n_statistics).
+    list of StatisticType
+        Human readable labels for each of the statistics.
+    """
+
+    summary_statistics, statistics = _compute_grouped_batched_statistics(
+        measured_values,
+        estimated_values,
+        numpy.array([0]),
+        numpy.array([measured_values.shape[-1]]),
+        statistics,
+    )
+
+    return summary_statistics[:, 0, :], statistics
+
+
+def _compute_statistics(measured_values, estimated_values, statistics):
+    """Calculates a collection of common statistics comparing the measured
+    and estimated values.
+
+    Parameters
+    ----------
+    measured_values: numpy.ndarray
+        The experimentally measured values with shape=(number of data points)
+    estimated_values: numpy.ndarray
+        The computationally estimated values with shape=(number of data points)
+    statistics: list of StatisticType
+        The statistics to compute. If `None`, all statistics will be computed
+
+    Returns
+    -------
+    numpy.ndarray
+        An array of the summarised statistics, containing the
+        R^2, RMSE, and MSE
+    list of StatisticType
+        Human readable labels for each of the statistics.
+    """
+
+    summary_statistics, statistics = _compute_batched_statistics(
+        numpy.asarray(measured_values, dtype=numpy.float64)[None, :],
+        numpy.asarray(estimated_values, dtype=numpy.float64)[None, :],
+        statistics,
+    )
+
+    return summary_statistics[0], statistics
+
+
+def _to_seed_sequence(random_state: RandomState) -> numpy.random.SeedSequence:
+    """Converts a seed, seed sequence or generator into a seed sequence from which
+    independent random streams may be spawned."""
+
+    if isinstance(random_state, numpy.random.SeedSequence):
+        return random_state
+
+    if isinstance(random_state, numpy.random.Generator):
+        return numpy.random.SeedSequence(
+            random_state.integers(numpy.iinfo(numpy.int64).max, size=4)
+        )
+
+    return numpy.random.SeedSequence(random_state)
+
+
+def _bootstrap_generators(
+    random_state: RandomState,
+) -> Tuple[numpy.random.Generator, numpy.random.Generator, numpy.random.Generator]:
+    """Returns the independent generators from which the resample indices, the
+    noise added to the measured values and the noise added to the estimated values
+    are respectively drawn.
+
+    Because each quantity is drawn from its own stream, the samples which are drawn
+    do not depend on how the bootstrap iterations are split into batches.
+    """
+
+    return tuple(
+        numpy.random.default_rng(seed_sequence)
+        for seed_sequence in _to_seed_sequence(random_state).spawn(3)
+    )
+
+
+def _map_groups(function, group_arguments, n_processes: int = 1) -> list:
+    """Applies a function to the arguments of each statistics group, optionally
+    fanning the groups out across a pool of processes.
+
+    Parameters
+    ----------
+    function
+        The (picklable) function to apply to each group.
+    group_arguments
+        A list of the positional arguments to pass to the function for each group.
+    n_processes
+        The number of processes to distribute the groups across. A value of one
+        will evaluate each group serially in the current process.
+
+    Returns
+    -------
+        The value returned by the function for each group.
+    """
+
+    if n_processes is None or n_processes <= 1 or len(group_arguments) <= 1:
+        return [function(*arguments) for arguments in group_arguments]
+
+    with ProcessPoolExecutor(max_workers=n_processes) as executor:
+        return list(executor.map(function, *zip(*group_arguments)))
+
+
+def _bootstrap_grouped_samples(
+    measured_values,
+    measured_stds,
+    estimated_values,
+    estimated_stds,
+    group_starts,
+    group_sizes,
+    statistics,
+    bootstrap_iterations,
+    memory_limit,
+    group_generators,
+) -> numpy.ndarray:
+    """Generates the bootstrapped samples of a set of common error statistics for
+    several groups of data points at once.
+
+    Notes
+    -----
+    Each group is resampled using its own generators (as returned by
+    ``_bootstrap_generators``), but the resampled values of consecutive groups are
+    gathered into a single matrix whose statistics are reduced together. The groups are split into chunks, and the
+    iterations of any chunk which is still too large into batches, such that the
+    resampled arrays occupy no more than ``memory_limit`` bytes. The samples of a
+    group depend only on its own generators, and not on ``memory_limit`` or on
+    which other groups are resampled alongside it.
+
+    Parameters
+    ----------
+    group_starts: numpy.ndarray
+        The index of the first data point of each group to resample with
+        shape=(n_groups).
+    group_sizes: numpy.ndarray
+        The (non-zero) number of data points in each group with shape=(n_groups).
+    group_generators: list of tuple of numpy.random.Generator
+        The generators of each group.
+
+    Returns
+    -------
+        The sampled statistics with shape=(bootstrap_iterations, n_groups,
+        n_statistics).
+    """
+
+    group_starts = numpy.asarray(group_starts)
+    group_sizes = numpy.asarray(group_sizes)
+
+    sample_statistics = numpy.zeros(
+        (bootstrap_iterations, len(group_sizes), len(statistics))
+    )
+
+    # Split the groups into chunks which can be resampled for every iteration at
+    # once, with any group which is too large to do so forming its own chunk.
+    max_chunk_size = max(
+        1, memory_limit // (bootstrap_iterations * 8 * _N_BOOTSTRAP_ARRAYS)
+    )
+    chunk_ids = numpy.cumsum(group_sizes) // max_chunk_size
+    chunk_starts = numpy.flatnonzero(numpy.diff(chunk_ids, prepend=-1))
+
+    for chunk_start, chunk_end in zip(
+        chunk_starts, [*chunk_starts[1:], len(group_sizes)]
+    ):
+
+        chunk_sizes = group_sizes[chunk_start:chunk_end]
+
+        sample_count = int(chunk_sizes.sum())
+        sample_starts = numpy.cumsum(chunk_sizes) - chunk_sizes
+
+        batch_size = _bootstrap_batch_size(
+            sample_count, bootstrap_iterations, memory_limit
+        )
+
+        for batch_start in range(0, bootstrap_iterations, batch_size):
+
+            batch_end = min(batch_start + batch_size, bootstrap_iterations)
+
+            measured_blocks, estimated_blocks = [], []
+
+            for group_start, group_size, generators in zip(
+                group_starts[chunk_start:chunk_end],
+                chunk_sizes,
+                group_generators[chunk_start:chunk_end],
+            ):
+
+                index_generator, measured_generator, estimated_generator = generators
+
+                group_slice = slice(group_start, group_start + group_size)
+                batch_shape = (batch_end - batch_start, group_size)
+
+                samples_indices = group_start + index_generator.integers(
+                    0, group_size, size=batch_shape
+                )
+
+                sample_measured_values = measured_values[samples_indices]
+
+                if measured_stds is not None and numpy.any(measured_stds[group_slice]):
+                    sample_measured_values += measured_generator.normal(
+                        0.0, measured_stds[group_slice], size=batch_shape
+                    )
+
+                sample_estimated_values = estimated_values[samples_indices]
+
+                if estimated_stds is not None and numpy.any(
+                    estimated_stds[group_slice]
+                ):
+                    sample_estimated_values += estimated_generator.normal(
+                        0.0, estimated_stds[group_slice], size=batch_shape
+                    )
+
+                measured_blocks.append(sample_measured_values)
+                estimated_blocks.append(sample_estimated_values)
+
+            if len(measured_blocks) > 1:
+
+                # Gather the groups point-major such that each group occupies a
+                # contiguous block of memory.
+                sample_measured_values = numpy.concatenate(
+                    [block.T for block in measured_blocks]
+                ).T
+                sample_estimated_values = numpy.concatenate(
+                    [block.T for block in estimated_blocks]
+                ).T
+
+            (
+                sample_statistics[batch_start:batch_end, chunk_start:chunk_end],
+                _,
+            ) = _compute_grouped_batched_statistics(
+                sample_measured_values,
+                sample_estimated_values,
+                sample_starts,
+                chunk_sizes,
+                statistics,
+            )
+
+    return sample_statistics
+
+
+def _bootstrap_samples(
+    measured_values,
+    measured_stds,
+    estimated_values,
+    estimated_stds,
+    statistics,
+    bootstrap_iterations,
+    memory_limit,
+    generators,
+) -> numpy.ndarray:
+    """Generates the bootstrapped samples of a set of common error statistics.
+
+    Notes
+    -----
+    Rather than performing each iteration in turn, the samples are drawn as a
+    single ``(bootstrap_iterations, n_data_points)`` matrix which is split into
+    batches whose size is chosen such that the resampled arrays occupy no more than
+    ``memory_limit`` bytes. The indices and the noise are drawn from the separate
+    streams returned by ``_bootstrap_generators``, such that the samples do not
+    depend on ``memory_limit``.
+
+    Returns
+    -------
+        The sampled statistics with shape=(bootstrap_iterations, n_statistics).
+    """
+
+    return _bootstrap_grouped_samples(
+        measured_values,
+        measured_stds,
+        estimated_values,
+        estimated_stds,
+        numpy.array([0]),
+        numpy.array([len(measured_values)]),
+        statistics,
+        bootstrap_iterations,
+        memory_limit,
+        [generators],
+    )[:, 0, :]
+
+
+def _summarise_samples(
+    sample_statistics: numpy.ndarray, percentile: float
+) -> Tuple[numpy.ndarray, numpy.ndarray]:
+    """Computes the standard error and confidence intervals of a set of bootstrapped
+    samples with shape=(bootstrap_iterations, ...).
+
+    Returns
+    -------
+        The standard errors with shape=(...) and the confidence intervals with
+        shape=(..., 2).
+    """
+
+    lower_percentile_index, upper_percentile_index = _bootstrap_percentile_indices(
+        len(sample_statistics), percentile
+    )
+
+    sorted_samples = numpy.sort(sample_statistics, axis=0)
+
+    standard_errors = numpy.std(sample_statistics, axis=0)
+    confidence_intervals = numpy.stack(
+        [
+            sorted_samples[lower_percentile_index],
+            sorted_samples[upper_percentile_index],
+        ],
+        axis=-1,
+    )
+
+    return standard_errors, confidence_intervals
+
+
+def _summarise_convergence(
+    sample_statistics: numpy.ndarray, percentile: float
+) -> Tuple[numpy.ndarray, numpy.ndarray]:
+    """Returns the standard errors of a set of bootstrapped samples with
+    shape=(n_iterations, ...), and the summary (the standard errors and confidence
+    interval endpoints) with shape=(..., 3) whose convergence is monitored."""
+
+    standard_errors, confidence_intervals = _summarise_samples(
+        sample_statistics, percentile
+    )
+    summary = numpy.concatenate(
+        [standard_errors[..., None], confidence_intervals], axis=-1
+    )
+
+    return standard_errors, summary
+
+
+def _has_converged(
+    previous_summary: numpy.ndarray,
+    summary: numpy.ndarray,
+    standard_errors: numpy.ndarray,
+    convergence_tolerance: float,
+    n_group_axes: int = 0,
+) -> numpy.ndarray:
+    """Returns whether the summary of a set of bootstrapped samples has changed by
+    no more than ``convergence_tolerance`` times the standard error since the
+    previous batch of samples was drawn, for each of the leading ``n_group_axes``
+    axes of the summary."""
+
+    # Allow for round-off noise when the samples have (almost) no spread.
+    round_off = _CONVERGENCE_ROUND_OFF * numpy.abs(summary).max(axis=-1, keepdims=True)
+
+    is_within_tolerance = (
+        numpy.abs(summary - previous_summary)
+        <= convergence_tolerance * standard_errors[..., None] + round_off
+    )
+
+    return numpy.all(
+        is_within_tolerance.reshape(*summary.shape[:n_group_axes], -1), axis=-1
+    )
+
+
+def _bootstrap_until_converged(
+    draw_samples: Callable[[int], numpy.ndarray],
+    percentile: float,
+    bootstrap_iterations: int,
+    convergence_tolerance: Optional[float],
+) -> numpy.ndarray:
+    """Draws bootstrap samples either for a fixed number of iterations, or in
+    batches until the standard error and confidence intervals have converged.
+
+    Notes
+    -----
+    The samples are considered converged once drawing an additional batch of
+    ``ADAPTIVE_BOOTSTRAP_BATCH_ITERATIONS`` samples changes neither the standard
+    error nor the confidence interval endpoints of any statistic by more than
+    ``convergence_tolerance`` times its standard error.
+
+    Parameters
+    ----------
+    draw_samples
+        A function which draws the requested number of bootstrap samples, returning
+        an array with shape=(n_iterations, ...).
+    percentile
+        The percentile of the confidence interval to calculate.
+    bootstrap_iterations
+        The number of bootstrap iterations to perform when ``convergence_tolerance``
+        is `None`, otherwise the maximum number of iterations to perform.
+    convergence_tolerance
+        The tolerance (in units of the standard error) within which the statistics
+        must stabilize. If `None`, exactly ``bootstrap_iterations`` will be drawn.
+
+    Returns
+    -------
+        The drawn samples with shape=(n_iterations, ...).
+    """
+
+    if convergence_tolerance is None:
+        return draw_samples(bootstrap_iterations)
+
+    samples = draw_samples(
+        min(ADAPTIVE_BOOTSTRAP_BATCH_ITERATIONS, bootstrap_iterations)
+    )
+    _, previous_summary = _summarise_convergence(samples, percentile)
+
+    while len(samples) < bootstrap_iterations:
+
+        n_iterations = min(
+            ADAPTIVE_BOOTSTRAP_BATCH_ITERATIONS, bootstrap_iterations - len(samples)
+        )
+        samples = numpy.concatenate([samples, draw_samples(n_iterations)])
+
+        standard_errors, summary = _summarise_convergence(samples, percentile)
+
+        if _has_converged(
+            previous_summary, summary, standard_errors, convergence_tolerance
+        ):
+            break
+
+        previous_summary = summary
+
+    return samples
+
+
+def _bootstrap_group_statistics(
+    measured_values,
+    measured_stds,
+    estimated_values,
+    estimated_stds,
+    group_starts,
+    group_sizes,
+    statistics,
+    percentile,
+    bootstrap_iterations,
+    memory_limit,
+    seed_sequences,
+    convergence_tolerance=None,
+) -> Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+    """Computes the bootstrapped standard errors and confidence intervals of the
+    statistics of several contiguous groups of data points, each using its own
+    random streams, in a single vectorized pass.
+
+    Notes
+    -----
+    When ``convergence_tolerance`` is provided, the groups are bootstrapped
+    together in rounds of ``ADAPTIVE_BOOTSTRAP_BATCH_ITERATIONS`` iterations, with
+    each group dropped from subsequent rounds once it has converged according to
+    the criteria of ``_bootstrap_until_converged``.
+
+    Returns
+    -------
+        The standard errors with shape=(n_groups, n_statistics), the confidence
+        intervals with shape=(n_groups, n_statistics, 2) and the number of bootstrap
+        iterations which were performed for each group with shape=(n_groups).
+    """
+
+    group_starts = numpy.asarray(group_starts)
+    group_sizes = numpy.asarray(group_sizes)
+
+    group_generators = [
+        _bootstrap_generators(seed_sequence) for seed_sequence in seed_sequences
+    ]
+
+    def draw_samples(group_indices, n_iterations):
+
+        return _bootstrap_grouped_samples(
+            measured_values,
+            measured_stds,
+            estimated_values,
+            estimated_stds,
+            group_starts[group_indices],
+            group_sizes[group_indices],
+            statistics,
+            n_iterations,
+            memory_limit,
+            [group_generators[group_index] for group_index in group_indices],
+        )
+
+    n_groups = len(group_starts)
+
+    if convergence_tolerance is None:
+
+        sample_statistics = draw_samples(numpy.arange(n_groups), bootstrap_iterations)
+
+        return (
+            *_summarise_samples(sample_statistics, percentile),
+            numpy.full(n_groups, bootstrap_iterations),
+        )
+
+    sample_statistics = numpy.zeros((bootstrap_iterations, n_groups, len(statistics)))
+    n_iterations = numpy.zeros(n_groups, dtype=numpy.int64)
+
+    active_groups = numpy.arange(n_groups)
+    previous_summary = None
+
+    while len(active_groups) > 0:
+
+        batch_start = n_iterations[active_groups[0]]
+        batch_end = min(
+            batch_start + ADAPTIVE_BOOTSTRAP_BATCH_ITERATIONS, bootstrap_iterations
+        )
 
-        summary_statistics[StatisticType.MSE] = numpy.mean(
-            estimated_values - measured_values
+        sample_statistics[batch_start:batch_end, active_groups] = draw_samples(
+            active_groups, batch_end - batch_start
         )
+        n_iterations[active_groups] = batch_end
 
-    return numpy.array([summary_statistics[x] for x in statistics]), statistics
+        if batch_end >= bootstrap_iterations:
+            break
+
+        standard_errors, summary = _summarise_convergence(
+            sample_statistics[:batch_end, active_groups], percentile
+        )
+
+        is_converged = (
+            numpy.zeros(len(active_groups), dtype=bool)
+            if previous_summary is None
+            else _has_converged(
+                previous_summary,
+                summary,
+                standard_errors,
+                convergence_tolerance,
+                n_group_axes=1,
+            )
+        )
+
+        active_groups = active_groups[~is_converged]
+        previous_summary = summary[~is_converged]
+
+    standard_errors = numpy.zeros((n_groups, len(statistics)))
+    confidence_intervals = numpy.zeros((n_groups, len(statistics), 2))
+
+    # Summarise the groups which performed the same number of iterations together.
+    for group_iterations in numpy.unique(n_iterations):
+
+        group_indices = numpy.flatnonzero(n_iterations == group_iterations)
+
+        (
+            standard_errors[group_indices],
+            confidence_intervals[group_indices],
+        ) = _summarise_samples(
+            sample_statistics[:group_iterations, group_indices], percentile
+        )
+
+    return standard_errors, confidence_intervals, n_iterations
 
 
 def _compute_bootstrapped_statistics(
@@ -69,6 +727,8 @@ def _compute_bootstrapped_statistics(
     statistics=None,
     percentile=0.95,
     bootstrap_iterations=1000,
+    memory_limit=BOOTSTRAP_MEMORY_LIMIT,
+    random_state=None,
 ):
     """Compute the bootstrapped mean and confidence interval for a set
     of common error statistics.
@@ -76,7 +736,10 @@ def _compute_bootstrapped_statistics(
     Notes
     -----
     Bootstrapped samples are generated with replacement from the full
-    original data set.
+    original data set. Rather than performing each iteration in turn, the
+    samples are drawn as a single ``(bootstrap_iterations, n_data_points)``
+    matrix which is split into batches whose size is chosen such that the
+    resampled arrays occupy no more than ``memory_limit`` bytes.
 
     Parameters
     ----------
@@ -96,73 +759,454 @@ def _compute_bootstrapped_statistics(
         The percentile of the confidence interval to calculate.
     bootstrap_iterations: int
         The number of bootstrap iterations to perform.
+    memory_limit: int
+        The approximate maximum number of bytes to allocate for each batch of
+        bootstrap iterations.
+    random_state: int or numpy.random.SeedSequence or numpy.random.Generator
+        The seed or source of the random numbers used to draw the bootstrap
+        samples. If `None`, fresh entropy will be pulled from the OS.
     """
-    sample_count = len(measured_values)
+    measured_values = numpy.asarray(measured_values, dtype=numpy.float64)
+    estimated_values = numpy.asarray(estimated_values, dtype=numpy.float64)
 
     # Compute the mean of the statistics.
     mean_statistics, statistics_labels = _compute_statistics(
         measured_values, estimated_values, statistics
     )
 
-    # Generate the bootstrapped statistics samples.
-    sample_statistics = numpy.zeros((bootstrap_iterations, len(mean_statistics)))
+    # Generate the bootstrapped statistics samples and compute the SEM and CIs.
+    sample_statistics = _bootstrap_samples(
+        measured_values,
+        measured_stds,
+        estimated_values,
+        estimated_stds,
+        statistics_labels,
+        bootstrap_iterations,
+        memory_limit,
+        _bootstrap_generators(random_state),
+    )
+
+    standard_errors_array, confidence_intervals_array = _summarise_samples(
+        sample_statistics, percentile
+    )
+
+    # Store the means, SEMs and CIs in dictionaries
+    means = dict()
+    standard_errors = dict()
+    confidence_intervals = dict()
+
+    for statistic_index, statistic_label in enumerate(statistics_labels):
 
-    for sample_index in range(bootstrap_iterations):
+        means[statistic_label] = mean_statistics[statistic_index]
+        standard_errors[statistic_label] = standard_errors_array[statistic_index]
 
-        samples_indices = numpy.random.randint(
-            low=0, high=sample_count, size=sample_count
+        confidence_intervals[statistic_label] = tuple(
+            confidence_intervals_array[statistic_index]
         )
 
-        sample_measured_values = measured_values[samples_indices]
+    return means, standard_errors, confidence_intervals
 
-        if measured_stds is not None:
-            sample_measured_values += numpy.random.normal(0.0, measured_stds)
 
-        sample_estimated_values = estimated_values[samples_indices]
+def _normal_quantile(percentile: float) -> float:
+    """Returns the quantile of the standard normal distribution which bounds a
+    two-sided confidence interval of a given percentile."""
 
-        if estimated_stds is not None:
-            sample_estimated_values += numpy.random.normal(0.0, estimated_stds)
+    from scipy.special import ndtri
 
-        sample_statistics[sample_index], _ = _compute_statistics(
-            sample_measured_values, sample_estimated_values, statistics
-        )
+    return float(ndtri((1.0 + percentile) / 2.0))
 
-    # Compute the SEM
-    standard_errors_array = numpy.std(sample_statistics, axis=0)
 
-    # Store the means and SEMs in dictionaries
-    means = dict()
-    standard_errors = dict()
+def _analytic_statistics(
+    measured_values, estimated_values, statistics, percentile
+) -> Tuple[numpy.ndarray, numpy.ndarray]:
+    """Computes the standard errors and confidence intervals of a set of common
+    error statistics using analytical (normal theory) approximations.
 
-    for statistic_index in range(len(mean_statistics)):
-        statistic_label = statistics_labels[statistic_index]
+    Notes
+    -----
+    * The MSE uses the standard error of the mean of the residuals.
+    * The RMSE uses the standard error of the mean squared residual, propagated
+      through the square root using the delta method. The confidence interval is
+      obtained by transforming that of the mean squared residual.
+    * R^2 uses the Fisher z-transformation of the correlation coefficient, such
+      that the standard error of ``arctanh(r)`` is ``1 / sqrt(n - 3)``.
 
-        means[statistic_label] = mean_statistics[statistic_index]
-        standard_errors[statistic_label] = standard_errors_array[statistic_index]
+    Parameters
+    ----------
+    measured_values: numpy.ndarray
+        The experimentally measured values with shape=(n_data_points)
+    estimated_values: numpy.ndarray
+        The computationally estimated values with shape=(n_data_points)
+    statistics: list of StatisticType
+        The statistics to compute.
+    percentile: float
+        The percentile of the confidence interval to calculate.
 
-    # Compute the confidence intervals.
-    lower_percentile_index = int(bootstrap_iterations * (1 - percentile) / 2)
-    upper_percentile_index = int(bootstrap_iterations * (1 + percentile) / 2)
+    Returns
+    -------
+        The standard errors with shape=(n_statistics) and the confidence intervals
+        with shape=(n_statistics, 2).
+    """
 
-    confidence_intervals = dict()
+    z = _normal_quantile(percentile)
+    n_data_points = len(measured_values)
 
-    for statistic_index in range(len(mean_statistics)):
-        statistic_label = statistics_labels[statistic_index]
+    residuals = estimated_values - measured_values
+    ddof = 1 if n_data_points > 1 else 0
 
-        sorted_samples = numpy.sort(sample_statistics[:, statistic_index])
+    standard_errors = numpy.zeros(len(statistics))
+    confidence_intervals = numpy.zeros((len(statistics), 2))
 
-        confidence_intervals[statistic_label] = (
-            sorted_samples[lower_percentile_index],
-            sorted_samples[upper_percentile_index],
+    for statistic_index, statistic in enumerate(statistics):
+
+        if statistic == StatisticType.MSE:
+
+            value = residuals.mean()
+            standard_error = residuals.std(ddof=ddof) / numpy.sqrt(n_data_points)
+
+            confidence_interval = (
+                value - z * standard_error,
+                value + z * standard_error,
+            )
+
+        elif statistic == StatisticType.RMSE:
+
+            squared_residuals = residuals * residuals
+
+            mean_squared = squared_residuals.mean()
+            mean_squared_error = squared_residuals.std(ddof=ddof) / numpy.sqrt(
+                n_data_points
+            )
+
+            value = numpy.sqrt(mean_squared)
+            standard_error = 0.0 if value <= 0.0 else mean_squared_error / (2.0 * value)
+
+            confidence_interval = (
+                numpy.sqrt(max(0.0, mean_squared - z * mean_squared_error)),
+                numpy.sqrt(mean_squared + z * mean_squared_error),
+            )
+
+        elif statistic == StatisticType.R2:
+
+            (r_squared,), _ = _compute_statistics(
+                measured_values, estimated_values, [StatisticType.R2]
+            )
+
+            if n_data_points <= 3:
+
+                standard_error, confidence_interval = numpy.inf, (0.0, 1.0)
+
+            else:
+
+                r = numpy.sqrt(r_squared) * numpy.sign(
+                    numpy.dot(
+                        measured_values - measured_values.mean(),
+                        estimated_values - estimated_values.mean(),
+                    )
+                )
+                r = numpy.clip(r, -1.0 + 1.0e-12, 1.0 - 1.0e-12)
+
+                z_error = 1.0 / numpy.sqrt(n_data_points - 3)
+                z_value = numpy.arctanh(r)
+
+                r_lower = numpy.tanh(z_value - z * z_error)
+                r_upper = numpy.tanh(z_value + z * z_error)
+
+                standard_error = 2.0 * abs(r) * (1.0 - r * r) * z_error
+
+                confidence_interval = (
+                    0.0
+                    if r_lower <= 0.0 <= r_upper
+                    else min(r_lower ** 2, r_upper ** 2),
+                    max(r_lower ** 2, r_upper ** 2),
+                )
+
+        else:
+            raise NotImplementedError()
+
+        standard_errors[statistic_index] = standard_error
+        confidence_intervals[statistic_index] = confidence_interval
+
+    return standard_errors, confidence_intervals
+
+
+def _leave_one_out_statistics(
+    measured_values, estimated_values, statistics
+) -> numpy.ndarray:
+    """Computes a set of common error statistics for every leave-one-out subset of
+    a set of measured and estimated values in O(n) by updating the sums which
+    define each statistic, rather than recomputing them for each subset.
+
+    Returns
+    -------
+        The statistics of each subset with shape=(n_data_points, n_statistics)
+        where row ``i`` corresponds to the subset which excludes data point ``i``.
+    """
+
+    n_subset = len(measured_values) - 1
+
+    residuals = estimated_values - measured_values
+
+    summary_statistics = {}
+
+    if StatisticType.R2 in statistics:
+
+        # Center the values to reduce round-off in the updated sums.
+        measured_deviations = measured_values - measured_values.mean()
+        estimated_deviations = estimated_values - estimated_values.mean()
+
+        sum_measured = measured_deviations.sum() - measured_deviations
+        sum_estimated = estimated_deviations.sum() - estimated_deviations
+
+        ss_measured = (
+            (measured_deviations * measured_deviations).sum()
+            - measured_deviations * measured_deviations
+            - sum_measured * sum_measured / n_subset
+        )
+        ss_estimated = (
+            (estimated_deviations * estimated_deviations).sum()
+            - estimated_deviations * estimated_deviations
+            - sum_estimated * sum_estimated / n_subset
+        )
+        ss_cross = (
+            (measured_deviations * estimated_deviations).sum()
+            - measured_deviations * estimated_deviations
+            - sum_measured * sum_estimated / n_subset
         )
 
-    return means, standard_errors, confidence_intervals
+        is_defined = (ss_measured > 0.0) & (ss_estimated > 0.0)
+
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            r = numpy.where(
+                is_defined, ss_cross / numpy.sqrt(ss_measured * ss_estimated), 0.0
+            )
+
+        summary_statistics[StatisticType.R2] = numpy.clip(r, -1.0, 1.0) ** 2
+
+    if StatisticType.RMSE in statistics:
+
+        squared_residuals = residuals * residuals
+
+        summary_statistics[StatisticType.RMSE] = numpy.sqrt(
+            numpy.maximum(squared_residuals.sum() - squared_residuals, 0.0) / n_subset
+        )
+
+    if StatisticType.MSE in statistics:
+        summary_statistics[StatisticType.MSE] = (residuals.sum() - residuals) / n_subset
+
+    return numpy.stack([summary_statistics[x] for x in statistics], axis=-1)
+
+
+def _jackknife_statistics(
+    measured_values, estimated_values, statistics, percentile
+) -> Tuple[numpy.ndarray, numpy.ndarray]:
+    """Computes the standard errors and (normal) confidence intervals of a set of
+    common error statistics using a leave-one-out jackknife.
+
+    Parameters
+    ----------
+    measured_values: numpy.ndarray
+        The experimentally measured values with shape=(n_data_points)
+    estimated_values: numpy.ndarray
+        The computationally estimated values with shape=(n_data_points)
+    statistics: list of StatisticType
+        The statistics to compute.
+    percentile: float
+        The percentile of the confidence interval to calculate.
+
+    Returns
+    -------
+        The standard errors with shape=(n_statistics) and the confidence intervals
+        with shape=(n_statistics, 2).
+    """
+
+    n_data_points = len(measured_values)
+
+    values, _ = _compute_statistics(measured_values, estimated_values, statistics)
+
+    if n_data_points < 2:
+        return numpy.zeros(len(statistics)), numpy.stack([values, values], axis=-1)
+
+    subset_statistics = _leave_one_out_statistics(
+        measured_values, estimated_values, statistics
+    )
+
+    standard_errors = numpy.sqrt(
+        (n_data_points - 1)
+        / n_data_points
+        * ((subset_statistics - subset_statistics.mean(axis=0)) ** 2).sum(axis=0)
+    )
+
+    z = _normal_quantile(percentile)
+
+    lower_bounds = values - z * standard_errors
+    upper_bounds = values + z * standard_errors
+
+    # Make sure the bounds remain within the domain of each statistic.
+    for statistic_index, statistic in enumerate(statistics):
+
+        if statistic == StatisticType.R2:
+            lower_bounds[statistic_index] = max(0.0, lower_bounds[statistic_index])
+            upper_bounds[statistic_index] = min(1.0, upper_bounds[statistic_index])
+        elif statistic == StatisticType.RMSE:
+            lower_bounds[statistic_index] = max(0.0, lower_bounds[statistic_index])
+
+    return standard_errors, numpy.stack([lower_bounds, upper_bounds], axis=-1)
+
+
+_CONFIDENCE_INTERVAL_ESTIMATORS = {
+    ConfidenceIntervalMethod.Analytic: _analytic_statistics,
+    ConfidenceIntervalMethod.Jackknife: _jackknife_statistics,
+}
+
+
+def _bootstrap_group_residuals(
+    square_residuals: numpy.ndarray,
+    percentile: float,
+    bootstrap_iterations: int,
+    memory_limit: int,
+    seed_sequence: numpy.random.SeedSequence,
+    convergence_tolerance: Optional[float] = None,
+) -> Tuple[numpy.ndarray, numpy.ndarray, int]:
+    """Computes the bootstrapped standard error and confidence intervals of the
+    RMSE of a single group of squared residuals using its own random stream.
+
+    Returns
+    -------
+        The standard error, the confidence intervals and the number of bootstrap
+        iterations which were performed.
+    """
+
+    generator = numpy.random.default_rng(seed_sequence)
+    sample_count = len(square_residuals)
+
+    def draw_samples(n_iterations: int) -> numpy.ndarray:
+
+        sample_statistics = numpy.zeros(n_iterations)
+
+        batch_size = _bootstrap_batch_size(sample_count, n_iterations, memory_limit)
+
+        for batch_start in range(0, n_iterations, batch_size):
+
+            batch_end = min(batch_start + batch_size, n_iterations)
+
+            samples_indices = generator.integers(
+                0, sample_count, size=(batch_end - batch_start, sample_count)
+            )
+
+            sample_statistics[batch_start:batch_end] = numpy.sqrt(
+                square_residuals[samples_indices].mean(axis=1)
+            )
+
+        return sample_statistics
+
+    sample_statistics = _bootstrap_until_converged(
+        draw_samples, percentile, bootstrap_iterations, convergence_tolerance
+    )
+
+    return (*_summarise_samples(sample_statistics, percentile), len(sample_statistics))
+
+
+def bootstrap_grouped_residuals(
+    squared_residuals: Iterable[float],
+    offsets: Iterable[int],
+    percentile: float = 0.95,
+    bootstrap_iterations: int = 1000,
+    memory_limit: int = BOOTSTRAP_MEMORY_LIMIT,
+    random_state: RandomState = None,
+    n_processes: int = 1,
+    convergence_tolerance: Optional[float] = None,
+) -> Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+    """Computes the RMSE and associated confidence intervals of many groups of
+    squared residuals at once.
+
+    Notes
+    -----
+    The groups are stored as a single ragged array, such that the residuals of
+    group ``i`` are ``squared_residuals[offsets[i]:offsets[i + 1]]``. Each group is
+    resampled using its own random stream spawned from ``random_state`` so that the
+    results do not depend on ``n_processes``.
+
+    Parameters
+    ----------
+    squared_residuals
+        The flattened squared residuals - i.e. (ref - calc)^2 - of every group.
+    offsets
+        The offsets of each group into ``squared_residuals`` with
+        shape=(n_groups + 1). Each group must contain at least one residual.
+    percentile
+        The confidence interval percentile.
+    bootstrap_iterations
+        The number of bootstrap intervals, or the maximum number if
+        ``convergence_tolerance`` is provided.
+    memory_limit
+        The approximate maximum number of bytes to allocate for each batch of
+        bootstrap iterations.
+    random_state
+        The seed (or seed sequence) from which the random stream of each group will
+        be spawned. If `None`, fresh entropy will be pulled from the OS.
+    n_processes
+        The number of processes to distribute the groups across.
+    convergence_tolerance
+        If provided, each group will be bootstrapped in batches until its standard
+        error and confidence intervals change by less than this tolerance (in units
+        of the standard error) between batches.
+
+    Returns
+    -------
+        The average RMSE of each group with shape=(n_groups), the STD error on the
+        RMSE of each group with shape=(n_groups), the confidence intervals
+        (as defined by the provided ``percentile``) with shape=(n_groups, 2) and
+        the number of bootstrap iterations performed for each group with
+        shape=(n_groups).
+    """
+
+    square_residuals = numpy.asarray(squared_residuals, dtype=numpy.float64)
+    offsets = numpy.asarray(offsets, dtype=numpy.int64)
+
+    group_starts = offsets[:-1]
+    group_sizes = numpy.diff(offsets)
+
+    if len(group_sizes) == 0 or numpy.any(group_sizes <= 0):
+        raise ValueError("Each group must contain at least one squared residual.")
+
+    if offsets[0] != 0 or offsets[-1] != len(square_residuals):
+        raise ValueError("The offsets must span the full squared residuals array.")
+
+    # Compute the mean RMSE
+    mean = numpy.sqrt(numpy.add.reduceat(square_residuals, group_starts) / group_sizes)
+
+    # Bootstrap each group using an independent random stream.
+    seed_sequences = _to_seed_sequence(random_state).spawn(len(group_sizes))
+
+    group_results = _map_groups(
+        _bootstrap_group_residuals,
+        [
+            (
+                square_residuals[offsets[group_index] : offsets[group_index + 1]],
+                percentile,
+                bootstrap_iterations,
+                memory_limit,
+                seed_sequence,
+                convergence_tolerance,
+            )
+            for group_index, seed_sequence in enumerate(seed_sequences)
+        ],
+        n_processes,
+    )
+
+    standard_error = numpy.array([result[0] for result in group_results])
+    confidence_intervals = numpy.array([result[1] for result in group_results])
+    n_iterations = numpy.array([result[2] for result in group_results])
+
+    return mean, standard_error, confidence_intervals, n_iterations
 
 
 def bootstrap_residuals(
     squared_residuals: Iterable[float],
     percentile: float = 0.95,
     bootstrap_iterations: int = 1000,
+    random_state: RandomState = None,
 ) -> Tuple[float, float, Tuple[float, float]]:
     """A general method for computing the RMSE and associated confidence intervals
     given a list of squared residuals.
@@ -175,6 +1219,9 @@ def bootstrap_residuals(
         The confidence interval percentile.
     bootstrap_iterations
         The number of bootstrap intervals.
+    random_state
+        The seed (or seed sequence) used to draw the bootstrap samples. If `None`,
+        fresh entropy will be pulled from the OS.
 
     Returns
     -------
@@ -182,42 +1229,105 @@ def bootstrap_residuals(
         intervals (as defined by the provided ``percentile``).
     """
 
-    square_residuals = numpy.array(squared_residuals)
+    square_residuals = numpy.array(squared_residuals, dtype=numpy.float64)
 
-    # Compute the mean RMSE
-    mean = numpy.sqrt(square_residuals.sum() / len(square_residuals))
+    mean, standard_error, confidence_intervals, _ = bootstrap_grouped_residuals(
+        square_residuals,
+        [0, len(square_residuals)],
+        percentile,
+        bootstrap_iterations,
+        random_state=random_state,
+    )
 
-    # Generate the bootstrapped statistics samples.
-    sample_count = len(square_residuals)
-    sample_statistics = numpy.zeros((bootstrap_iterations, 1))
+    return (
+        mean[0],
+        standard_error[0],
+        (confidence_intervals[0, 0], confidence_intervals[0, 1]),
+    )
 
-    for sample_index in range(bootstrap_iterations):
 
-        samples_indices = numpy.random.randint(
-            low=0, high=sample_count, size=sample_count
-        )
+def compute_grouped_residual_statistics(
+    squared_residuals: Iterable[float],
+    offsets: Iterable[int],
+    percentile: float = 0.95,
+    bootstrap_iterations: int = 1000,
+    random_state: RandomState = None,
+    n_processes: int = 1,
+    convergence_tolerance: Optional[float] = None,
+    confidence_interval_method: ConfidenceIntervalMethod = (
+        ConfidenceIntervalMethod.Bootstrap
+    ),
+) -> Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+    """Computes the RMSE and associated confidence intervals of many groups of
+    squared residuals at once using a chosen confidence interval method.
+
+    Notes
+    -----
+    See ``bootstrap_grouped_residuals`` for a description of the arguments. The
+    bootstrap specific arguments are ignored unless ``confidence_interval_method``
+    is ``ConfidenceIntervalMethod.Bootstrap``.
+
+    Returns
+    -------
+        The average RMSE of each group with shape=(n_groups), the STD error on the
+        RMSE of each group with shape=(n_groups), the confidence intervals with
+        shape=(n_groups, 2) and the number of bootstrap iterations performed for
+        each group with shape=(n_groups) (`None` when not bootstrapping).
+    """
 
-        sample_square_residuals = square_residuals[samples_indices]
+    if confidence_interval_method == ConfidenceIntervalMethod.Bootstrap:
 
-        sample_statistics[sample_index] = numpy.sqrt(
-            sample_square_residuals.sum() / len(sample_square_residuals)
+        return bootstrap_grouped_residuals(
+            squared_residuals,
+            offsets,
+            percentile,
+            bootstrap_iterations,
+            random_state=random_state,
+            n_processes=n_processes,
+            convergence_tolerance=convergence_tolerance,
         )
 
-    # Compute the SEM
-    standard_error = numpy.std(sample_statistics, axis=0)[0]
+    square_residuals = numpy.asarray(squared_residuals, dtype=numpy.float64)
+    offsets = numpy.asarray(offsets, dtype=numpy.int64)
 
-    # Compute the confidence intervals.
-    lower_percentile_index = int(bootstrap_iterations * (1 - percentile) / 2)
-    upper_percentile_index = int(bootstrap_iterations * (1 + percentile) / 2)
+    group_sizes = numpy.diff(offsets)
 
-    sorted_samples = numpy.sort(sample_statistics[:, 0])
+    if len(group_sizes) == 0 or numpy.any(group_sizes <= 0):
+        raise ValueError("Each group must contain at least one squared residual.")
 
-    confidence_intervals = (
-        sorted_samples[lower_percentile_index],
-        sorted_samples[upper_percentile_index],
-    )
+    if offsets[0] != 0 or offsets[-1] != len(square_residuals):
+        raise ValueError("The offsets must span the full squared residuals array.")
+
+    # The RMSE of a set of squared residuals is equivalent to that between a set of
+    # zero 'measured' values and the square root of the residuals.
+    absolute_residuals = numpy.sqrt(square_residuals)
+
+    estimator = _CONFIDENCE_INTERVAL_ESTIMATORS[confidence_interval_method]
+
+    means = numpy.zeros(len(group_sizes))
+    standard_errors = numpy.zeros(len(group_sizes))
+    confidence_intervals = numpy.zeros((len(group_sizes), 2))
 
-    return mean, standard_error, confidence_intervals
+    for group_index in range(len(group_sizes)):
+
+        group_residuals = absolute_residuals[
+            offsets[group_index] : offsets[group_index + 1]
+        ]
+        group_zeros = numpy.zeros(len(group_residuals))
+
+        (means[group_index],), _ = _compute_statistics(
+            group_zeros, group_residuals, [StatisticType.RMSE]
+        )
+        (standard_errors[group_index],), (
+            confidence_intervals[group_index],
+        ) = estimator(group_zeros, group_residuals, [StatisticType.RMSE], percentile)
+
+    return (
+        means,
+        standard_errors,
+        confidence_intervals,
+        numpy.array([None] * len(group_sizes)),
+    )
 
 
 def compute_statistics(
@@ -227,6 +1337,7 @@ def compute_statistics(
     estimated_std,
     bootstrap_iterations,
     statistic_types,
+    random_state=None,
 ):
     """Computes a set of statistics comparing deviations of a set
     of estimated properties from the corresponding measured properties
@@ -245,6 +1356,9 @@ def compute_statistics(
         The number of bootstrap intervals to perform when computing the
         standard error and confidence intervals.
     statistic_types: list of StatisticType
+    random_state: int or numpy.random.SeedSequence or numpy.random.Generator
+        The seed or source of the random numbers used to draw the bootstrap
+        samples. If `None`, fresh entropy will be pulled from the OS.
 
     Returns
     -------
@@ -269,6 +1383,206 @@ def compute_statistics(
         estimated_std,
         statistics=statistic_types,
         bootstrap_iterations=bootstrap_iterations,
+        random_state=random_state,
     )
 
     return bootstrapped_statistics, bootstrapped_std, bootstrapped_ci
+
+
+def compute_grouped_statistics(
+    measured_values,
+    measured_std,
+    estimated_values,
+    estimated_std,
+    group_codes,
+    bootstrap_iterations: int,
+    statistic_types: List[StatisticType],
+    percentile: float = 0.95,
+    memory_limit: int = BOOTSTRAP_MEMORY_LIMIT,
+    random_state: RandomState = None,
+    n_processes: int = 1,
+    convergence_tolerance: Optional[float] = None,
+    confidence_interval_method: ConfidenceIntervalMethod = (
+        ConfidenceIntervalMethod.Bootstrap
+    ),
+) -> pandas.DataFrame:
+    """Computes a set of statistics comparing deviations of a set of estimated
+    properties from the corresponding measured properties for many groups of
+    data points at once.
+
+    Notes
+    -----
+    The values of the statistics of every group are computed together in a single
+    vectorized pass. Each group is then bootstrapped using its own random streams
+    spawned from ``random_state``, while the resampled values of all of the groups
+    are reduced together in batches whose size is chosen to respect the
+    ``memory_limit``. When ``n_processes`` is greater than one the groups are split
+    into one contiguous chunk per process, each of which is bootstrapped in this
+    way. The results for a given seed are therefore identical regardless of
+    ``n_processes`` and ``memory_limit``. A data point which belongs to multiple
+    groups should appear once per group in the input arrays.
+
+    Parameters
+    ----------
+    measured_values: numpy.ndarray
+        The measured values with shape=(n_data_points).
+    measured_std: numpy.ndarray
+        The std error in the measured values with shape=(n_data_points). Missing
+        (NaN) values will be treated as zero.
+    estimated_values: numpy.ndarray
+        The estimated values with shape=(n_data_points).
+    estimated_std: numpy.ndarray
+        The std error in the estimated values with shape=(n_data_points).
+    group_codes: numpy.ndarray
+        The non-negative integer code of the group which each data point belongs
+        to with shape=(n_data_points).
+    bootstrap_iterations: int
+        The number of bootstrap intervals to perform when computing the
+        standard error and confidence intervals, or the maximum number if
+        ``convergence_tolerance`` is provided.
+    statistic_types: list of StatisticType
+        The statistics to compute.
+    percentile: float
+        The percentile of the confidence interval to calculate.
+    memory_limit: int
+        The approximate maximum number of bytes to allocate for each batch of
+        bootstrap iterations.
+    random_state: int or numpy.random.SeedSequence
+        The seed (or seed sequence) from which the random stream of each group will
+        be spawned. If `None`, fresh entropy will be pulled from the OS.
+    n_processes: int
+        The number of processes to distribute the groups across.
+    convergence_tolerance: float, optional
+        If provided, each group will be bootstrapped in batches until the standard
+        errors and confidence intervals of its statistics change by less than this
+        tolerance (in units of the standard error) between batches.
+    confidence_interval_method: ConfidenceIntervalMethod
+        The method to use to estimate the standard errors and confidence intervals.
+        The bootstrap specific arguments are ignored for non-bootstrap methods.
+
+    Returns
+    -------
+        A tidy data frame with one row per group and statistic, and columns
+        of "Group" (the group code), "Statistic Type", "Value", "Std", "Lower CI",
+        "Upper CI" and "Iterations" (the number of bootstrap iterations performed, or
+        `None` when not bootstrapping). Groups which do not contain any data points
+        are omitted.
+    """
+
+    group_codes = numpy.asarray(group_codes, dtype=numpy.int64)
+
+    if numpy.any(group_codes < 0):
+        raise ValueError("The group codes must be non-negative.")
+
+    # Sort the data points such that each group is contiguous.
+    sorted_indices = numpy.argsort(group_codes, kind="stable")
+
+    measured_values = numpy.asarray(measured_values, dtype=numpy.float64)[
+        sorted_indices
+    ]
+    estimated_values = numpy.asarray(estimated_values, dtype=numpy.float64)[
+        sorted_indices
+    ]
+
+    measured_std = numpy.asarray(measured_std, dtype=numpy.float64)[sorted_indices]
+    measured_std = numpy.where(numpy.isnan(measured_std), 0.0, measured_std)
+    estimated_std = numpy.asarray(estimated_std, dtype=numpy.float64)[sorted_indices]
+
+    if len(group_codes) == 0:
+
+        return pandas.DataFrame(
+            columns=[
+                "Group",
+                "Statistic Type",
+                "Value",
+                "Std",
+                "Lower CI",
+                "Upper CI",
+                "Iterations",
+            ]
+        )
+
+    groups, group_starts, group_sizes = numpy.unique(
+        group_codes[sorted_indices], return_index=True, return_counts=True
+    )
+    group_ends = group_starts + group_sizes
+
+    # Compute the mean of the statistics.
+    mean_statistics, statistic_types = _compute_grouped_batched_statistics(
+        measured_values[None, :],
+        estimated_values[None, :],
+        group_starts,
+        group_sizes,
+        statistic_types,
+    )
+    mean_statistics = mean_statistics[0]
+
+    if confidence_interval_method != ConfidenceIntervalMethod.Bootstrap:
+
+        estimator = _CONFIDENCE_INTERVAL_ESTIMATORS[confidence_interval_method]
+
+        group_results = [
+            (
+                *estimator(
+                    measured_values[group_start:group_end],
+                    estimated_values[group_start:group_end],
+                    statistic_types,
+                    percentile,
+                ),
+                None,
+            )
+            for group_start, group_end in zip(group_starts, group_ends)
+        ]
+
+    else:
+
+        # Bootstrap each group using an independent random stream, vectorized
+        # across the groups in each contiguous chunk handled by a process.
+        seed_sequences = _to_seed_sequence(random_state).spawn(len(groups))
+
+        n_chunks = 1 if n_processes is None else max(1, min(n_processes, len(groups)))
+        chunks = numpy.array_split(numpy.arange(len(groups)), n_chunks)
+
+        chunk_results = _map_groups(
+            _bootstrap_group_statistics,
+            [
+                (
+                    measured_values[group_starts[chunk[0]] : group_ends[chunk[-1]]],
+                    measured_std[group_starts[chunk[0]] : group_ends[chunk[-1]]],
+                    estimated_values[group_starts[chunk[0]] : group_ends[chunk[-1]]],
+                    estimated_std[group_starts[chunk[0]] : group_ends[chunk[-1]]],
+                    group_starts[chunk] - group_starts[chunk[0]],
+                    group_sizes[chunk],
+                    statistic_types,
+                    percentile,
+                    bootstrap_iterations,
+                    memory_limit,
+                    [seed_sequences[group_index] for group_index in chunk],
+                    convergence_tolerance,
+                )
+                for chunk in chunks
+            ],
+            n_processes,
+        )
+
+        group_results = [
+            group_result
+            for chunk_result in chunk_results
+            for group_result in zip(*chunk_result)
+        ]
+
+    standard_errors = numpy.array([result[0] for result in group_results])
+    confidence_intervals = numpy.array([result[1] for result in group_results])
+    n_iterations = numpy.array([result[2] for result in group_results])
+
+    return pandas.DataFrame(
+        {
+            "Group": numpy.repeat(groups, len(statistic_types)),
+            "Statistic Type": statistic_types * len(groups),
+            "Value": mean_statistics.flatten(),
+            "Std": standard_errors.flatten(),
+            "Lower CI": confidence_intervals[:, :, 0].flatten(),
+            "Upper CI": confidence_intervals[:, :, 1].flatten(),
+            "Iterations": numpy.repeat(n_iterations, len(statistic_types)),
+        }
+    )
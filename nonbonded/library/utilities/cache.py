@@ -0,0 +1,392 @@
+"""Persistent, on-disk caches of the functional groups which `checkmol` assigns to
+molecules and of the responses returned by the RESTful API, shared between
+processes and runs."""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from typing import Dict, Iterable, Optional, Tuple, Type, TypeVar
+
+from nonbonded.library.utilities.environments import ChemicalEnvironment
+
+FunctionalGroups = Optional[Dict[ChemicalEnvironment, int]]
+
+T = TypeVar("T", bound="_SQLiteLRUCache")
+
+
+class _SQLiteLRUCache:
+    """A base class for caches which are stored in a single table of a SQLite
+    database, and which evict their least recently used entries once they grow
+    beyond ``max_size`` entries.
+
+    Notes
+    -----
+    * A single connection to the database is opened lazily and kept open for the
+      lifetime of the cache. It is shared between threads, and a new connection is
+      opened in each (e.g. forked) process so that connections are never shared
+      between processes.
+    * SQLite serializes concurrent writes, such that the same cache file may safely
+      be used by several processes at once.
+    """
+
+    #: The name of the table which stores the cached entries.
+    _TABLE_NAME: str = None
+    #: The definitions of the columns (and constraints) of the table, which must
+    #: include a ``last_accessed`` timestamp column.
+    _TABLE_COLUMNS: str = None
+
+    _instances: Dict[Tuple[Type["_SQLiteLRUCache"], str], "_SQLiteLRUCache"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, file_path: str, max_size: int):
+        """
+
+        Parameters
+        ----------
+        file_path
+            The path to the SQLite database file. It and any missing parent
+            directories will be created if they do not already exist.
+        max_size
+            The maximum number of entries to retain in the cache.
+        """
+
+        self.file_path = os.path.abspath(os.path.expanduser(file_path))
+        self.max_size = max_size
+
+        self._connection: Optional[sqlite3.Connection] = None
+        self._connection_pid: Optional[int] = None
+
+        self._lock = threading.RLock()
+
+        os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
+
+        with self._connect() as connection:
+
+            connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {self._TABLE_NAME} "
+                f"({self._TABLE_COLUMNS})"
+            )
+            connection.execute(
+                f"CREATE INDEX IF NOT EXISTS ix_{self._TABLE_NAME}_last_accessed "
+                f"ON {self._TABLE_NAME} (last_accessed)"
+            )
+
+    @classmethod
+    def _shared(cls: Type[T], file_path: str, max_size: int) -> T:
+        """Returns the instance of this cache which is shared by every caller in
+        this process for a given file, creating it if it does not yet exist."""
+
+        key = (cls, os.path.abspath(os.path.expanduser(file_path)))
+
+        with cls._instances_lock:
+
+            if key not in cls._instances:
+                cls._instances[key] = cls(file_path, max_size)
+
+            instance = cls._instances[key]
+            instance.max_size = max_size
+
+        return instance
+
+    @contextmanager
+    def _connect(self):
+        """Provides exclusive access to the connection to the cache, committing any
+        changes on exit."""
+
+        if self._connection_pid != os.getpid():
+
+            # Never re-use a connection or lock inherited from a parent process.
+            self._connection = None
+            self._connection_pid = os.getpid()
+
+            self._lock = threading.RLock()
+
+        with self._lock:
+
+            if self._connection is None:
+
+                self._connection = sqlite3.connect(
+                    self.file_path, timeout=60.0, check_same_thread=False
+                )
+
+            with self._connection:
+                yield self._connection
+
+    def _evict(self, connection: sqlite3.Connection):
+        """Removes the least recently used entries which exceed ``max_size``."""
+
+        connection.execute(
+            f"DELETE FROM {self._TABLE_NAME} WHERE rowid IN ("
+            f"SELECT rowid FROM {self._TABLE_NAME} "
+            f"ORDER BY last_accessed DESC LIMIT -1 OFFSET ?)",
+            (self.max_size,),
+        )
+
+    def clear(self):
+        """Removes all entries from the cache."""
+
+        with self._connect() as connection:
+            connection.execute(f"DELETE FROM {self._TABLE_NAME}")
+
+        with self._lock:
+            self._connection.execute("VACUUM")
+
+    def close(self):
+        """Closes the connection to the cache, if one is open. A new connection will
+        be opened the next time the cache is accessed."""
+
+        with self._lock:
+
+            if self._connection is not None and self._connection_pid == os.getpid():
+                self._connection.close()
+
+            self._connection = None
+
+
+class FunctionalGroupCache(_SQLiteLRUCache):
+    """A SQLite backed cache which maps a canonical smiles pattern to the chemical
+    environments present in the molecule it encodes.
+
+    Each entry is additionally keyed by a 'version' string which should uniquely
+    identify the tools (e.g. the version of `checkmol` and of the toolkit used to
+    generate its input) that produced it, so that entries are never re-used across
+    incompatible environments. Once the cache grows beyond ``max_size`` entries, the
+    least recently used entries are evicted.
+    """
+
+    _TABLE_NAME = "functional_groups"
+    _TABLE_COLUMNS = (
+        "smiles TEXT NOT NULL, "
+        "version TEXT NOT NULL, "
+        "groups TEXT, "
+        "last_accessed REAL NOT NULL, "
+        "PRIMARY KEY (smiles, version)"
+    )
+
+    def __init__(self, file_path: str, max_size: int = 100000):
+        super(FunctionalGroupCache, self).__init__(file_path, max_size)
+
+    @classmethod
+    def default(cls) -> "FunctionalGroupCache":
+        """Returns the cache stored in the directory specified by the
+        ``CACHE_DIRECTORY`` setting."""
+
+        from nonbonded.library.config import settings
+
+        return cls._shared(
+            os.path.join(settings.CACHE_DIRECTORY, "functional-groups.sqlite"),
+            settings.FUNCTIONAL_GROUP_CACHE_SIZE,
+        )
+
+    @staticmethod
+    def _serialize(groups: FunctionalGroups) -> Optional[str]:
+
+        if groups is None:
+            return None
+
+        return json.dumps({key.value: value for key, value in groups.items()})
+
+    @staticmethod
+    def _deserialize(groups: Optional[str]) -> FunctionalGroups:
+
+        if groups is None:
+            return None
+
+        return {
+            ChemicalEnvironment(key): value for key, value in json.loads(groups).items()
+        }
+
+    def get(self, smiles: Iterable[str], version: str) -> Dict[str, FunctionalGroups]:
+        """Retrieves the cached groups of any of a set of smiles patterns which are
+        present in the cache.
+
+        Parameters
+        ----------
+        smiles
+            The (canonical) smiles patterns to retrieve.
+        version
+            The version of the tools which generated the entries.
+
+        Returns
+        -------
+            The groups of each of the patterns which were found in the cache.
+        """
+
+        smiles = [*dict.fromkeys(smiles)]
+        found = {}
+
+        with self._connect() as connection:
+
+            # Query in batches to stay under the SQLite host parameter limit.
+            for batch_start in range(0, len(smiles), 500):
+
+                batch = smiles[batch_start : batch_start + 500]
+                placeholders = ", ".join("?" * len(batch))
+
+                rows = connection.execute(
+                    f"SELECT smiles, groups FROM {self._TABLE_NAME} "
+                    f"WHERE version = ? AND smiles IN ({placeholders})",
+                    (version, *batch),
+                ).fetchall()
+
+                found.update(
+                    (pattern, self._deserialize(groups)) for pattern, groups in rows
+                )
+
+            if len(found) > 0:
+
+                connection.executemany(
+                    f"UPDATE {self._TABLE_NAME} SET last_accessed = ? "
+                    f"WHERE smiles = ? AND version = ?",
+                    [(time.time(), pattern, version) for pattern in found],
+                )
+
+        return found
+
+    def set(self, groups: Dict[str, FunctionalGroups], version: str):
+        """Stores the groups of a set of smiles patterns in the cache, evicting the
+        least recently used entries if the cache grows too large.
+
+        Parameters
+        ----------
+        groups
+            The groups to store, keyed by their (canonical) smiles pattern.
+        version
+            The version of the tools which generated the entries.
+        """
+
+        if len(groups) == 0:
+            return
+
+        with self._connect() as connection:
+
+            connection.executemany(
+                f"INSERT OR REPLACE INTO {self._TABLE_NAME} "
+                f"(smiles, version, groups, last_accessed) VALUES (?, ?, ?, ?)",
+                [
+                    (pattern, version, self._serialize(value), time.time())
+                    for pattern, value in groups.items()
+                ],
+            )
+
+            self._evict(connection)
+
+    def info(self) -> Tuple[int, Dict[str, int]]:
+        """Returns the size of the cache file in bytes and the number of entries
+        stored for each tool version."""
+
+        with self._connect() as connection:
+
+            counts = dict(
+                connection.execute(
+                    f"SELECT version, COUNT(*) FROM {self._TABLE_NAME} "
+                    f"GROUP BY version"
+                ).fetchall()
+            )
+
+        return os.path.getsize(self.file_path), counts
+
+
+class ResponseCache(_SQLiteLRUCache):
+    """A SQLite backed cache of the responses returned by the RESTful API, keyed by
+    the URL which was requested.
+
+    Each response is stored alongside the ETag which the API assigned to it so that
+    it can be cheaply revalidated using a conditional request, rather than being
+    downloaded again in full. Once the cache grows beyond ``max_size`` entries, the
+    least recently used entries are evicted.
+    """
+
+    _TABLE_NAME = "responses"
+    _TABLE_COLUMNS = (
+        "url TEXT NOT NULL PRIMARY KEY, "
+        "etag TEXT NOT NULL, "
+        "body BLOB NOT NULL, "
+        "last_accessed REAL NOT NULL"
+    )
+
+    def __init__(self, file_path: str, max_size: int = 1000):
+        super(ResponseCache, self).__init__(file_path, max_size)
+
+    @classmethod
+    def default(cls) -> "ResponseCache":
+        """Returns the cache stored in the directory specified by the
+        ``CACHE_DIRECTORY`` setting."""
+
+        from nonbonded.library.config import settings
+
+        return cls._shared(
+            os.path.join(settings.CACHE_DIRECTORY, "responses.sqlite"),
+            settings.RESPONSE_CACHE_SIZE,
+        )
+
+    def get(self, url: str) -> Optional[Tuple[str, str]]:
+        """Retrieves a cached response.
+
+        Parameters
+        ----------
+        url
+            The (full) URL which was requested.
+
+        Returns
+        -------
+            The ETag and body of the cached response if present, otherwise
+            ``None``.
+        """
+
+        with self._connect() as connection:
+
+            row = connection.execute(
+                f"SELECT etag, body FROM {self._TABLE_NAME} WHERE url = ?", (url,)
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            connection.execute(
+                f"UPDATE {self._TABLE_NAME} SET last_accessed = ? WHERE url = ?",
+                (time.time(), url),
+            )
+
+        etag, body = row
+        return etag, zlib.decompress(body).decode()
+
+    def set(self, url: str, etag: str, body: str):
+        """Stores a response in the cache, evicting the least recently used
+        responses if the cache grows too large.
+
+        Parameters
+        ----------
+        url
+            The (full) URL which was requested.
+        etag
+            The ETag which the API assigned to the response.
+        body
+            The body of the response.
+        """
+
+        with self._connect() as connection:
+
+            connection.execute(
+                f"INSERT OR REPLACE INTO {self._TABLE_NAME} "
+                f"(url, etag, body, last_accessed) VALUES (?, ?, ?, ?)",
+                (url, etag, zlib.compress(body.encode()), time.time()),
+            )
+
+            self._evict(connection)
+
+    def info(self) -> Tuple[int, int]:
+        """Returns the size of the cache file in bytes and the number of responses
+        stored in it."""
+
+        with self._connect() as connection:
+
+            (count,) = connection.execute(
+                f"SELECT COUNT(*) FROM {self._TABLE_NAME}"
+            ).fetchone()
+
+        return os.path.getsize(self.file_path), count
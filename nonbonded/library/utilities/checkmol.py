@@ -1,12 +1,39 @@
 import functools
 import logging
-from typing import List
+import shutil
+import subprocess
+import tempfile
+from collections import OrderedDict
+from enum import Enum
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
 from nonbonded.library.models.datasets import Component
-from nonbonded.library.utilities.environments import ChemicalEnvironment
+from nonbonded.library.utilities.cache import FunctionalGroupCache
+from nonbonded.library.utilities.environments import (
+    ChemicalEnvironment,
+    environments_to_mask,
+    mask_to_environments,
+)
+from nonbonded.library.utilities.molecules import canonical_smiles
+from nonbonded.library.utilities.smarts import analyse_smarts_groups
+
+if TYPE_CHECKING:
+    from openff.toolkit.topology import Molecule
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 def checkmol_code_to_environment(checkmol_code) -> ChemicalEnvironment:
 
@@ -220,10 +247,495 @@ def checkmol_code_to_environment(checkmol_code) -> ChemicalEnvironment:
     return checkmol_code_map[checkmol_code]
 
 
-@functools.lru_cache(1000)
+class FunctionalGroupBackend(Enum):
+    """The engines available for identifying the functional groups in a molecule."""
+
+    Checkmol = "checkmol"
+    SMARTS = "smarts"
+
+
+#: The default maximum number of molecules to pass to a single `checkmol` call.
+CHECKMOL_CHUNK_SIZE = 500
+
+# The elements which may appear in a molecule which is analysed in a batch. Molecules
+# containing other elements (e.g. metals) may be assigned the organometallic groups
+# which are used to separate the records of a batch, and so are analysed on their own.
+_BATCHABLE_ELEMENTS = {"H", "B", "C", "N", "O", "F", "P", "S", "Cl", "Br", "I"}
+
+# A methyl lithium record is placed after each molecule in a batch. Its organolithium
+# group marks the end of the output of the preceding molecule.
+_SEPARATOR_SMILES = "[Li]C"
+_SEPARATOR_CODES = {"072", "073"}
+_SEPARATOR_END_CODE = "073"
+
+# An in-memory LRU cache which sits on top of the persistent functional group cache,
+# and which stores the groups of each molecule alongside their environment mask.
+_MEMORY_CACHE_SIZE = 1000
+_functional_group_cache = OrderedDict()
+
+
+def _with_mask(
+    groups: Optional[Dict[ChemicalEnvironment, int]],
+) -> Tuple[Optional[Dict[ChemicalEnvironment, int]], int]:
+    """Pairs a set of functional groups with their ``environments_to_mask`` mask."""
+    return groups, 0 if groups is None else environments_to_mask(groups)
+
+
+def _require_checkmol():
+    """Raises an exception if the checkmol utility has not been installed."""
+
+    if shutil.which("checkmol") is None:
+
+        raise FileNotFoundError(
+            "checkmol was not found on this machine. Visit http://merian.pch.univie.ac."
+            "at/~nhaider/cheminf/cmmm.html to obtain it."
+        )
+
+
+def _parse_checkmol_output(
+    output_lines: List[str],
+) -> Dict[ChemicalEnvironment, int]:
+    """Converts the lines written by `checkmol -p` for a single molecule into a
+    dictionary of chemical environments."""
+
+    if len(output_lines) == 0:
+        return {ChemicalEnvironment.Alkane: 1}
+
+    groups = {}
+
+    for group in output_lines:
+
+        group_code, group_count, _ = group.split(":")
+
+        group_environment = checkmol_code_to_environment(group_code[1:])
+        groups[group_environment] = int(group_count)
+
+    return groups
+
+
+def _run_checkmol(molecules: List["Molecule"]) -> Optional[str]:
+    """Writes a set of molecules to a (multi-record) SDF file and runs `checkmol`
+    over it, returning the raw output or ``None`` if `checkmol` failed."""
+
+    with tempfile.NamedTemporaryFile(suffix=".sdf", mode="w") as file:
+
+        for molecule in molecules:
+            molecule.to_file(file, "SDF")
+
+        file.flush()
+
+        try:
+
+            return subprocess.check_output(
+                ["checkmol", "-p", file.name],
+                stderr=subprocess.STDOUT,
+            ).decode()
+
+        except subprocess.CalledProcessError:
+            return None
+
+
+def _split_batch_output(output: str, n_molecules: int) -> Optional[List[List[str]]]:
+    """Splits the output of running `checkmol` over a batch of molecules, each of
+    which was followed by a separator record, into the lines of each molecule.
+
+    Returns
+    -------
+        The output lines of each molecule, or ``None`` if the output could not be
+        split into the expected number of molecules.
+    """
+
+    molecule_lines = []
+    current_lines = []
+
+    for line in output.splitlines():
+
+        group_code = line.split(":")[0][1:]
+
+        if group_code not in _SEPARATOR_CODES:
+
+            current_lines.append(line)
+            continue
+
+        if group_code == _SEPARATOR_END_CODE:
+
+            molecule_lines.append(current_lines)
+            current_lines = []
+
+    if len(molecule_lines) != n_molecules or len(current_lines) > 0:
+        return None
+
+    return molecule_lines
+
+
+def _analyse_molecule(molecule: "Molecule") -> Optional[Dict[ChemicalEnvironment, int]]:
+    """Runs `checkmol` over a single molecule."""
+
+    result = _run_checkmol([molecule])
+    return None if result is None else _parse_checkmol_output(result.splitlines())
+
+
+def _analyse_chunk(
+    molecules: List["Molecule"], separator: "Molecule"
+) -> List[Optional[Dict[ChemicalEnvironment, int]]]:
+    """Runs `checkmol` once over a chunk of molecules, falling back to running it
+    over each molecule in turn if the combined output could not be attributed to
+    the individual molecules (e.g. because one of them could not be processed)."""
+
+    if len(molecules) == 1:
+        return [_analyse_molecule(molecules[0])]
+
+    output = _run_checkmol(
+        [record for molecule in molecules for record in (molecule, separator)]
+    )
+    molecule_lines = (
+        None if output is None else _split_batch_output(output, len(molecules))
+    )
+
+    if molecule_lines is None:
+
+        logger.debug(
+            "The batched checkmol output could not be split into individual "
+            "molecules. The molecules will be analysed one at a time instead."
+        )
+        return [_analyse_molecule(molecule) for molecule in molecules]
+
+    return [_parse_checkmol_output(lines) for lines in molecule_lines]
+
+
+@functools.lru_cache()
+def checkmol_version() -> str:
+    """Returns a string which identifies the versions of `checkmol`, of the toolkit
+    used to generate its input and of RDKit (which defines the canonical smiles
+    patterns), which is used to key cached analyses."""
+
+    import openff.toolkit
+    import rdkit
+
+    _require_checkmol()
+
+    # checkmol does not provide a version flag, but reports its version in the
+    # header of its help text.
+    help_text = subprocess.run(
+        ["checkmol", "-h"], stdout=subprocess.PIPE, stderr=subprocess.STDOUT
+    ).stdout.decode()
+
+    version_lines = [
+        line.strip() for line in help_text.splitlines() if "version" in line.lower()
+    ]
+    version = "unknown" if len(version_lines) == 0 else version_lines[0]
+
+    return (
+        f"checkmol={version};"
+        f"openff-toolkit={openff.toolkit.__version__};"
+        f"rdkit={rdkit.__version__}"
+    )
+
+
+def _analyse_molecules(
+    molecules: Dict[str, "Molecule"], chunk_size: int
+) -> Dict[str, Optional[Dict[ChemicalEnvironment, int]]]:
+    """Runs `checkmol` over a set of molecules, batching them into chunks of at most
+    ``chunk_size`` molecules where possible."""
+
+    from openff.toolkit.topology import Molecule
+
+    groups = {}
+
+    batchable_keys = [
+        key
+        for key, molecule in molecules.items()
+        if all(atom.element.symbol in _BATCHABLE_ELEMENTS for atom in molecule.atoms)
+    ]
+    batchable_set = {*batchable_keys}
+
+    for key, molecule in molecules.items():
+
+        if key not in batchable_set:
+            groups[key] = _analyse_molecule(molecule)
+
+    separator = (
+        None if len(batchable_keys) == 0 else Molecule.from_smiles(_SEPARATOR_SMILES)
+    )
+
+    for chunk_start in range(0, len(batchable_keys), chunk_size):
+
+        chunk_keys = batchable_keys[chunk_start : chunk_start + chunk_size]
+        chunk_groups = _analyse_chunk([molecules[key] for key in chunk_keys], separator)
+
+        groups.update(zip(chunk_keys, chunk_groups))
+
+    return groups
+
+
+def _analyse_smiles(
+    smiles: List[str], chunk_size: int
+) -> Dict[str, Optional[Dict[ChemicalEnvironment, int]]]:
+    """Runs `checkmol` over the molecules encoded by a list of smiles patterns."""
+
+    from openff.toolkit.topology import Molecule
+
+    return _analyse_molecules(
+        {
+            pattern: Molecule.from_smiles(pattern, allow_undefined_stereo=True)
+            for pattern in smiles
+        },
+        chunk_size,
+    )
+
+
+def _map_chunks(
+    function: Callable[[List[str]], T],
+    smiles: List[str],
+    chunk_size: int,
+    n_processes: int,
+) -> List[T]:
+    """Applies a function to chunks of a list of smiles patterns across a pool of
+    processes, such that the work is spread evenly across all of the workers."""
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    if len(smiles) == 0:
+        return []
+
+    chunk_size = min(chunk_size, -(-len(smiles) // n_processes))
+
+    chunks = [
+        smiles[chunk_start : chunk_start + chunk_size]
+        for chunk_start in range(0, len(smiles), chunk_size)
+    ]
+
+    with ProcessPoolExecutor(max_workers=min(n_processes, len(chunks))) as executor:
+        return [*executor.map(function, chunks)]
+
+
+def _analyse_with_checkmol(
+    uncached_smiles: List[str],
+    chunk_size: int,
+    cache: Optional[FunctionalGroupCache],
+    n_processes: int,
+) -> Dict[str, Optional[Dict[ChemicalEnvironment, int]]]:
+    """Analyses a set of canonical smiles patterns using `checkmol`, re-using any
+    analyses stored in the persistent cache."""
+
+    from nonbonded.library.config import settings
+
+    # Make sure the checkmol utility has been installed separately.
+    _require_checkmol()
+
+    if cache is None and settings.FUNCTIONAL_GROUP_CACHE_SIZE > 0:
+        cache = FunctionalGroupCache.default()
+
+    version = checkmol_version()
+
+    groups = {} if cache is None else cache.get(uncached_smiles, version)
+
+    unanalysed_smiles = [
+        pattern for pattern in uncached_smiles if pattern not in groups
+    ]
+
+    if n_processes == 1:
+
+        analysed_groups = _analyse_smiles(unanalysed_smiles, chunk_size)
+
+    else:
+
+        analysed_groups = {
+            pattern: value
+            for chunk in _map_chunks(
+                functools.partial(_analyse_smiles, chunk_size=chunk_size),
+                unanalysed_smiles,
+                chunk_size,
+                n_processes,
+            )
+            for pattern, value in chunk.items()
+        }
+
+    if cache is not None:
+
+        # Failed analyses are only kept in memory, as checkmol may have failed for a
+        # transient reason (e.g. having been killed) rather than the molecule.
+        cache.set(
+            {
+                pattern: value
+                for pattern, value in analysed_groups.items()
+                if value is not None
+            },
+            version,
+        )
+
+    groups.update(analysed_groups)
+    return groups
+
+
+def _analyse_with_smarts(
+    uncached_smiles: List[str], chunk_size: int, n_processes: int
+) -> Dict[str, Optional[Dict[ChemicalEnvironment, int]]]:
+    """Analyses a set of smiles patterns using the in-process SMARTS engine."""
+
+    if n_processes == 1:
+        return dict(zip(uncached_smiles, analyse_smarts_groups(uncached_smiles)))
+
+    return dict(
+        zip(
+            uncached_smiles,
+            (
+                value
+                for chunk in _map_chunks(
+                    analyse_smarts_groups, uncached_smiles, chunk_size, n_processes
+                )
+                for value in chunk
+            ),
+        )
+    )
+
+
+def _analyse_functional_groups_batch(
+    smiles: Iterable[str],
+    chunk_size: int,
+    cache: Optional[FunctionalGroupCache],
+    n_processes: int,
+    backend: Optional[FunctionalGroupBackend],
+) -> Dict[str, Tuple[Optional[Dict[ChemicalEnvironment, int]], int]]:
+    """The implementation of ``analyse_functional_groups_batch``, which returns both
+    the groups of each pattern and the ``environments_to_mask`` mask of those groups.
+    Both are stored together in the in-memory cache so that each mask need only be
+    computed once per molecule."""
+
+    from nonbonded.library.config import settings
+
+    if backend is None:
+        backend = FunctionalGroupBackend(settings.FUNCTIONAL_GROUP_BACKEND)
+
+    smiles = [*dict.fromkeys(smiles)]
+
+    # Key all of the caches by canonical smiles so that different patterns which
+    # encode the same molecule share entries.
+    canonical_patterns = {pattern: canonical_smiles(pattern) for pattern in smiles}
+    unique_patterns = [*dict.fromkeys(canonical_patterns.values())]
+
+    groups = {}
+
+    for pattern in unique_patterns:
+
+        if pattern == "O":
+            groups[pattern] = _with_mask({ChemicalEnvironment.Aqueous: 1})
+        elif pattern == "N":
+            groups[pattern] = _with_mask({ChemicalEnvironment.Amine: 1})
+        elif (backend, pattern) in _functional_group_cache:
+            _functional_group_cache.move_to_end((backend, pattern))
+            groups[pattern] = _functional_group_cache[(backend, pattern)]
+
+    uncached_smiles = [pattern for pattern in unique_patterns if pattern not in groups]
+
+    if len(uncached_smiles) > 0:
+
+        if backend == FunctionalGroupBackend.SMARTS:
+
+            uncached_groups = _analyse_with_smarts(
+                uncached_smiles, chunk_size, n_processes
+            )
+
+        else:
+
+            uncached_groups = _analyse_with_checkmol(
+                uncached_smiles, chunk_size, cache, n_processes
+            )
+
+        for pattern in uncached_smiles:
+
+            groups[pattern] = _with_mask(uncached_groups[pattern])
+            _functional_group_cache[(backend, pattern)] = groups[pattern]
+
+        while len(_functional_group_cache) > _MEMORY_CACHE_SIZE:
+            _functional_group_cache.popitem(last=False)
+
+    return {pattern: groups[canonical_patterns[pattern]] for pattern in smiles}
+
+
+def analyse_functional_groups_batch(
+    smiles: Iterable[str],
+    chunk_size: int = CHECKMOL_CHUNK_SIZE,
+    cache: Optional[FunctionalGroupCache] = None,
+    n_processes: int = 1,
+    backend: Optional[FunctionalGroupBackend] = None,
+) -> Dict[str, Optional[Dict[ChemicalEnvironment, int]]]:
+    """Determines which chemical moieties are encoded by each of a set of smiles
+    patterns.
+
+    When using the `checkmol` backend, rather than starting a `checkmol` process per
+    pattern, all of the patterns which have not previously been analysed are written
+    to a single multi-record SDF file (one per ``chunk_size`` patterns) and
+    `checkmol` is run once over each file. These analyses are cached both in memory
+    and in a persistent, on-disk cache keyed by canonical smiles pattern and the
+    ``checkmol_version``.
+
+    The SMARTS backend instead matches each molecule against a pre-compiled table of
+    SMARTS patterns in process (see ``nonbonded.library.utilities.smarts``). It
+    does not require `checkmol` to be installed, but only supports a subset of the
+    chemical environments.
+
+    Parameters
+    ----------
+    smiles
+        The smiles patterns to examine.
+    chunk_size
+        The maximum number of molecules to pass to a single `checkmol` call, or to
+        a single worker process.
+    cache
+        The persistent cache to use. If ``None``, the default cache will be used
+        unless the ``FUNCTIONAL_GROUP_CACHE_SIZE`` setting is zero.
+    n_processes
+        The number of processes to distribute the parsing and analysis of the
+        molecules across.
+    backend
+        The engine to use to identify the moieties. If ``None``, the engine specified
+        by the ``FUNCTIONAL_GROUP_BACKEND`` setting will be used.
+
+    Returns
+    -------
+        A dictionary of the chemical moieties present in each smiles pattern, in the
+        format returned by ``analyse_functional_groups``.
+    """
+
+    return {
+        pattern: groups
+        for pattern, (groups, _) in _analyse_functional_groups_batch(
+            smiles, chunk_size, cache, n_processes, backend
+        ).items()
+    }
+
+
+def analyse_environment_masks_batch(
+    smiles: Iterable[str],
+    chunk_size: int = CHECKMOL_CHUNK_SIZE,
+    cache: Optional[FunctionalGroupCache] = None,
+    n_processes: int = 1,
+    backend: Optional[FunctionalGroupBackend] = None,
+) -> Dict[str, int]:
+    """Determines which chemical moieties are encoded by each of a set of smiles
+    patterns, encoded as an ``environments_to_mask`` bitmask.
+
+    See ``analyse_functional_groups_batch`` for details about the parameters. A
+    pattern which could not be analysed is assigned an empty (i.e. zero) mask.
+
+    Returns
+    -------
+        The bitmask of the chemical moieties present in each smiles pattern.
+    """
+
+    return {
+        pattern: mask
+        for pattern, (_, mask) in _analyse_functional_groups_batch(
+            smiles, chunk_size, cache, n_processes, backend
+        ).items()
+    }
+
+
 def analyse_functional_groups(smiles):
-    """Employs checkmol to determine which chemical moieties
-    are encoded by a given smiles pattern.
+    """Employs checkmol (or the backend specified by the ``FUNCTIONAL_GROUP_BACKEND``
+    setting) to determine which chemical moieties are encoded by a given smiles
+    pattern.
 
     Notes
     -----
@@ -242,65 +754,318 @@ def analyse_functional_groups(smiles):
         number, and each value if the number of instances of that moiety. If
         `checkmol` did not execute correctly, returns None.
     """
-    import shutil
-    import subprocess
-    import tempfile
+    return analyse_functional_groups_batch([smiles])[smiles]
 
-    from openff.toolkit.topology import Molecule
 
-    if smiles == "O" or smiles == "[H]O[H]":
-        return {ChemicalEnvironment.Aqueous: 1}
-    if smiles == "N":
-        return {ChemicalEnvironment.Amine: 1}
+class CategoryCacheInfo(NamedTuple):
+    """Statistics about the usage of the ``components_to_categories`` cache."""
 
-    # Make sure the checkmol utility has been installed separately.
-    if shutil.which("checkmol") is None:
+    hits: int
+    misses: int
+    size: int
+    max_size: int
 
-        raise FileNotFoundError(
-            "checkmol was not found on this machine. Visit http://merian.pch.univie.ac."
-            "at/~nhaider/cheminf/cmmm.html to obtain it."
+
+class _CategoryCache:
+    """A bounded LRU cache of the categories assigned to a particular composition,
+    which records its hit rate."""
+
+    def __init__(self, max_size: int):
+
+        self.max_size = max_size
+
+        self.hits = 0
+        self.misses = 0
+
+        self._entries = OrderedDict()
+
+    def get(self, key) -> Optional[Tuple[str, ...]]:
+
+        if key not in self._entries:
+
+            self.misses += 1
+            return None
+
+        self.hits += 1
+
+        self._entries.move_to_end(key)
+        return self._entries[key]
+
+    def set(self, key, value: Tuple[str, ...]):
+
+        self._entries[key] = value
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def info(self) -> CategoryCacheInfo:
+        return CategoryCacheInfo(
+            self.hits, self.misses, len(self._entries), self.max_size
         )
 
-    openff_molecule: Molecule = Molecule.from_smiles(
-        smiles, allow_undefined_stereo=True
-    )
+    def clear(self):
 
-    # Save the smile pattern out as an SDF file, ready to use as input to checkmol.
-    with tempfile.NamedTemporaryFile(suffix=".sdf") as file:
+        self.hits = 0
+        self.misses = 0
 
-        openff_molecule.to_file(file.name, "SDF")
+        self._entries.clear()
 
-        # Execute checkmol.
-        try:
 
-            result = subprocess.check_output(
-                ["checkmol", "-p", file.name],
-                stderr=subprocess.STDOUT,
-            ).decode()
+_category_cache = _CategoryCache(max_size=10000)
+
+
+def category_cache_info() -> CategoryCacheInfo:
+    """Returns the number of hits and misses of the cache shared by every call to
+    ``components_to_categories``."""
+    return _category_cache.info()
 
-        except subprocess.CalledProcessError:
-            result = None
 
-    if result is None:
+def clear_category_cache():
+    """Clears the cache shared by every call to ``components_to_categories``."""
+    _category_cache.clear()
+
+
+def _is_equal_amount(amount: float) -> bool:
+    """Returns whether the mole fraction of a component of a binary mixture is
+    roughly one half, matching ``numpy.isclose(amount, 0.5, rtol=0.1)``."""
+    return abs(amount - 0.5) <= 1.0e-8 + 0.1 * 0.5
+
+
+def _mixture_amount_bucket(
+    components: List[Component],
+) -> Optional[Tuple[bool, bool, bool]]:
+    """Returns the properties of the mole fractions of a binary mixture which
+    determine the categories assigned to it, namely whether the components are in
+    roughly equal amounts and which (if either) is in excess."""
+
+    if len(components) != 2 or any(x.exact_amount != 0 for x in components):
         return None
-    elif len(result) == 0:
-        return {ChemicalEnvironment.Alkane: 1}
 
-    groups = {}
+    amount_1, amount_2 = components[0].mole_fraction, components[1].mole_fraction
 
-    for group in result.splitlines():
+    return (
+        _is_equal_amount(amount_1) and _is_equal_amount(amount_2),
+        amount_1 < amount_2,
+        amount_2 < amount_1,
+    )
 
-        group_code, group_count, _ = group.split(":")
 
-        group_environment = checkmol_code_to_environment(group_code[1:])
-        groups[group_environment] = int(group_count)
+def _mixture_amount_buckets(
+    components: List[List[Component]],
+) -> List[Optional[Tuple[bool, bool, bool]]]:
+    """A vectorized version of ``_mixture_amount_bucket`` which computes the amount
+    buckets of a whole column of compositions at once."""
 
-    return groups
+    import numpy
+
+    is_mixture = [
+        len(composition) == 2 and all(x.exact_amount == 0 for x in composition)
+        for composition in components
+    ]
+
+    amounts = numpy.array(
+        [
+            [x.mole_fraction for x in composition] if mixture else [0.0, 0.0]
+            for composition, mixture in zip(components, is_mixture)
+        ],
+        dtype=float,
+    ).reshape(-1, 2)
+
+    buckets = zip(
+        (numpy.abs(amounts - 0.5) <= 1.0e-8 + 0.1 * 0.5).all(axis=1).tolist(),
+        (amounts[:, 0] < amounts[:, 1]).tolist(),
+        (amounts[:, 1] < amounts[:, 0]).tolist(),
+    )
+
+    return [bucket if mixture else None for bucket, mixture in zip(buckets, is_mixture)]
+
+
+@functools.lru_cache(4096)
+def _mask_to_labels(mask: int) -> Tuple[str, ...]:
+    """Decodes an environment mask into the sorted labels of its environments, or
+    into 'Other' if the mask is empty."""
+
+    if mask == 0:
+        return ("Other",)
+
+    return tuple(
+        sorted(environment.value for environment in mask_to_environments(mask))
+    )
+
+
+@functools.lru_cache(4096)
+def _masks_to_categories(
+    masks: Tuple[int, ...],
+    exact_amounts: Tuple[int, ...],
+    amount_bucket: Optional[Tuple[bool, bool, bool]],
+) -> Tuple[str, ...]:
+    """Assigns categories to a composition based on the environment masks of its
+    components, which should already be filtered by the environments of interest.
+
+    Parameters
+    ----------
+    masks
+        The environment mask of each component.
+    exact_amounts
+        The exact amount of each component.
+    amount_bucket
+        The amount bucket (see ``_mixture_amount_bucket``) of the composition if it
+        is a binary mixture.
+    """
+
+    # Handle the simple case of a single component.
+    if len(masks) == 1:
+        return _mask_to_labels(masks[0])
+
+    labels_1, labels_2 = _mask_to_labels(masks[0]), _mask_to_labels(masks[1])
+
+    categories = set()
+
+    # Handle the case of two components in a binary mixture
+    if amount_bucket is not None:
+
+        is_equal_amount, is_less, is_greater = amount_bucket
+
+        # The environments shared by both components.
+        shared_mask = masks[0] & masks[1]
+
+        categories.update(
+            f"{label} + {label}"
+            for label in (
+                _mask_to_labels(shared_mask)
+                if shared_mask != 0 or masks[0] == masks[1]
+                else ()
+            )
+        )
+
+        for label_1 in labels_1:
+
+            for label_2 in labels_2:
+
+                if label_1 == label_2:
+                    continue
+
+                if is_equal_amount:
+                    sign_str = "~"
+                elif is_less if label_1 < label_2 else is_greater:
+                    sign_str = "<"
+                else:
+                    sign_str = ">"
+
+                categories.add(
+                    f"{min(label_1, label_2)} {sign_str} {max(label_1, label_2)}"
+                )
+
+    # Handle the case of a single molecule in solution.
+    else:
+
+        solute_index = 0 if exact_amounts[0] > 0 else 1
+
+        solute_labels = labels_1 if solute_index == 0 else labels_2
+        solvent_labels = labels_2 if solute_index == 0 else labels_1
+
+        categories.update(
+            f"{solvent_label} "
+            f"(x=1.0) "
+            f"+ "
+            f"{solute_label} "
+            f"(n={exact_amounts[solute_index]})"
+            for solvent_label in solvent_labels
+            for solute_label in solute_labels
+        )
+
+    return tuple(sorted(categories))
+
+
+def _categorize(
+    components: List[Component],
+    masks: List[int],
+    environments_mask: int,
+    amount_bucket: Optional[Tuple[bool, bool, bool]],
+) -> Tuple[str, ...]:
+    """Filters the environment masks of a (sorted) list of components by the
+    environments of interest before assigning them categories."""
+
+    masks = tuple(mask & environments_mask for mask in masks)
+
+    for component, mask in zip(components, masks):
+
+        if mask != 0:
+            continue
+
+        logger.info(
+            f"No chemical environments could be identified for the component with "
+            f"SMILES={component.smiles}. More than likely the environments which it "
+            f"does contain are not marked for analysis, and hence were ignored. It "
+            f"will be assigned an environment of 'Other' instead."
+        )
+
+    return _masks_to_categories(
+        masks, tuple(x.exact_amount for x in components), amount_bucket
+    )
+
+
+def _component_masks(
+    components: List[Component],
+    functional_groups: Optional[Dict[str, Optional[Dict[ChemicalEnvironment, int]]]],
+) -> List[int]:
+    """Returns the ``environments_to_mask`` mask of each of a list of components,
+    taking the groups from a table of pre-computed functional groups where
+    available."""
+
+    uncached_smiles = [
+        component.smiles
+        for component in components
+        if functional_groups is None or component.smiles not in functional_groups
+    ]
+    masks = analyse_environment_masks_batch(uncached_smiles)
+
+    for component in components:
+
+        if component.smiles in masks:
+            continue
+
+        masks[component.smiles] = _with_mask(functional_groups[component.smiles])[1]
+
+    return [masks[component.smiles] for component in components]
+
+
+def _sort_components(components: List[Component]) -> List[Component]:
+    """Sorts a list of components into the order in which they are categorized. The
+    categories are independent of the order of the components, so they are sorted
+    to maximise the number of cache hits."""
+    return sorted(
+        components, key=lambda x: (canonical_smiles(x.smiles), x.exact_amount)
+    )
+
+
+def _category_cache_key(
+    components: List[Component],
+    environments_mask: int,
+    amount_bucket: Optional[Tuple[bool, bool, bool]],
+) -> tuple:
+    """Returns the key of the categories of a (sorted) list of components in the
+    category cache."""
+
+    from nonbonded.library.config import settings
+
+    return (
+        tuple(
+            (canonical_smiles(component.smiles), component.exact_amount)
+            for component in components
+        ),
+        amount_bucket,
+        environments_mask,
+        settings.FUNCTIONAL_GROUP_BACKEND,
+    )
 
 
 def components_to_categories(
     components: List[Component],
     environments: List[ChemicalEnvironment],
+    functional_groups: Optional[
+        Dict[str, Optional[Dict[ChemicalEnvironment, int]]]
+    ] = None,
 ) -> List[str]:
     """Attempts to categorize a list of components based off of the chemical
     environments that they contain.
@@ -354,98 +1119,118 @@ def components_to_categories(
         The components to categorize.
     environments
         The environments to base the category off of.
+    functional_groups
+        An optional table of pre-computed functional groups (as returned by
+        ``analyse_functional_groups_batch``) keyed by smiles pattern. Any components
+        not in the table will be analysed on demand.
     """
 
-    import numpy
-
     if len(environments) == 0:
         return []
 
     if len(components) >= 3:
         raise NotImplementedError("Only two or less components can be categorised.")
 
-    component_environments = []
+    environments_mask = environments_to_mask(environments)
 
-    for component in components:
+    components = _sort_components(components)
+    amount_bucket = _mixture_amount_bucket(components)
 
-        # Determine which environments are present in this component.
-        matched_environments = analyse_functional_groups(component.smiles)
-        # Filter out any environments which we are not interested in.
-        matched_environments = [
-            x.value for x in matched_environments if x in environments
-        ]
-
-        if len(matched_environments) == 0:
-            logger.info(
-                f"No chemical environments could be identified for the component with "
-                f"SMILES={component.smiles}. More than likely the environments which it "
-                f"does contain are not marked for analysis, and hence were ignored. It "
-                f"will be assigned an environment of 'Other' instead."
-            )
-            matched_environments = ["Other"]
+    cache_key = _category_cache_key(components, environments_mask, amount_bucket)
+    categories = _category_cache.get(cache_key)
 
-        component_environments.append(matched_environments)
+    if categories is None:
 
-    # Handle the simple case of a single component.
-    if len(components) == 1:
-        return sorted(component_environments[0])
+        categories = _categorize(
+            components,
+            _component_masks(components, functional_groups),
+            environments_mask,
+            amount_bucket,
+        )
+        _category_cache.set(cache_key, categories)
 
-    categories = set()
+    return [*categories]
 
-    environment_pairs = [
-        (environment_1, environment_2)
-        for environment_1 in component_environments[0]
-        for environment_2 in component_environments[1]
-    ]
 
-    # Handle the case of two components in a binary mixture
-    if all(component.exact_amount == 0 for component in components):
+def components_to_categories_batch(
+    components: List[List[Component]],
+    environments: List[ChemicalEnvironment],
+    n_processes: int = 1,
+) -> List[List[str]]:
+    """Categorizes a whole column of compositions at once, yielding the same
+    categories as calling ``components_to_categories`` on each in turn.
 
-        for environment_pair in environment_pairs:
+    The amount buckets of the whole column are computed in a vectorized manner, and
+    the functional groups of every component which is not already in the category
+    cache are analysed in a single batch. Each distinct composition is only looked
+    up in the category cache once, and compositions whose components share the same
+    environment masks share the same (memoized) category assignment.
 
-            if environment_pair[0] == environment_pair[1]:
+    Parameters
+    ----------
+    components
+        The components of each composition to categorize.
+    environments
+        The environments to base the categories off of.
+    n_processes
+        The number of processes to distribute the analysis of the functional groups
+        across.
+
+    Returns
+    -------
+        The categories assigned to each composition.
+    """
+
+    if len(environments) == 0:
+        return [[] for _ in components]
 
-                categories.add(f"{environment_pair[0]} + {environment_pair[1]}")
-                continue
+    if any(len(composition) >= 3 for composition in components):
+        raise NotImplementedError("Only two or less components can be categorised.")
 
-            if environment_pair[0] < environment_pair[1]:
+    environments_mask = environments_to_mask(environments)
 
-                amount_1 = components[0].mole_fraction
-                environment_1 = environment_pair[0]
-                amount_2 = components[1].mole_fraction
-                environment_2 = environment_pair[1]
+    components = [_sort_components(composition) for composition in components]
+    amount_buckets = _mixture_amount_buckets(components)
 
-            else:
+    cache_keys = [
+        _category_cache_key(composition, environments_mask, amount_bucket)
+        for composition, amount_bucket in zip(components, amount_buckets)
+    ]
 
-                amount_1 = components[1].mole_fraction
-                environment_1 = environment_pair[1]
-                amount_2 = components[0].mole_fraction
-                environment_2 = environment_pair[0]
+    categories_by_key = {}
+    uncached_indices = {}
 
-            if numpy.isclose(
-                amount_1, 1.0 / len(components), rtol=0.1
-            ) and numpy.isclose(amount_2, 1.0 / len(components), rtol=0.1):
-                sign_str = "~"
-            elif amount_1 < amount_2:
-                sign_str = "<"
-            else:
-                sign_str = ">"
+    for index, cache_key in enumerate(cache_keys):
 
-            categories.add(f"{environment_1} {sign_str} {environment_2}")
+        if cache_key in categories_by_key or cache_key in uncached_indices:
+            continue
 
-    # Handle the case of a single molecule in solution.
-    else:
+        categories = _category_cache.get(cache_key)
 
-        solute_index = 0 if components[0].exact_amount > 0 else 1
-        solvent_index = 1 - solute_index
+        if categories is None:
+            uncached_indices[cache_key] = index
+        else:
+            categories_by_key[cache_key] = categories
 
-        for environment_pair in environment_pairs:
-            categories.add(
-                f"{environment_pair[solvent_index]} "
-                f"(x=1.0) "
-                f"+ "
-                f"{environment_pair[solute_index]} "
-                f"(n={components[solute_index].exact_amount})"
-            )
+    masks = analyse_environment_masks_batch(
+        (
+            component.smiles
+            for index in uncached_indices.values()
+            for component in components[index]
+        ),
+        n_processes=n_processes,
+    )
+
+    for cache_key, index in uncached_indices.items():
+
+        categories = _categorize(
+            components[index],
+            [masks[component.smiles] for component in components[index]],
+            environments_mask,
+            amount_buckets[index],
+        )
+
+        categories_by_key[cache_key] = categories
+        _category_cache.set(cache_key, categories)
 
-    return sorted(categories)
+    return [[*categories_by_key[cache_key]] for cache_key in cache_keys]
@@ -1,4 +1,6 @@
+import functools
 from enum import Enum
+from typing import Dict, Iterable, Tuple
 
 
 class ChemicalEnvironment(Enum):
@@ -209,3 +211,42 @@ class ChemicalEnvironment(Enum):
     AlphaAminoacid = "Alpha Aminoacid"
     AlphaHydroxyacid = "Alpha Hydroxyacid"
     Aqueous = "Aqueous"
+
+
+#: The bit assigned to each chemical environment when encoding a set of environments
+#: as an integer bitmask.
+ENVIRONMENT_BITS: Dict[ChemicalEnvironment, int] = {
+    environment: 1 << index for index, environment in enumerate(ChemicalEnvironment)
+}
+
+_ENVIRONMENTS_BY_INDEX: Tuple[ChemicalEnvironment, ...] = tuple(ChemicalEnvironment)
+
+
+def environments_to_mask(environments: Iterable[ChemicalEnvironment]) -> int:
+    """Encodes a collection of chemical environments as an integer bitmask, such that
+    set operations (e.g. filtering by a set of requested environments) reduce to
+    bitwise operations."""
+
+    mask = 0
+
+    for environment in environments:
+        mask |= ENVIRONMENT_BITS[environment]
+
+    return mask
+
+
+@functools.lru_cache(4096)
+def mask_to_environments(mask: int) -> Tuple[ChemicalEnvironment, ...]:
+    """Decodes an integer bitmask into the chemical environments that it encodes, in
+    the order in which they are defined in ``ChemicalEnvironment``."""
+
+    environments = []
+
+    while mask:
+
+        lowest_bit = mask & -mask
+        environments.append(_ENVIRONMENTS_BY_INDEX[lowest_bit.bit_length() - 1])
+
+        mask ^= lowest_bit
+
+    return tuple(environments)
@@ -2,8 +2,44 @@ import functools
 import urllib.parse
 
 
-@functools.lru_cache(1000)
+@functools.lru_cache(10000)
+def canonical_smiles(smiles: str) -> str:
+    """Converts a smiles pattern into a canonical form, such that different patterns
+    which encode the same molecule (e.g. ``C(O)C``, ``CCO`` and
+    ``[H]OC([H])([H])C([H])([H])[H]``) map to the same string. Any explicit hydrogen
+    atoms are removed.
+
+    All caches keyed by molecule should use this function to normalize their keys.
+
+    Parameters
+    ----------
+    smiles
+        The smiles pattern to canonicalize.
+
+    Returns
+    -------
+        The canonical smiles pattern, or the original pattern if it could not be
+        parsed.
+    """
+
+    from rdkit import Chem, RDLogger
+
+    RDLogger.DisableLog("rdApp.*")
+
+    rdkit_molecule = Chem.MolFromSmiles(smiles)
+
+    if rdkit_molecule is None:
+        return smiles
+
+    return Chem.MolToSmiles(rdkit_molecule)
+
+
 def smiles_to_image(smiles: str):
+    return _smiles_to_image(canonical_smiles(smiles))
+
+
+@functools.lru_cache(1000)
+def _smiles_to_image(smiles: str):
 
     from rdkit import Chem
     from rdkit.Chem.Draw import rdMolDraw2D
@@ -0,0 +1,518 @@
+"""Utilities for saving models to, and loading models from, one of several on-disk
+formats.
+
+Besides the default pydantic JSON, models may be stored either as msgpack, or as
+Parquet. When stored as Parquet, the large tabular parts of a model (such as the entries
+of a data set or the result entries of a benchmark) are stored as the columns of a
+table, while the remaining (nested) metadata are stored as msgpack in the metadata of
+the table schema.
+"""
+import bz2
+import gzip
+import json
+import lzma
+import os
+from enum import Enum
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+import numpy
+
+if TYPE_CHECKING:
+    import pyarrow
+
+    from nonbonded.library.models import BaseORM
+
+T = TypeVar("T", bound="BaseORM")
+
+_FORMAT_VERSION = 1
+_METADATA_KEY = b"nonbonded"
+
+
+class SerializationFormat(Enum):
+    """The on-disk formats which models can be stored in."""
+
+    JSON = "json"
+    MsgPack = "msgpack"
+    Parquet = "parquet"
+
+
+_EXTENSIONS = {
+    ".json": SerializationFormat.JSON,
+    ".msgpack": SerializationFormat.MsgPack,
+    ".parquet": SerializationFormat.Parquet,
+}
+
+# The compression libraries which can be applied to msgpack files, and the magic bytes
+# which the files they produce begin with.
+_MSGPACK_COMPRESSION = {
+    "gzip": (gzip, b"\x1f\x8b"),
+    "bz2": (bz2, b"BZh"),
+    "lzma": (lzma, b"\xfd7zXZ"),
+}
+
+
+def format_from_extension(file_path: str) -> Optional[SerializationFormat]:
+    """Returns the format implied by the extension of a file path, or ``None`` if
+    the extension is not recognised."""
+    return _EXTENSIONS.get(os.path.splitext(file_path)[1].lower())
+
+
+def detect_format(file_path: str) -> SerializationFormat:
+    """Detects the format of an existing file from its contents.
+
+    Parameters
+    ----------
+    file_path
+        The path to the file.
+    """
+
+    with open(file_path, "rb") as file:
+        header = file.read(64)
+
+    if header.startswith(b"PAR1"):
+        return SerializationFormat.Parquet
+
+    if header.lstrip()[:1] in (b"{", b"["):
+        return SerializationFormat.JSON
+
+    return SerializationFormat.MsgPack
+
+
+def find_file(file_path: str) -> str:
+    """Returns ``file_path`` if it exists, otherwise the path to a file with the same
+    name but the extension of a different supported format if one exists.
+
+    Parameters
+    ----------
+    file_path
+        The expected path to the file, e.g. ``analysis/benchmark-results.json``.
+
+    Raises
+    ------
+    FileNotFoundError
+        If no matching file can be found.
+    """
+
+    if os.path.isfile(file_path):
+        return file_path
+
+    root, _ = os.path.splitext(file_path)
+
+    for extension in _EXTENSIONS:
+
+        if os.path.isfile(f"{root}{extension}"):
+            return f"{root}{extension}"
+
+    raise FileNotFoundError(file_path)
+
+
+def _entries_to_table(entries: List["BaseORM"]) -> "pyarrow.Table":
+    """Converts a list of data set entries into an arrow table."""
+
+    import pyarrow
+
+    from nonbonded.library.models.columnar import ColumnarDataSet
+
+    columns = ColumnarDataSet.from_entries(entries, "", "", [])
+
+    components = pyarrow.StructArray.from_arrays(
+        [
+            pyarrow.array(numpy.asarray(columns.component_smiles), pyarrow.string()),
+            pyarrow.array(columns.component_mole_fractions),
+            pyarrow.array(columns.component_exact_amounts),
+            pyarrow.array(numpy.asarray(columns.component_roles), pyarrow.string()),
+        ],
+        names=["smiles", "mole_fraction", "exact_amount", "role"],
+    )
+
+    return pyarrow.table(
+        {
+            "id": pyarrow.array(columns.ids, mask=~columns.has_id),
+            "property_type": pyarrow.DictionaryArray.from_pandas(
+                columns.property_types
+            ),
+            "temperature": columns.temperatures,
+            "pressure": columns.pressures,
+            "phase": pyarrow.DictionaryArray.from_pandas(columns.phases),
+            "value": columns.values,
+            "std_error": pyarrow.array(columns.std_errors, mask=~columns.has_std_error),
+            "doi": pyarrow.DictionaryArray.from_pandas(columns.dois),
+            "components": pyarrow.ListArray.from_arrays(
+                pyarrow.array(columns.component_offsets, pyarrow.int32()), components
+            ),
+        }
+    )
+
+
+def _table_to_entries(table: "pyarrow.Table") -> List["BaseORM"]:
+    """Converts an arrow table created by ``_entries_to_table`` back into a list of
+    data set entries."""
+
+    import pyarrow
+
+    from nonbonded.library.models.columnar import ColumnarDataSet
+
+    components = table.column("components").combine_chunks()
+    component_values: pyarrow.StructArray = components.flatten()
+
+    ids = table.column("id")
+
+    # The offsets of a sliced list array are not shifted to start from zero.
+    offsets = components.offsets.to_numpy()
+
+    return [
+        *ColumnarDataSet(
+            identifier="",
+            description="",
+            authors=[],
+            ids=ids.fill_null(-1).to_numpy(),
+            has_id=ids.is_valid().to_numpy(zero_copy_only=False),
+            property_types=table.column("property_type").to_pandas(),
+            temperatures=table.column("temperature").to_numpy(),
+            pressures=table.column("pressure").to_numpy(),
+            phases=table.column("phase").to_pandas(),
+            values=table.column("value").to_numpy(),
+            std_errors=table.column("std_error").fill_null(numpy.nan).to_numpy(),
+            dois=table.column("doi").to_pandas(),
+            component_offsets=offsets - offsets[0],
+            component_smiles=component_values.field("smiles").to_pandas(),
+            component_mole_fractions=component_values.field("mole_fraction").to_numpy(),
+            component_exact_amounts=component_values.field("exact_amount").to_numpy(),
+            component_roles=component_values.field("role").to_pandas(),
+        ).iter_entries()
+    ]
+
+
+def _result_entries_to_table(entries: List["BaseORM"]) -> "pyarrow.Table":
+    """Converts a list of data set result entries into an arrow table."""
+
+    import pyarrow
+
+    return pyarrow.table(
+        {
+            "reference_id": pyarrow.array(
+                [entry.reference_id for entry in entries], pyarrow.int64()
+            ),
+            "estimated_value": pyarrow.array(
+                [entry.estimated_value for entry in entries], pyarrow.float64()
+            ),
+            "estimated_std_error": pyarrow.array(
+                [entry.estimated_std_error for entry in entries], pyarrow.float64()
+            ),
+            "categories": pyarrow.array(
+                [entry.categories for entry in entries],
+                pyarrow.list_(pyarrow.string()),
+            ),
+        }
+    )
+
+
+def _table_to_result_entries(table: "pyarrow.Table") -> List["BaseORM"]:
+    """Converts an arrow table created by ``_result_entries_to_table`` back into a
+    list of data set result entries."""
+
+    from nonbonded.library.models.results import DataSetResultEntry
+
+    return [
+        DataSetResultEntry.construct(
+            reference_id=reference_id,
+            estimated_value=estimated_value,
+            estimated_std_error=estimated_std_error,
+            categories=categories,
+        )
+        for reference_id, estimated_value, estimated_std_error, categories in zip(
+            table.column("reference_id").to_pylist(),
+            table.column("estimated_value").to_pylist(),
+            table.column("estimated_std_error").to_pylist(),
+            table.column("categories").to_pylist(),
+        )
+    ]
+
+
+def _split_data_set(model) -> Tuple[Dict[str, Any], "pyarrow.Table"]:
+    return json.loads(model.json(exclude={"entries"})), _entries_to_table(model.entries)
+
+
+def _join_data_set(model_class, metadata, table):
+
+    model = model_class.parse_obj({**metadata, "entries": []})
+    model.entries = _table_to_entries(table)
+
+    return model
+
+
+def _split_data_set_collection(model) -> Tuple[Dict[str, Any], "pyarrow.Table"]:
+
+    metadata = json.loads(model.json(exclude={"data_sets": {"__all__": {"entries"}}}))
+
+    # Store the entries of every set in a single table rather than concatenating a
+    # table per set, whose dictionary encoded columns would need to be unified.
+    table = _entries_to_table(
+        [entry for data_set in model.data_sets for entry in data_set.entries]
+    )
+
+    # Store the number of entries in each set so that they can be split back apart.
+    metadata["n_entries"] = [len(data_set.entries) for data_set in model.data_sets]
+    return metadata, table
+
+
+def _join_data_set_collection(model_class, metadata, table):
+
+    n_entries = metadata.pop("n_entries")
+
+    model = model_class.parse_obj(
+        {
+            **metadata,
+            "data_sets": [
+                {**data_set, "entries": []} for data_set in metadata["data_sets"]
+            ],
+        }
+    )
+
+    offsets = numpy.cumsum([0, *n_entries]).tolist()
+
+    for index, data_set in enumerate(model.data_sets):
+        data_set.entries = _table_to_entries(
+            table.slice(offsets[index], n_entries[index])
+        )
+
+    return model
+
+
+def _split_benchmark_result(model) -> Tuple[Dict[str, Any], "pyarrow.Table"]:
+
+    metadata = json.loads(model.json(exclude={"data_set_result": {"result_entries"}}))
+    table = _result_entries_to_table(model.data_set_result.result_entries)
+
+    return metadata, table
+
+
+def _join_benchmark_result(model_class, metadata, table):
+
+    metadata["data_set_result"]["result_entries"] = []
+
+    model = model_class.parse_obj(metadata)
+    model.data_set_result.result_entries = _table_to_result_entries(table)
+
+    return model
+
+
+def _split_model(model) -> Tuple[Dict[str, Any], "pyarrow.Table"]:
+
+    import pyarrow
+
+    return json.loads(model.json()), pyarrow.table({})
+
+
+def _join_model(model_class, metadata, _):
+    return model_class.parse_obj(metadata)
+
+
+def _table_codecs() -> Dict[Type["BaseORM"], Tuple[Callable, Callable]]:
+    """Returns the functions which split a model into its metadata and a table of its
+    tabular parts, and which join them back together, for each model type which has
+    tabular parts."""
+
+    from nonbonded.library.models.datasets import DataSet, DataSetCollection
+    from nonbonded.library.models.results import BenchmarkResult
+
+    return {
+        DataSet: (_split_data_set, _join_data_set),
+        DataSetCollection: (_split_data_set_collection, _join_data_set_collection),
+        BenchmarkResult: (_split_benchmark_result, _join_benchmark_result),
+    }
+
+
+def _table_codec(model_class: Type["BaseORM"]) -> Tuple[Callable, Callable]:
+
+    codecs = _table_codecs()
+
+    return next(
+        (
+            codec
+            for codec_class, codec in codecs.items()
+            if issubclass(model_class, codec_class)
+        ),
+        (_split_model, _join_model),
+    )
+
+
+def _write_msgpack(model: "BaseORM", file_path: str, compression: Optional[str]):
+
+    import msgpack
+
+    contents = msgpack.packb(
+        {
+            "model": model.__class__.__name__,
+            "version": _FORMAT_VERSION,
+            "data": json.loads(model.json()),
+        }
+    )
+
+    if compression is not None:
+
+        if compression not in _MSGPACK_COMPRESSION:
+
+            raise ValueError(
+                f"msgpack files can only be compressed using one of "
+                f"{', '.join(_MSGPACK_COMPRESSION)}."
+            )
+
+        contents = _MSGPACK_COMPRESSION[compression][0].compress(contents)
+
+    with open(file_path, "wb") as file:
+        file.write(contents)
+
+
+def _read_msgpack(model_class: Type[T], file_path: str) -> T:
+
+    import msgpack
+
+    with open(file_path, "rb") as file:
+        contents = file.read()
+
+    for module, magic in _MSGPACK_COMPRESSION.values():
+
+        if contents.startswith(magic):
+            contents = module.decompress(contents)
+            break
+
+    contents = msgpack.unpackb(contents)
+    _check_header(model_class, contents)
+
+    return model_class.parse_obj(contents["data"])
+
+
+def _write_parquet(model: "BaseORM", file_path: str, compression: Optional[str]):
+
+    import msgpack
+    import pyarrow.parquet
+
+    split_function, _ = _table_codec(model.__class__)
+    metadata, table = split_function(model)
+
+    table = table.replace_schema_metadata(
+        {
+            _METADATA_KEY: msgpack.packb(
+                {
+                    "model": model.__class__.__name__,
+                    "version": _FORMAT_VERSION,
+                    "data": metadata,
+                }
+            )
+        }
+    )
+
+    pyarrow.parquet.write_table(
+        table,
+        file_path,
+        **({} if compression is None else {"compression": compression}),
+    )
+
+
+def _read_parquet(model_class: Type[T], file_path: str) -> T:
+
+    import msgpack
+    import pyarrow.parquet
+
+    table = pyarrow.parquet.read_table(file_path)
+
+    contents = msgpack.unpackb(table.schema.metadata[_METADATA_KEY])
+    _check_header(model_class, contents)
+
+    _, join_function = _table_codec(model_class)
+    return join_function(model_class, contents["data"], table)
+
+
+def _check_header(model_class: Type["BaseORM"], contents: Dict[str, Any]):
+
+    if contents.get("version") != _FORMAT_VERSION:
+        raise ValueError(
+            f"The file was written using version {contents.get('version')} of the "
+            f"file format, while only version {_FORMAT_VERSION} is supported."
+        )
+
+    if contents.get("model") != model_class.__name__:
+        raise ValueError(
+            f"The file contains a {contents.get('model')} model rather than a "
+            f"{model_class.__name__} model."
+        )
+
+
+def save_model(
+    model: "BaseORM",
+    file_path: str,
+    file_format: Optional[SerializationFormat] = None,
+    compression: Optional[str] = None,
+):
+    """Saves a model to disk.
+
+    Parameters
+    ----------
+    model
+        The model to save.
+    file_path
+        The path to save the model to.
+    file_format
+        The format to save the model in. If none is provided, it will be inferred from
+        the extension of ``file_path``, falling back to JSON for unrecognised
+        extensions.
+    compression
+        The type of compression to apply. msgpack files support ``gzip``, ``bz2`` and
+        ``lzma`` compression, while Parquet files support any of the codecs supported
+        by ``pyarrow``. JSON files cannot be compressed.
+    """
+
+    if file_format is None:
+        file_format = format_from_extension(file_path) or SerializationFormat.JSON
+
+    if file_format == SerializationFormat.JSON:
+
+        if compression is not None:
+            raise ValueError("JSON files cannot be compressed.")
+
+        with open(file_path, "w") as file:
+            file.write(model.json())
+
+    elif file_format == SerializationFormat.MsgPack:
+        _write_msgpack(model, file_path, compression)
+    elif file_format == SerializationFormat.Parquet:
+        _write_parquet(model, file_path, compression)
+    else:
+        raise NotImplementedError()
+
+
+def load_model(model_class: Type[T], file_path: str) -> T:
+    """Loads a model from disk, automatically detecting the format it was stored in.
+
+    Parameters
+    ----------
+    model_class
+        The type of model to load.
+    file_path
+        The path to the file to load. If it does not exist, a file with the same name
+        but the extension of another supported format will be loaded instead if one
+        exists.
+    """
+
+    file_path = find_file(file_path)
+    file_format = detect_format(file_path)
+
+    if file_format == SerializationFormat.JSON:
+        return model_class.parse_file(file_path)
+    elif file_format == SerializationFormat.MsgPack:
+        return _read_msgpack(model_class, file_path)
+    elif file_format == SerializationFormat.Parquet:
+        return _read_parquet(model_class, file_path)
+
+    raise NotImplementedError()
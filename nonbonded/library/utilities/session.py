@@ -0,0 +1,125 @@
+"""Utilities for creating and sharing the HTTP session used to communicate with the
+RESTful API."""
+import os
+from typing import Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from nonbonded.library.config import settings
+
+# The HTTP status codes which indicate a (likely) transient server side failure and
+# so which are worth retrying.
+_RETRY_STATUS_CODES = (500, 502, 503, 504)
+
+_session: Optional[requests.Session] = None
+_session_pid: Optional[int] = None
+
+
+class _TimeoutSession(requests.Session):
+    """A session which applies a default timeout to every request which does not
+    explicitly specify one."""
+
+    def __init__(self, timeout: Optional[float]):
+        super(_TimeoutSession, self).__init__()
+        self.timeout = timeout
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        return super(_TimeoutSession, self).request(method, url, **kwargs)
+
+
+def create_session(
+    timeout: Optional[float] = None,
+    max_retries: Optional[int] = None,
+    backoff_factor: Optional[float] = None,
+    pool_size: Optional[int] = None,
+    retry_status_codes: Tuple[int, ...] = _RETRY_STATUS_CODES,
+) -> requests.Session:
+    """Creates a new HTTP session which keeps connections alive between requests,
+    and which retries requests that fail due to connection errors or server errors
+    using an exponential back-off.
+
+    Parameters
+    ----------
+    timeout
+        The default timeout (s) of each request. Defaults to
+        ``settings.REQUEST_TIMEOUT``.
+    max_retries
+        The maximum number of times to retry a failed request. Defaults to
+        ``settings.REQUEST_MAX_RETRIES``.
+    backoff_factor
+        The factor used to compute the delay between retries, which will be
+        ``backoff_factor * 2 ** (n_retries - 1)`` seconds. Defaults to
+        ``settings.REQUEST_BACKOFF_FACTOR``.
+    pool_size
+        The maximum number of connections to keep open to any one host. Defaults to
+        ``settings.REQUEST_POOL_SIZE``.
+    retry_status_codes
+        The HTTP status codes which should be retried.
+
+    Notes
+    -----
+    * Only idempotent requests (e.g. GET, PUT and DELETE) are retried. POST
+      requests are never retried so that objects are not uploaded multiple times.
+    """
+
+    timeout = settings.REQUEST_TIMEOUT if timeout is None else timeout
+    max_retries = settings.REQUEST_MAX_RETRIES if max_retries is None else max_retries
+    backoff_factor = (
+        settings.REQUEST_BACKOFF_FACTOR if backoff_factor is None else backoff_factor
+    )
+    pool_size = settings.REQUEST_POOL_SIZE if pool_size is None else pool_size
+
+    retry = Retry(
+        total=max_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=retry_status_codes,
+        # Return the final failed response rather than raising so that callers
+        # can inspect (and log) the error returned by the server.
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        pool_block=True,
+        max_retries=retry,
+    )
+
+    session = _TimeoutSession(timeout)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    return session
+
+
+def get_session() -> requests.Session:
+    """Returns the HTTP session shared by every request made to the RESTful API
+    from this process, creating it if it does not yet exist.
+
+    A new session is created in each (e.g. forked) process so that connections are
+    never shared between processes.
+    """
+
+    global _session, _session_pid
+
+    if _session is None or _session_pid != os.getpid():
+
+        _session = create_session()
+        _session_pid = os.getpid()
+
+    return _session
+
+
+def reset_session():
+    """Closes the shared HTTP session, if one exists, such that a new session will
+    be created (e.g. using updated settings) the next time one is required."""
+
+    global _session, _session_pid
+
+    if _session is not None and _session_pid == os.getpid():
+        _session.close()
+
+    _session = None
+    _session_pid = None
@@ -0,0 +1,241 @@
+"""An in-process functional group engine which assigns chemical environments to a
+molecule by matching a table of SMARTS patterns using RDKit. It is intended as a
+fast, drop-in alternative to `checkmol` for the most commonly analysed
+environments."""
+import functools
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from nonbonded.library.utilities.environments import ChemicalEnvironment
+
+if TYPE_CHECKING:
+    from rdkit import Chem
+
+# An acyl carbon, i.e. a carbonyl carbon bonded to a carbon or hydrogen.
+_ACYL = "[CX3;$(C[#6]),$([CH1])](=[OX1])"
+# A carbonyl carbon bonded only to carbons or hydrogens, i.e. an aldehyde or ketone.
+_OXO = "[CX3;!$(C(=O)[!#6])]"
+# An amine nitrogen, i.e. one not bonded to a hetero atom or part of an amide.
+_AMINE = "NX3;!$(N[#6]=[O,S,N]);!$(N[!#6])"
+
+#: The SMARTS patterns used to identify each of the supported chemical environments.
+#: The environment hierarchy follows that of `checkmol`, such that, for example, a
+#: primary alcohol will also be assigned the 'Alcohol' and 'Hydroxy' environments.
+SMARTS_PATTERNS: Dict[ChemicalEnvironment, str] = {
+    ChemicalEnvironment.Cation: "[+;!$([#7+]~[#8-])]",
+    ChemicalEnvironment.Anion: "[-;!$([#8-]~[#7+])]",
+    ChemicalEnvironment.Carbonyl: f"{_OXO}=[OX1]",
+    ChemicalEnvironment.Aldehyde: "[CX3;$([CH2]),$([CH1][#6])]=[OX1]",
+    ChemicalEnvironment.Ketone: "[#6][CX3](=[OX1])[#6]",
+    ChemicalEnvironment.Thiocarbonyl: "[CX3;!$(C(=S)[!#6])]=[SX1]",
+    ChemicalEnvironment.Thioaldehyde: "[CX3;$([CH2]),$([CH1][#6])]=[SX1]",
+    ChemicalEnvironment.Thioketone: "[#6][CX3](=[SX1])[#6]",
+    ChemicalEnvironment.Imine: "[CX3;!$(C(=N)[!#6])]=[NX2;!$(N(=C)[!#6])]",
+    ChemicalEnvironment.Hydrazone: "[CX3]=[NX2][NX3]",
+    ChemicalEnvironment.Oxime: "[CX3]=[NX2][OX2H1]",
+    ChemicalEnvironment.OximeEther: "[CX3]=[NX2][OX2][#6]",
+    ChemicalEnvironment.Ketene: "[CX3]=[CX2]=[OX1]",
+    ChemicalEnvironment.Hemiacetal: "[CX4]([OX2H1])[OX2][#6]",
+    ChemicalEnvironment.Acetal: "[CX4]([OX2][#6])[OX2][#6]",
+    ChemicalEnvironment.Hemiaminal: "[CX4]([OX2H1])[NX3]",
+    ChemicalEnvironment.Aminal: "[CX4]([NX3])[NX3]",
+    ChemicalEnvironment.Enamine: "[CX3]=[CX3][NX3;!$(N[#6]=[O,S])]",
+    ChemicalEnvironment.Enol: "[CX3]=[CX3][OX2H1]",
+    ChemicalEnvironment.Enolether: "[CX3]=[CX3][OX2][#6]",
+    ChemicalEnvironment.Hydroxy: "[OX2H1][#6;!$([#6]=[O,S,N])]",
+    ChemicalEnvironment.Alcohol: "[OX2H1][CX4]",
+    ChemicalEnvironment.PrimaryAlcohol: "[OX2H1][CX4;H2,H3]",
+    ChemicalEnvironment.SecondaryAlcohol: "[OX2H1][CX4H1]",
+    ChemicalEnvironment.TertiaryAlcohol: "[OX2H1][CX4H0]",
+    ChemicalEnvironment.Diol_1_2: "[OX2H1][CX4][CX4][OX2H1]",
+    ChemicalEnvironment.Aminoalcohol_1_2: f"[OX2H1][CX4][CX4][{_AMINE}]",
+    ChemicalEnvironment.Phenol: "[OX2H1]c",
+    ChemicalEnvironment.Diphenol_1_2: "[OX2H1]c:c[OX2H1]",
+    ChemicalEnvironment.Enediol: "[OX2H1][CX3]=[CX3][OX2H1]",
+    ChemicalEnvironment.Ether: ("[OX2]([#6;!$([#6]=[O,S,N])])[#6;!$([#6]=[O,S,N])]"),
+    ChemicalEnvironment.Dialkylether: "[OX2]([CX4])[CX4]",
+    ChemicalEnvironment.Alkylarylether: "[OX2]([CX4])c",
+    ChemicalEnvironment.Diarylether: "[OX2](c)c",
+    ChemicalEnvironment.Thioether: (
+        "[SX2]([#6;!$([#6]=[O,S,N])])[#6;!$([#6]=[O,S,N])]"
+    ),
+    ChemicalEnvironment.Disulfide: "[#6][SX2][SX2][#6]",
+    ChemicalEnvironment.Peroxide: "[#6][OX2][OX2][#6]",
+    ChemicalEnvironment.Hydroperoxide: "[OX2][OX2H1]",
+    ChemicalEnvironment.Hydrazine: ("[NX3;!$(N[#6]=[O,S])][NX3;!$(N[#6]=[O,S])]"),
+    ChemicalEnvironment.Hydroxylamine: "[NX3;!$(N[#6]=[O,S])][OX2H1]",
+    ChemicalEnvironment.Amine: f"[{_AMINE}]",
+    ChemicalEnvironment.PrimaryAmine: f"[{_AMINE};H2][#6]",
+    ChemicalEnvironment.PrimaryAliphAmine: f"[{_AMINE};H2][CX4]",
+    ChemicalEnvironment.PrimaryAromAmine: f"[{_AMINE};H2]c",
+    ChemicalEnvironment.SecondaryAmine: f"[{_AMINE};H1]([#6])[#6]",
+    ChemicalEnvironment.SecondaryAliphAmine: f"[{_AMINE};H1]([CX4])[CX4]",
+    ChemicalEnvironment.SecondaryMixedAmine: f"[{_AMINE};H1]([CX4])c",
+    ChemicalEnvironment.SecondaryAromAmine: f"[{_AMINE};H1](c)c",
+    ChemicalEnvironment.TertiaryAmine: f"[{_AMINE};H0]([#6])([#6])[#6]",
+    ChemicalEnvironment.TertiaryAliphAmine: f"[{_AMINE};H0]([CX4])([CX4])[CX4]",
+    ChemicalEnvironment.TertiaryMixedAmine: (
+        f"[{_AMINE};H0;$(N[CX4]);$(Nc)]([#6])([#6])[#6]"
+    ),
+    ChemicalEnvironment.TertiaryAromAmine: f"[{_AMINE};H0](c)(c)c",
+    ChemicalEnvironment.QuartAmmonium: "[NX4+;H0]([#6])([#6])([#6])[#6]",
+    ChemicalEnvironment.NOxide: "[#7+;!$([#7]=O)][OX1-]",
+    ChemicalEnvironment.HalogenDeriv: "[#6][F,Cl,Br,I]",
+    ChemicalEnvironment.AlkylHalide: "[CX4][F,Cl,Br,I]",
+    ChemicalEnvironment.AlkylFluoride: "[CX4]F",
+    ChemicalEnvironment.AlkylChloride: "[CX4]Cl",
+    ChemicalEnvironment.AlkylBromide: "[CX4]Br",
+    ChemicalEnvironment.AlkylIodide: "[CX4]I",
+    ChemicalEnvironment.ArylHalide: "c[F,Cl,Br,I]",
+    ChemicalEnvironment.ArylFluoride: "cF",
+    ChemicalEnvironment.ArylChloride: "cCl",
+    ChemicalEnvironment.ArylBromide: "cBr",
+    ChemicalEnvironment.ArylIodide: "cI",
+    ChemicalEnvironment.CarboxylicAcidDeriv: f"{_ACYL}[O,N,F,Cl,Br,I]",
+    ChemicalEnvironment.CarboxylicAcid: f"{_ACYL}[OX2H1]",
+    ChemicalEnvironment.CarboxylicAcidSalt: f"{_ACYL}[OX1-]",
+    ChemicalEnvironment.CarboxylicAcidEster: f"{_ACYL}!@[OX2][#6;!$(C=O)]",
+    ChemicalEnvironment.Lactone: "[#6][CX3;R](=[OX1])@[OX2;R][#6]",
+    ChemicalEnvironment.CarboxylicAcidAmide: f"{_ACYL}[NX3]",
+    ChemicalEnvironment.CarboxylicAcidPrimaryAmide: f"{_ACYL}[NX3H2]",
+    ChemicalEnvironment.CarboxylicAcidSecondaryAmide: f"{_ACYL}[NX3H1][#6]",
+    ChemicalEnvironment.CarboxylicAcidTertiaryAmide: f"{_ACYL}[NX3H0]([#6])[#6]",
+    ChemicalEnvironment.Lactam: "[#6][CX3;R](=[OX1])@[NX3;R]",
+    ChemicalEnvironment.CarboxylicAcidHydrazide: f"{_ACYL}[NX3][NX3]",
+    ChemicalEnvironment.CarboxylicAcidAmidine: ("[CX3;$(C[#6]),$([CH1])](=[NX2])[NX3]"),
+    ChemicalEnvironment.Nitrile: "[NX1]#[CX2;$(C[#6]),$([CH1])]",
+    ChemicalEnvironment.AcylHalide: f"{_ACYL}[F,Cl,Br,I]",
+    ChemicalEnvironment.AcylFluoride: f"{_ACYL}F",
+    ChemicalEnvironment.AcylChloride: f"{_ACYL}Cl",
+    ChemicalEnvironment.AcylBromide: f"{_ACYL}Br",
+    ChemicalEnvironment.AcylIodide: f"{_ACYL}I",
+    ChemicalEnvironment.CarboxylicAcidAnhydride: ("[CX3](=[OX1])[OX2][CX3](=[OX1])"),
+    ChemicalEnvironment.CarboxylicAcidImide: "[CX3](=[OX1])[NX3][CX3](=[OX1])",
+    ChemicalEnvironment.CarbonicAcidDiester: "[#6][OX2][CX3](=[OX1])[OX2][#6]",
+    ChemicalEnvironment.CarbamicAcidEster: "[NX3][CX3](=[OX1])[OX2][#6]",
+    ChemicalEnvironment.Urea: "[NX3][CX3](=[OX1])[NX3]",
+    ChemicalEnvironment.Thiourea: "[NX3][CX3](=[SX1])[NX3]",
+    ChemicalEnvironment.Guanidine: "[NX3][CX3](=[NX2])[NX3]",
+    ChemicalEnvironment.Azide: "[NX2]=[NX2+]=[NX1-]",
+    ChemicalEnvironment.AzoCompound: "[#6][NX2]=[NX2][#6]",
+    ChemicalEnvironment.Isonitrile: "[CX1-]#[NX2+]",
+    ChemicalEnvironment.Cyanate: "[#6][OX2][CX2]#[NX1]",
+    ChemicalEnvironment.Isocyanate: "[NX2]=[CX2]=[OX1]",
+    ChemicalEnvironment.Thiocyanate: "[#6][SX2][CX2]#[NX1]",
+    ChemicalEnvironment.Isothiocyanate: "[NX2]=[CX2]=[SX1]",
+    ChemicalEnvironment.Carbodiimide: "[NX2]=[CX2]=[NX2]",
+    ChemicalEnvironment.NitrosoCompound: "[#6][NX2]=[OX1]",
+    ChemicalEnvironment.NitroCompound: "[#6][NX3+](=[OX1])[OX1-]",
+    ChemicalEnvironment.Nitrite: "[#6][OX2][NX2]=[OX1]",
+    ChemicalEnvironment.Nitrate: "[#6][OX2][NX3+](=[OX1])[OX1-]",
+    ChemicalEnvironment.SulfuricAcidDeriv: "[O,N][SX4](=[OX1])(=[OX1])[O,N]",
+    ChemicalEnvironment.SulfuricAcidDiester: (
+        "[#6][OX2][SX4](=[OX1])(=[OX1])[OX2][#6]"
+    ),
+    ChemicalEnvironment.SulfonicAcidDeriv: ("[#6][SX4](=[OX1])(=[OX1])[O,N,F,Cl,Br,I]"),
+    ChemicalEnvironment.SulfonicAcid: "[#6][SX4](=[OX1])(=[OX1])[OX2H1]",
+    ChemicalEnvironment.SulfonicAcidEster: "[#6][SX4](=[OX1])(=[OX1])[OX2][#6]",
+    ChemicalEnvironment.Sulfonamide: "[#6][SX4](=[OX1])(=[OX1])[NX3]",
+    ChemicalEnvironment.SulfonylHalide: "[#6][SX4](=[OX1])(=[OX1])[F,Cl,Br,I]",
+    ChemicalEnvironment.Sulfone: "[#6][SX4](=[OX1])(=[OX1])[#6]",
+    ChemicalEnvironment.Sulfoxide: "[#6][SX3](=[OX1])[#6]",
+    ChemicalEnvironment.Thiol: "[SX2H1][#6]",
+    ChemicalEnvironment.Alkylthiol: "[SX2H1][CX4]",
+    ChemicalEnvironment.Arylthiol: "[SX2H1]c",
+    ChemicalEnvironment.PhosphoricAcidDeriv: (
+        "[PX4](=[O,S])([O,N,F,Cl,Br,I])([O,N,F,Cl,Br,I])[O,N,F,Cl,Br,I]"
+    ),
+    ChemicalEnvironment.PhosphoricAcidEster: ("[PX4](=[OX1])([OX2])([OX2])[OX2][#6]"),
+    ChemicalEnvironment.Phosphine: "[PX3;!$(P[O,N,S,F,Cl,Br,I])]",
+    ChemicalEnvironment.Phosphinoxide: "[PX4](=[OX1])([#6])([#6])[#6]",
+    ChemicalEnvironment.BoronicAcidDeriv: "[#6][BX3]([O,N])[O,N]",
+    ChemicalEnvironment.BoronicAcid: "[#6][BX3]([OX2H1])[OX2H1]",
+    ChemicalEnvironment.BoronicAcidEster: "[#6][BX3]([OX2][#6])[OX2]",
+    ChemicalEnvironment.Alkene: "[CX3]=[CX3]",
+    ChemicalEnvironment.Alkyne: "[CX2]#[CX2]",
+    ChemicalEnvironment.Aromatic: "a",
+    ChemicalEnvironment.Heterocycle: "[!#6;!#1;R]",
+    ChemicalEnvironment.AlphaAminoacid: (f"[{_AMINE}][CX4][CX3](=[OX1])[OX2H1,OX1-]"),
+    ChemicalEnvironment.AlphaHydroxyacid: "[OX2H1][CX4][CX3](=[OX1])[OX2H1]",
+}
+
+
+def supported_environments() -> List[ChemicalEnvironment]:
+    """Returns the chemical environments which the SMARTS engine is able to
+    identify. Environments not in this list will never be assigned."""
+    return [*SMARTS_PATTERNS, ChemicalEnvironment.Alkane, ChemicalEnvironment.Aqueous]
+
+
+@functools.lru_cache()
+def _compiled_patterns() -> Tuple[Tuple[ChemicalEnvironment, "Chem.Mol"], ...]:
+    """Compiles the table of SMARTS patterns. This is only performed once per
+    process."""
+
+    from rdkit import Chem
+
+    compiled_patterns = []
+
+    for environment, smarts in SMARTS_PATTERNS.items():
+
+        pattern = Chem.MolFromSmarts(smarts)
+        assert pattern is not None, f"invalid SMARTS for {environment}: {smarts}"
+
+        compiled_patterns.append((environment, pattern))
+
+    return tuple(compiled_patterns)
+
+
+def analyse_smarts_groups(
+    smiles: List[str],
+) -> List[Optional[Dict[ChemicalEnvironment, int]]]:
+    """Determines which chemical moieties are encoded by each of a list of smiles
+    patterns by matching them against the ``SMARTS_PATTERNS`` table.
+
+    Parameters
+    ----------
+    smiles
+        The smiles patterns to examine.
+
+    Returns
+    -------
+        The chemical moieties present in each pattern, where each value is the
+        number of unique matches of that moiety. As with `checkmol`, molecules which
+        contain none of the moieties are assigned the 'Alkane' environment, and
+        ``None`` is returned for any patterns which could not be parsed or which
+        do not contain any carbon atoms.
+    """
+
+    from rdkit import Chem, RDLogger
+
+    RDLogger.DisableLog("rdApp.*")
+
+    compiled_patterns = _compiled_patterns()
+    groups = []
+
+    for pattern in smiles:
+
+        molecule = Chem.MolFromSmiles(pattern)
+
+        # Mirror `checkmol`, which is unable to process molecules without carbon.
+        if molecule is None or not any(
+            atom.GetAtomicNum() == 6 for atom in molecule.GetAtoms()
+        ):
+
+            groups.append(None)
+            continue
+
+        molecule_groups = {}
+
+        for environment, smarts_pattern in compiled_patterns:
+
+            n_matches = len(molecule.GetSubstructMatches(smarts_pattern))
+
+            if n_matches > 0:
+                molecule_groups[environment] = n_matches
+
+        groups.append(
+            molecule_groups
+            if len(molecule_groups) > 0
+            else {ChemicalEnvironment.Alkane: 1}
+        )
+
+    return groups
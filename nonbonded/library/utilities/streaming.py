@@ -0,0 +1,320 @@
+"""Utilities for incrementally reading the entries of large data set and result JSON
+files, without first loading (and validating) the whole file into memory."""
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from nonbonded.library.utilities.serialization import SerializationFormat, detect_format
+
+if TYPE_CHECKING:
+    from nonbonded.library.models import BaseORM
+    from nonbonded.library.models.columnar import ColumnarDataSet
+    from nonbonded.library.models.datasets import DataSetEntry
+    from nonbonded.library.models.results import DataSetResultEntry
+
+T = TypeVar("T", bound="BaseORM")
+
+# The ijson prefix of the objects which contain entries, and the key of the entries
+# list within those objects, for each type of streamable model.
+_DATA_SET_ENTRIES = ("", "entries")
+_DATA_SET_COLLECTION_ENTRIES = ("data_sets.item", "entries")
+_BENCHMARK_RESULT_ENTRIES = ("data_set_result", "result_entries")
+
+
+def _is_within(prefix: str, parent_prefix: str) -> bool:
+    """Returns whether an ijson prefix is equal to or nested within another."""
+    return prefix == parent_prefix or prefix.startswith(f"{parent_prefix}.")
+
+
+def _join_prefix(*prefixes: str) -> str:
+    return ".".join(prefix for prefix in prefixes if len(prefix) > 0)
+
+
+def _iter_items(
+    file_path: str, container_prefix: str, item_key: str
+) -> Iterator[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """Incrementally parses a JSON file, yielding each item of the ``item_key`` list
+    of every object found at ``container_prefix``.
+
+    Parameters
+    ----------
+    file_path
+        The path to the JSON file.
+    container_prefix
+        The ijson prefix of the objects which contain the list of items.
+    item_key
+        The key of the list of items within each container.
+
+    Returns
+    -------
+        An iterator over the raw items, each paired with the (partially built)
+        contents of its container. These contain every field of the container which
+        precedes the list of items in the file, with the list itself replaced by an
+        empty list.
+    """
+
+    import ijson
+
+    list_prefix = _join_prefix(container_prefix, item_key)
+    item_prefix = _join_prefix(list_prefix, "item")
+
+    with open(file_path, "rb") as file:
+
+        events = ijson.parse(file, use_float=True)
+        container_builder: Optional[ijson.ObjectBuilder] = None
+
+        for prefix, event, value in events:
+
+            if prefix == container_prefix and event == "start_map":
+                container_builder = ijson.ObjectBuilder()
+
+            if container_builder is None:
+                continue
+
+            if prefix == item_prefix and event == "start_map":
+
+                item_builder = ijson.ObjectBuilder()
+                item_builder.event(event, value)
+
+                for prefix, event, value in events:
+
+                    item_builder.event(event, value)
+
+                    if prefix == item_prefix and event == "end_map":
+                        break
+
+                yield container_builder.value, item_builder.value
+                continue
+
+            if _is_within(prefix, item_prefix):
+                continue
+
+            container_builder.event(event, value)
+
+            if prefix == container_prefix and event == "end_map":
+                container_builder = None
+
+
+def _model_entries_prefix(model_class: Type["BaseORM"]) -> Tuple[str, str]:
+
+    from nonbonded.library.models.datasets import DataSet, DataSetCollection
+    from nonbonded.library.models.results import BenchmarkResult
+
+    if issubclass(model_class, DataSet):
+        return _DATA_SET_ENTRIES
+    elif issubclass(model_class, DataSetCollection):
+        return _DATA_SET_COLLECTION_ENTRIES
+    elif issubclass(model_class, BenchmarkResult):
+        return _BENCHMARK_RESULT_ENTRIES
+
+    raise NotImplementedError()
+
+
+def _is_collection(file_path: str) -> bool:
+    """Returns whether a JSON file stores a data set collection rather than a single
+    data set."""
+
+    import ijson
+
+    with open(file_path, "rb") as file:
+
+        for prefix, event, value in ijson.parse(file):
+
+            if (
+                prefix == ""
+                and event == "map_key"
+                and value in {"data_sets", "entries"}
+            ):
+                return value == "data_sets"
+
+    return False
+
+
+def _iter_data_set_items(
+    file_path: str,
+) -> Iterator[Tuple[Dict[str, Any], Dict[str, Any]]]:
+
+    container_prefix, item_key = (
+        _DATA_SET_COLLECTION_ENTRIES if _is_collection(file_path) else _DATA_SET_ENTRIES
+    )
+
+    return _iter_items(file_path, container_prefix, item_key)
+
+
+def iter_data_set_entries(file_path: str) -> Iterator["DataSetEntry"]:
+    """Iterates over the entries stored in a data set or data set collection file,
+    parsing and validating one entry at a time.
+
+    Parameters
+    ----------
+    file_path
+        The path to the file. Files which are not stored as JSON are loaded in full.
+    """
+
+    from nonbonded.library.models.datasets import DataSetEntry
+
+    if detect_format(file_path) != SerializationFormat.JSON:
+
+        data_set_collection = _load_data_set_collection(file_path)
+
+        for data_set in data_set_collection.data_sets:
+            yield from data_set.entries
+
+        return
+
+    for _, entry in _iter_data_set_items(file_path):
+        yield DataSetEntry.parse_obj(entry)
+
+
+def iter_data_set_chunks(
+    file_path: str, chunk_size: int = 10000
+) -> Iterator["ColumnarDataSet"]:
+    """Iterates over the entries stored in a data set or data set collection file in
+    chunks, with each chunk stored in a columnar data set.
+
+    Parameters
+    ----------
+    file_path
+        The path to the file. Files which are not stored as JSON are loaded in full.
+    chunk_size
+        The maximum number of entries to include in each chunk. A chunk only
+        ever contains the entries of a single data set.
+    """
+
+    from nonbonded.library.models.authors import Author
+    from nonbonded.library.models.columnar import ColumnarDataSet
+    from nonbonded.library.models.datasets import DataSetEntry
+
+    if detect_format(file_path) != SerializationFormat.JSON:
+
+        data_set_collection = _load_data_set_collection(file_path)
+
+        for data_set in data_set_collection.data_sets:
+
+            columnar_set = data_set.to_columnar()
+
+            for chunk_start in range(0, len(columnar_set), chunk_size):
+                yield columnar_set.select(slice(chunk_start, chunk_start + chunk_size))
+
+        return
+
+    chunk: List[DataSetEntry] = []
+    chunk_data_set: Optional[Dict[str, Any]] = None
+
+    def build_chunk() -> ColumnarDataSet:
+
+        return ColumnarDataSet.from_entries(
+            chunk,
+            chunk_data_set["id"],
+            chunk_data_set["description"],
+            [Author.parse_obj(author) for author in chunk_data_set["authors"]],
+        )
+
+    for data_set, entry in _iter_data_set_items(file_path):
+
+        if chunk_data_set is not None and (
+            len(chunk) == chunk_size or data_set["id"] != chunk_data_set["id"]
+        ):
+
+            yield build_chunk()
+            chunk = []
+
+        chunk_data_set = data_set
+        chunk.append(DataSetEntry.parse_obj(entry))
+
+    if len(chunk) > 0:
+        yield build_chunk()
+
+
+def iter_result_entries(file_path: str) -> Iterator["DataSetResultEntry"]:
+    """Iterates over the result entries stored in a benchmark result file, parsing and
+    validating one entry at a time.
+
+    Parameters
+    ----------
+    file_path
+        The path to the file. Files which are not stored as JSON are loaded in full.
+    """
+
+    from nonbonded.library.models.results import BenchmarkResult, DataSetResultEntry
+
+    if detect_format(file_path) != SerializationFormat.JSON:
+
+        yield from BenchmarkResult.from_file(file_path).data_set_result.result_entries
+        return
+
+    for _, entry in _iter_items(file_path, *_BENCHMARK_RESULT_ENTRIES):
+        yield DataSetResultEntry.parse_obj(entry)
+
+
+def load_without_entries(model_class: Type[T], file_path: str) -> T:
+    """Loads a data set, data set collection or benchmark result from a file,
+    omitting its (data set or result) entries.
+
+    This allows the comparatively small remainder of the model, such as the
+    statistics of a benchmark result, to be loaded without the memory cost of
+    its entries, which may instead be streamed using ``iter_data_set_entries`` or
+    ``iter_result_entries``.
+
+    Parameters
+    ----------
+    model_class
+        The type of model to load.
+    file_path
+        The path to the file. Files which are not stored as JSON are loaded in full
+        before their entries are discarded.
+    """
+
+    import ijson
+
+    container_prefix, item_key = _model_entries_prefix(model_class)
+
+    if detect_format(file_path) != SerializationFormat.JSON:
+
+        model = model_class.from_file(file_path)
+
+        containers = (
+            model.data_sets
+            if container_prefix == _DATA_SET_COLLECTION_ENTRIES[0]
+            else [model if container_prefix == "" else getattr(model, container_prefix)]
+        )
+
+        for container in containers:
+            setattr(container, item_key, [])
+
+        return model
+
+    item_prefix = _join_prefix(container_prefix, item_key, "item")
+
+    with open(file_path, "rb") as file:
+
+        builder = ijson.ObjectBuilder()
+
+        for prefix, event, value in ijson.parse(file, use_float=True):
+
+            if _is_within(prefix, item_prefix):
+                continue
+
+            builder.event(event, value)
+
+    return model_class.parse_obj(builder.value)
+
+
+def _load_data_set_collection(file_path: str):
+    """Loads a file which contains either a data set or a data set collection as a
+    data set collection."""
+
+    from nonbonded.library.models.datasets import DataSet, DataSetCollection
+
+    try:
+        return DataSetCollection.from_file(file_path)
+    except ValueError:
+        return DataSetCollection(data_sets=[DataSet.from_file(file_path)])
@@ -56,6 +56,46 @@ class TestDataSetEndpoints(BaseTestEndpoints):
 
         compare_pydantic_models(data_set, rest_data_collection.data_sets[0])
 
+    def test_conditional_get(self, rest_client: TestClient, db: Session):
+
+        data_set = commit_data_set(db)
+        url = DataSet._get_endpoint(data_set_id=data_set.id)
+
+        request = rest_client.get(url)
+        request.raise_for_status()
+
+        etag = request.headers["ETag"]
+
+        request = rest_client.get(url, headers={"If-None-Match": etag})
+        assert request.status_code == 304
+        assert request.headers["ETag"] == etag
+
+        request = rest_client.get(url, headers={"If-None-Match": '"mismatch"'})
+        assert request.status_code == 200
+        assert DataSet.parse_raw(request.text) == data_set
+
+    def test_iter_rest(self, rest_client: TestClient, db: Session):
+
+        data_set_ids = [f"data-set-{index}" for index in range(5)]
+
+        for data_set_id in data_set_ids:
+            commit_data_set(db, data_set_id)
+
+        pages = [
+            *DataSetCollection.iter_rest(
+                page_size=2, children=False, requests_class=rest_client
+            )
+        ]
+
+        assert [len(page.data_sets) for page in pages] == [2, 2, 1]
+        assert [
+            data_set.id for page in pages for data_set in page.data_sets
+        ] == data_set_ids
+
+        assert all(
+            len(data_set.entries) == 0 for page in pages for data_set in page.data_sets
+        )
+
 
 class TestQCDataSetEndpoints(BaseTestEndpoints):
     @classmethod
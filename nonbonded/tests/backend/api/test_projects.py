@@ -2,6 +2,7 @@ from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
 from nonbonded.backend.database import models
+from nonbonded.backend.database.crud.projects import ProjectCRUD
 from nonbonded.library.models.projects import (
     Benchmark,
     BenchmarkCollection,
@@ -69,6 +70,22 @@ class TestProjectEndpoints(BaseTestEndpoints):
 
         compare_pydantic_models(project, rest_collection.projects[0])
 
+    def test_iter_rest(self, rest_client: TestClient, db: Session):
+
+        project_ids = [f"project-{index}" for index in range(5)]
+
+        for project_id in project_ids:
+
+            db.add(ProjectCRUD.create(db, create_project(project_id)))
+            db.commit()
+
+        pages = [*ProjectCollection.iter_rest(page_size=2, requests_class=rest_client)]
+
+        assert [len(page.projects) for page in pages] == [2, 2, 1]
+        assert [
+            project.id for page in pages for project in page.projects
+        ] == project_ids
+
 
 class TestStudyEndpoints(BaseTestEndpoints):
     @classmethod
@@ -0,0 +1,54 @@
+import os
+
+import pytest
+
+from nonbonded.cli.cache import cache as cache_cli
+from nonbonded.library.models.datasets import DataSetCollection
+from nonbonded.library.utilities.cache import FunctionalGroupCache, ResponseCache
+from nonbonded.library.utilities.environments import ChemicalEnvironment
+from nonbonded.library.utilities.serialization import SerializationFormat
+from nonbonded.tests.utilities.factory import create_data_set
+
+
+class TestCacheCLI:
+    def test_info_clear(self, runner, cache_directory):
+
+        FunctionalGroupCache.default().set(
+            {"CO": {ChemicalEnvironment.Alcohol: 1}}, version="checkmol=1"
+        )
+        ResponseCache.default().set("http://localhost/mock", '"etag"', "{}")
+
+        result = runner.invoke(cache_cli, ["info"])
+
+        if result.exit_code != 0:
+            raise result.exception
+
+        assert cache_directory in result.output
+        assert "checkmol=1: 1 entries" in result.output
+        assert "Response cache" in result.output
+
+        result = runner.invoke(cache_cli, ["clear"])
+
+        if result.exit_code != 0:
+            raise result.exception
+
+        assert FunctionalGroupCache.default().info()[1] == {}
+        assert ResponseCache.default().info()[1] == 0
+
+    @pytest.mark.parametrize("file_format", [*SerializationFormat])
+    def test_warm(self, runner, cache_directory, file_format):
+
+        data_set_path = os.path.join(
+            cache_directory, f"test-set-collection.{file_format.value}"
+        )
+
+        DataSetCollection(data_sets=[create_data_set("data-set-1", 1)]).to_file(
+            data_set_path, file_format
+        )
+
+        result = runner.invoke(cache_cli, ["warm", data_set_path])
+
+        if result.exit_code != 0:
+            raise result.exception
+
+        assert "the functional groups of 2 molecules" in result.output
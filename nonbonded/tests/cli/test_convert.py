@@ -0,0 +1,94 @@
+import os
+
+from nonbonded.cli.convert import convert as convert_cli
+from nonbonded.library.models.datasets import DataSetCollection
+from nonbonded.library.utilities.serialization import SerializationFormat, detect_format
+from nonbonded.tests.utilities.factory import create_data_set
+
+
+def test_convert(runner):
+
+    data_set_collection = DataSetCollection(
+        data_sets=[create_data_set("data-set-1", 1)]
+    )
+
+    os.makedirs(os.path.join("study", "analysis"))
+    data_set_collection.to_file(os.path.join("study", "test-set-collection.json"))
+
+    result = runner.invoke(convert_cli, ["study", "--format", "msgpack"])
+
+    if result.exit_code != 0:
+        raise result.exception
+
+    input_path = os.path.join("study", "test-set-collection.json")
+    output_path = os.path.join("study", "test-set-collection.msgpack")
+
+    # The original files should be kept by default.
+    assert detect_format(input_path) == SerializationFormat.JSON
+    assert detect_format(output_path) == SerializationFormat.MsgPack
+
+    assert DataSetCollection.from_file(output_path) == data_set_collection
+
+    # Converting again should not overwrite the already converted file.
+    result = runner.invoke(convert_cli, ["study", "--format", "msgpack"])
+
+    if result.exit_code != 0:
+        raise result.exception
+
+    assert "already exists" in result.output
+
+
+def test_convert_remove_original(runner):
+
+    data_set_collection = DataSetCollection(
+        data_sets=[create_data_set("data-set-1", 1)]
+    )
+
+    os.makedirs("study-remove")
+    data_set_collection.to_file(
+        os.path.join("study-remove", "test-set-collection.json")
+    )
+
+    result = runner.invoke(
+        convert_cli, ["study-remove", "--format", "msgpack", "--remove-original"]
+    )
+
+    if result.exit_code != 0:
+        raise result.exception
+
+    output_path = os.path.join("study-remove", "test-set-collection.msgpack")
+
+    assert not os.path.isfile(os.path.join("study-remove", "test-set-collection.json"))
+    assert detect_format(output_path) == SerializationFormat.MsgPack
+
+    assert (
+        DataSetCollection.from_file(
+            os.path.join("study-remove", "test-set-collection.json")
+        )
+        == data_set_collection
+    )
+
+
+def test_convert_conflict(runner):
+
+    data_set_collection = DataSetCollection(
+        data_sets=[create_data_set("data-set-1", 1)]
+    )
+
+    os.makedirs("study-conflict")
+
+    for file_format in [SerializationFormat.JSON, SerializationFormat.MsgPack]:
+
+        data_set_collection.to_file(
+            os.path.join("study-conflict", f"test-set-collection.{file_format.value}"),
+            file_format,
+        )
+
+    result = runner.invoke(convert_cli, ["study-conflict", "--format", "parquet"])
+
+    assert result.exit_code != 0
+    assert "would both be converted" in result.output
+
+    assert not os.path.isfile(
+        os.path.join("study-conflict", "test-set-collection.parquet")
+    )
@@ -4,6 +4,17 @@ import pytest
 import yaml
 
 
+@pytest.fixture(autouse=True)
+def cache_directory(tmpdir, monkeypatch) -> str:
+    """Stores any functional groups or responses cached during a test in a temporary
+    directory rather than in the user's cache directory."""
+
+    from nonbonded.library.config import settings
+
+    monkeypatch.setattr(settings, "CACHE_DIRECTORY", str(tmpdir))
+    return str(tmpdir)
+
+
 @pytest.fixture()
 def dummy_conda_env(tmpdir, file_name: str = "conda-env.yaml") -> str:
     """Creates a dummy conda-environment file in a temporary directory and returns
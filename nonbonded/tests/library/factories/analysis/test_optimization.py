@@ -93,25 +93,40 @@ def test_analysis(monkeypatch, force_field, dummy_conda_env):
         )
 
         # Mock the already tested functions.
+        random_seeds = []
+
+        def mock_analyze(target_result):
+            def analyze(*args, **kwargs):
+                random_seeds.append(kwargs["random_seed"])
+                return target_result
+
+            return analyze
+
         monkeypatch.setattr(
             OptimizationAnalysisFactory, "_load_refit_force_field", lambda: force_field
         )
         monkeypatch.setattr(
             EvaluatorAnalysisFactory,
             "analyze",
-            lambda *args, **kwargs: EvaluatorTargetResult(
-                objective_function=1.0, statistic_entries=[]
+            mock_analyze(
+                EvaluatorTargetResult(objective_function=1.0, statistic_entries=[])
             ),
         )
         monkeypatch.setattr(
             RechargeAnalysisFactory,
             "analyze",
-            lambda *args, **kwargs: RechargeTargetResult(
-                objective_function=1.0, statistic_entries=[]
+            mock_analyze(
+                RechargeTargetResult(objective_function=1.0, statistic_entries=[])
             ),
         )
 
-        OptimizationAnalysisFactory.analyze(True)
+        OptimizationAnalysisFactory.analyze(True, random_seed=1234)
+
+        # Each target should be bootstrapped using its own random stream.
+        assert len(random_seeds) == 2
+        assert [*random_seeds[0].generate_state(4)] != [
+            *random_seeds[1].generate_state(4)
+        ]
 
         for target in optimization.targets:
 
@@ -0,0 +1,149 @@
+import pytest
+
+from nonbonded.library.factories.inputs.retrieval import (
+    RetrievalPlan,
+    has_retrieved_models,
+    retrieve_model,
+    use_retrieved_models,
+)
+from nonbonded.library.models.datasets import DataSet, QCDataSet
+from nonbonded.library.models.results import BenchmarkResult, OptimizationResult
+from nonbonded.tests.utilities.factory import (
+    create_benchmark,
+    create_data_set,
+    create_evaluator_target,
+    create_optimization,
+    create_optimization_result,
+    create_qc_data_set,
+    create_recharge_target,
+    create_study,
+)
+from nonbonded.tests.utilities.mock import (
+    mock_get_data_set,
+    mock_get_optimization_result,
+    mock_get_qc_data_set,
+)
+
+
+@pytest.fixture()
+def study():
+
+    study = create_study("project-1", "study-1")
+    study.optimizations = [
+        create_optimization(
+            "project-1",
+            "study-1",
+            "optimization-1",
+            targets=[
+                create_evaluator_target("evaluator-target", ["data-set-1"]),
+                create_recharge_target("recharge-target", ["qc-data-set-1"]),
+            ],
+        )
+    ]
+    study.benchmarks = [
+        create_benchmark(
+            "project-1",
+            "study-1",
+            "benchmark-1",
+            ["data-set-1", "data-set-2"],
+            "optimization-1",
+            None,
+        )
+    ]
+
+    return study
+
+
+def test_plan_from_model(study):
+
+    plan = RetrievalPlan.from_model(study)
+
+    assert plan.keys == [
+        (DataSet, (("data_set_id", "data-set-1"),)),
+        (DataSet, (("data_set_id", "data-set-2"),)),
+        (
+            OptimizationResult,
+            (
+                ("model_id", "optimization-1"),
+                ("project_id", "project-1"),
+                ("study_id", "study-1"),
+            ),
+        ),
+        (QCDataSet, (("qc_data_set_id", "qc-data-set-1"),)),
+    ]
+
+
+def test_plan_include_results(study):
+
+    plan = RetrievalPlan.from_model(study, include_results=True)
+
+    # The results of the optimization are also the source of the benchmarked force
+    # field and so should only be retrieved once.
+    assert len(plan) == 5
+    assert {model_type for model_type, _ in plan.keys} == {
+        BenchmarkResult,
+        DataSet,
+        OptimizationResult,
+        QCDataSet,
+    }
+
+
+def test_plan_local_models(study):
+
+    plan = RetrievalPlan.from_model(
+        study,
+        reference_data_sets=[
+            create_data_set("data-set-1"),
+            create_qc_data_set("data-set-2"),
+        ],
+        optimization_result=create_optimization_result(
+            "project-1", "study-1", "optimization-1", ["evaluator-target"], []
+        ),
+    )
+
+    assert plan.keys == [
+        (DataSet, (("data_set_id", "data-set-2"),)),
+        (QCDataSet, (("qc_data_set_id", "qc-data-set-1"),)),
+    ]
+
+
+@pytest.mark.usefixtures("change_api_url")
+def test_retrieve(requests_mock, study):
+
+    data_sets = [create_data_set("data-set-1"), create_data_set("data-set-2")]
+    qc_data_set = create_qc_data_set("qc-data-set-1")
+    optimization_result = create_optimization_result(
+        "project-1", "study-1", "optimization-1", ["evaluator-target"], []
+    )
+
+    for data_set in data_sets:
+        mock_get_data_set(requests_mock, data_set)
+
+    mock_get_qc_data_set(requests_mock, qc_data_set)
+    mock_get_optimization_result(requests_mock, optimization_result)
+
+    retrieved_models = RetrievalPlan.from_model(study).retrieve(max_concurrency=2)
+
+    assert len(retrieved_models) == 4
+    assert requests_mock.call_count == 4
+
+    assert not has_retrieved_models()
+
+    with use_retrieved_models(retrieved_models):
+
+        assert has_retrieved_models()
+
+        assert retrieve_model(DataSet, data_set_id="data-set-2") == data_sets[1]
+        assert (
+            retrieve_model(
+                OptimizationResult,
+                project_id="project-1",
+                study_id="study-1",
+                model_id="optimization-1",
+            )
+            == optimization_result
+        )
+
+        assert requests_mock.call_count == 4
+
+    assert not has_retrieved_models()
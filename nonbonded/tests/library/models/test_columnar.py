@@ -0,0 +1,251 @@
+import numpy
+import pandas
+import pytest
+from pandas.testing import assert_frame_equal
+
+from nonbonded.library.models.authors import Author
+from nonbonded.library.models.columnar import ColumnarDataSet
+from nonbonded.library.models.datasets import (
+    Component,
+    DataSet,
+    DataSetEntry,
+    pandas_unit_conversion,
+)
+
+
+@pytest.fixture()
+def data_set() -> DataSet:
+
+    return DataSet(
+        id="data-set-1",
+        description=" ",
+        authors=[Author(name="Fake Name", email="fake@email.com", institute="None")],
+        entries=[
+            DataSetEntry(
+                id=1,
+                property_type="Density",
+                temperature=298.15,
+                pressure=101.325,
+                value=1.0,
+                std_error=0.1,
+                doi="x",
+                components=[Component(smiles="CO", mole_fraction=1.0)],
+            ),
+            DataSetEntry(
+                property_type="EnthalpyOfMixing",
+                temperature=308.15,
+                pressure=101.0,
+                phase="Liquid + Gas",
+                value=-0.5,
+                std_error=None,
+                doi="y",
+                components=[
+                    Component(smiles="O", mole_fraction=1.0, role="Solvent"),
+                    Component(
+                        smiles="CCO", mole_fraction=0.0, exact_amount=1, role="Solute"
+                    ),
+                ],
+            ),
+            DataSetEntry(
+                id=3,
+                property_type="Density",
+                temperature=318.15,
+                pressure=101.325,
+                value=0.9,
+                std_error=0.2,
+                doi="x",
+                components=[
+                    Component(smiles="CCO", mole_fraction=0.25),
+                    Component(smiles="O", mole_fraction=0.75),
+                ],
+            ),
+        ],
+    )
+
+
+def test_round_trip(data_set):
+
+    columnar_set = data_set.to_columnar()
+
+    assert len(columnar_set) == 3
+    assert columnar_set.n_components.tolist() == [1, 2, 2]
+    assert columnar_set.component_offsets.tolist() == [0, 1, 3, 5]
+    assert columnar_set.has_std_error.tolist() == [True, False, True]
+    assert [*columnar_set.property_types.categories] == [
+        "Density",
+        "EnthalpyOfMixing",
+    ]
+
+    for validate in [False, True]:
+
+        round_tripped = columnar_set.to_data_set(validate=validate)
+
+        assert isinstance(round_tripped, DataSet)
+        assert round_tripped.json() == data_set.json()
+
+
+def test_select(data_set):
+
+    columnar_set = data_set.to_columnar()
+
+    subset = columnar_set.select(numpy.array([False, True, True]))
+
+    assert subset.to_data_set().entries == data_set.entries[1:]
+    assert subset.component_offsets.tolist() == [0, 2, 4]
+
+    reordered = columnar_set.select([2, 0])
+
+    assert reordered.to_data_set().entries == [
+        data_set.entries[2],
+        data_set.entries[0],
+    ]
+
+
+def test_component_column(data_set):
+
+    columnar_set = data_set.to_columnar()
+
+    assert columnar_set.component_column(columnar_set.component_smiles, 1).tolist() == [
+        None,
+        "CCO",
+        "O",
+    ]
+    assert columnar_set.component_entry_indices.tolist() == [0, 1, 1, 2, 2]
+
+
+def test_invalid_offsets():
+
+    with pytest.raises(ValueError, match="component offsets"):
+
+        ColumnarDataSet(
+            identifier="data-set-1",
+            description=" ",
+            authors=[],
+            ids=[1],
+            has_id=[True],
+            property_types=["Density"],
+            temperatures=[298.15],
+            pressures=[101.325],
+            phases=["Liquid"],
+            values=[1.0],
+            std_errors=[0.1],
+            dois=["x"],
+            component_offsets=[0, 0],
+            component_smiles=[],
+            component_mole_fractions=[],
+            component_exact_amounts=[],
+            component_roles=[],
+        )
+
+
+def test_from_pandas():
+    """Tests that the vectorized loader produces the same entries as loading each row
+    of a frame individually."""
+
+    data_frame = pandas.DataFrame(
+        [
+            {
+                "Id": 1,
+                "Temperature (K)": 298.15,
+                "Pressure (kPa)": 101.325,
+                "Phase": "Liquid",
+                "N Components": 1,
+                "Density Value (g / ml)": 1.0,
+                "Density Uncertainty (g / ml)": 0.1,
+                "Source": "x",
+                "Component 1": "CO",
+                "Mole Fraction 1": 1.0,
+                "Exact Amount 1": 0,
+                "Role 1": "Solvent",
+            },
+            {
+                "Id": None,
+                "Temperature (K)": 308.15,
+                "Pressure (kPa)": 101.0,
+                "Phase": "Liquid + Gas",
+                "N Components": 2,
+                "EnthalpyOfMixing Value (kJ / mol)": -0.5,
+                "Source": "y",
+                "Component 1": "O",
+                "Mole Fraction 1": 1.0,
+                "Exact Amount 1": 0,
+                "Role 1": "Solvent",
+                "Component 2": "CCO",
+                "Mole Fraction 2": 0.0,
+                "Exact Amount 2": 1,
+                "Role 2": "Solute",
+            },
+        ]
+    )
+
+    columnar_set = ColumnarDataSet.from_pandas(data_frame, "data-set-1", " ", [])
+
+    assert columnar_set.to_data_set().entries == [
+        DataSetEntry.from_series(row) for _, row in data_frame.iterrows()
+    ]
+    assert len(ColumnarDataSet.from_pandas(data_frame[:0], "data-set-1", " ", [])) == 0
+
+
+@pytest.mark.parametrize(
+    "column, value",
+    [
+        ("Temperature (K)", -1.0),
+        ("Phase", ""),
+        ("Component 1", None),
+        ("N Components", 0),
+        ("Density Value (g / ml)", None),
+    ],
+)
+def test_from_pandas_invalid(column, value):
+
+    data_frame = pandas.DataFrame(
+        [
+            {
+                "Temperature (K)": 298.15,
+                "Pressure (kPa)": 101.325,
+                "Phase": "Liquid",
+                "N Components": 1,
+                "Density Value (g / ml)": 1.0,
+                "Source": "x",
+                "Component 1": "CO",
+                "Role 1": "Solvent",
+            }
+        ]
+    )
+    data_frame[column] = [value]
+
+    with pytest.raises(ValueError):
+        ColumnarDataSet.from_pandas(data_frame, "data-set-1", " ", [])
+
+
+def test_to_pandas(data_set):
+    """Tests that the column-wise export produces the same frame as building a series
+    from each entry."""
+
+    expected_frame = pandas.DataFrame([entry.to_series() for entry in data_set.entries])
+    data_frame = data_set.to_columnar().to_pandas()
+
+    assert data_frame.columns.tolist() == expected_frame.columns.tolist()
+    assert_frame_equal(data_frame, expected_frame)
+
+    assert_frame_equal(
+        ColumnarDataSet.from_pandas(data_frame, "data-set-1", " ", [])
+        .to_data_set()
+        .to_pandas(),
+        expected_frame,
+    )
+
+
+def test_to_pandas_empty(data_set):
+
+    assert data_set.to_columnar().select([]).to_pandas().empty
+
+
+def test_pandas_unit_conversion():
+
+    for property_type, internal_unit in DataSetEntry.default_units().items():
+
+        expected_unit, conversion_factor = pandas_unit_conversion(property_type)
+
+        assert expected_unit == internal_unit
+        assert numpy.isclose(conversion_factor, 1.0)
@@ -25,6 +25,7 @@ from nonbonded.library.models.datasets import (
     DataSetEntry,
     QCDataSet,
     QCDataSetCollection,
+    _entries_to_evaluator,
 )
 from nonbonded.library.utilities.exceptions import UnrecognisedPropertyType
 from nonbonded.tests.utilities.factory import create_data_set, create_qc_data_set
@@ -368,6 +369,38 @@ def test_collection_to_evaluator(evaluator_data_set):
         compare_evaluator_properties(evaluator_property, recreated_property)
 
 
+def test_to_evaluator_shared_objects():
+    """Tests that entries which reference the same substance and state share the
+    same evaluator objects."""
+
+    data_set = create_data_set("data-set-1")
+    data_set.entries.append(data_set.entries[0].copy(update={"id": 2}))
+
+    evaluator_set = data_set.to_evaluator()
+    property_1, property_2 = evaluator_set.properties
+
+    assert property_1.id != property_2.id
+    assert property_1.substance is property_2.substance
+    assert property_1.thermodynamic_state is property_2.thermodynamic_state
+
+
+def test_entries_to_evaluator_parallel():
+
+    data_set = create_data_set("data-set-1")
+    data_set.entries = [
+        data_set.entries[0].copy(update={"id": index, "temperature": 298.0 + index})
+        for index in range(5)
+    ]
+
+    evaluator_set = _entries_to_evaluator(data_set.entries, n_processes=2, batch_size=2)
+    assert [physical_property.id for physical_property in evaluator_set] == [
+        str(index) for index in range(5)
+    ]
+
+    for physical_property, entry in zip(evaluator_set, data_set.entries):
+        compare_properties(physical_property, entry)
+
+
 def test_data_set_collection_validation():
     """Check that the data set correctly validates for unique set ids."""
 
@@ -0,0 +1,131 @@
+import pytest
+
+from nonbonded.library.models.authors import Author
+from nonbonded.library.models.datasets import (
+    Component,
+    DataSet,
+    DataSetCollection,
+    DataSetEntry,
+)
+
+
+def _entry(entry_id, property_type, temperature, pressure, smiles):
+
+    return DataSetEntry(
+        id=entry_id,
+        property_type=property_type,
+        temperature=temperature,
+        pressure=pressure,
+        value=1.0,
+        std_error=0.1,
+        doi=" ",
+        components=[
+            Component(smiles=pattern, mole_fraction=1.0 / len(smiles))
+            for pattern in smiles
+        ],
+    )
+
+
+@pytest.fixture()
+def data_set() -> DataSet:
+
+    return DataSet(
+        id="data-set-1",
+        description=" ",
+        authors=[Author(name="Fake Name", email="fake@email.com", institute="None")],
+        entries=[
+            _entry(1, "Density", 298.15, 101.325, ["CO"]),
+            _entry(2, "Density", 318.15, 101.325, ["CCO", "O"]),
+            _entry(3, "EnthalpyOfMixing", 298.15, 90.0, ["OCC", "O"]),
+            _entry(4, "EnthalpyOfVaporization", 308.15, 101.325, ["O"]),
+        ],
+    )
+
+
+def test_get(data_set):
+
+    assert data_set.index.get(2) is data_set.entries[1]
+    assert data_set.index.get(5) is None
+
+    assert data_set.index.entries_by_id == {
+        entry.id: entry for entry in data_set.entries
+    }
+
+
+@pytest.mark.parametrize(
+    "kwargs, expected_ids",
+    [
+        ({}, [1, 2, 3, 4]),
+        ({"ids": [4, 1, 7]}, [1, 4]),
+        ({"property_type": "Density"}, [1, 2]),
+        ({"property_type": ["Density", "EnthalpyOfMixing"]}, [1, 2, 3]),
+        ({"n_components": 2}, [2, 3]),
+        ({"property_type": "Density", "n_components": 1}, [1]),
+        ({"smiles": "OCC"}, [2, 3]),
+        ({"smiles": ["CO", "CCO"]}, [1, 2, 3]),
+        ({"smiles": "C"}, []),
+        ({"temperature_range": (298.15, 308.15)}, [1, 3, 4]),
+        ({"temperature_range": (300.0, None)}, [2, 4]),
+        ({"pressure_range": (None, 100.0)}, [3]),
+        ({"smiles": "O", "temperature_range": (None, 310.0)}, [3, 4]),
+    ],
+)
+def test_filter(data_set, kwargs, expected_ids):
+
+    view = data_set.filter(**kwargs)
+
+    assert view.ids == expected_ids
+    assert len(view) == len(expected_ids)
+    assert all(entry in data_set.entries for entry in view)
+
+
+def test_view(data_set):
+
+    view = data_set.filter(n_components=2)
+
+    assert view[0] is data_set.entries[1]
+    assert view[-1] is data_set.entries[2]
+    assert view[1:].ids == [3]
+
+    assert view.filter(property_type="Density").ids == [2]
+
+
+def test_index_invalidation(data_set):
+
+    index = data_set.index
+    assert data_set.index is index
+
+    data_set.entries.append(_entry(5, "Density", 298.15, 101.325, ["C"]))
+
+    assert data_set.index is not index
+    assert data_set.filter(smiles="C").ids == [5]
+
+    data_set.entries = data_set.entries[:1]
+    assert data_set.filter().ids == [1]
+
+    # Replacing the entries with a different list of the same length should also
+    # invalidate the index.
+    index = data_set.index
+
+    data_set.entries = [_entry(6, "Density", 298.15, 101.325, ["C"])]
+
+    assert data_set.index is not index
+    assert data_set.filter().ids == [6]
+
+
+def test_collection_index(data_set):
+
+    other_set = DataSet(
+        id="data-set-2",
+        description=" ",
+        authors=data_set.authors,
+        entries=[_entry(5, "Density", 298.15, 101.325, ["C"])],
+    )
+
+    data_set_collection = DataSetCollection(data_sets=[data_set, other_set])
+
+    assert data_set_collection.index.get(5) is other_set.entries[0]
+    assert data_set_collection.filter(property_type="Density").ids == [1, 2, 5]
+
+    other_set.entries = []
+    assert data_set_collection.index.get(5) is None
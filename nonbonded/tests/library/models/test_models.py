@@ -1,10 +1,11 @@
 import os
+from typing import List
 
 import pytest
 import requests
 from pydantic import Field
 
-from nonbonded.library.models.models import BaseORM, BaseRESTCollection
+from nonbonded.library.models.models import BaseORM, BaseRESTCollection, CollectionMeta
 
 
 def test_collection_from_rest_error(requests_mock):
@@ -20,6 +21,112 @@ def test_collection_from_rest_error(requests_mock):
         MockRestCollection.from_rest()
 
 
+def test_collection_iter_rest(requests_mock):
+    class MockRestCollection(BaseRESTCollection):
+
+        items: List[int] = Field(default_factory=list)
+
+        @classmethod
+        def _get_endpoint(cls, **kwargs):
+            return "http://paginated.mocked.com"
+
+    items = [*range(5)]
+
+    def mock_page(request, _):
+
+        skip, limit = int(request.qs["skip"][0]), int(request.qs["limit"][0])
+
+        return MockRestCollection(
+            items=items[skip : skip + limit],
+            metadata=CollectionMeta(skip=skip, limit=limit, total_records=len(items)),
+        ).json()
+
+    requests_mock.get("http://paginated.mocked.com", text=mock_page)
+
+    pages = [*MockRestCollection.iter_rest(page_size=2)]
+
+    assert [page.items for page in pages] == [[0, 1], [2, 3], [4]]
+    assert requests_mock.call_count == 3
+
+
+def test_from_rest_conditional(requests_mock, tmpdir, monkeypatch):
+
+    from nonbonded.library.config import settings
+
+    monkeypatch.setattr(settings, "CACHE_DIRECTORY", str(tmpdir))
+
+    class MockRestCollection(BaseRESTCollection):
+
+        items: List[int] = Field(default_factory=list)
+
+        @classmethod
+        def _get_endpoint(cls, **kwargs):
+            return "http://cached.mocked.com"
+
+    body = MockRestCollection(items=[1, 2]).json()
+
+    def mock_response(request, context):
+
+        context.headers["ETag"] = '"1"'
+
+        if request.headers.get("If-None-Match") == '"1"':
+
+            context.status_code = 304
+            return ""
+
+        return body
+
+    requests_mock.get("http://cached.mocked.com", text=mock_response)
+
+    for _ in range(2):
+        assert MockRestCollection.from_rest().items == [1, 2]
+
+    assert "If-None-Match" not in requests_mock.request_history[0].headers
+    assert requests_mock.request_history[1].headers["If-None-Match"] == '"1"'
+
+    # Disabling the cache should lead to the full response being requested.
+    monkeypatch.setattr(settings, "RESPONSE_CACHE_SIZE", 0)
+
+    assert MockRestCollection.from_rest().items == [1, 2]
+    assert "If-None-Match" not in requests_mock.request_history[2].headers
+
+
+@pytest.mark.parametrize("response_cache_size", [0, 10])
+def test_from_rest_relative_url(tmpdir, monkeypatch, response_cache_size):
+    """Test that models can be retrieved from relative URLs, such as those used by
+    the test client of the backend, whether or not responses are cached."""
+
+    from nonbonded.library.config import settings
+
+    monkeypatch.setattr(settings, "CACHE_DIRECTORY", str(tmpdir))
+    monkeypatch.setattr(settings, "RESPONSE_CACHE_SIZE", response_cache_size)
+
+    class MockRestCollection(BaseRESTCollection):
+
+        items: List[int] = Field(default_factory=list)
+
+        @classmethod
+        def _get_endpoint(cls, **kwargs):
+            return "/api/dev/mocked/"
+
+    class MockClient:
+        @staticmethod
+        def get(url, params=None, headers=None):
+
+            response = requests.Response()
+            response.status_code = 200
+            response.headers["ETag"] = '"1"'
+            response._content = MockRestCollection(items=[1]).json().encode()
+
+            return response
+
+    collection = MockRestCollection.from_rest(requests_class=MockClient)
+    assert collection.items == [1]
+
+    pages = [*MockRestCollection.iter_rest(page_size=2, requests_class=MockClient)]
+    assert [page.items for page in pages] == [[1]]
+
+
 def test_to_file(tmpdir):
     class MockORMObject(BaseORM):
         attribute: str = Field("mock_attribute")
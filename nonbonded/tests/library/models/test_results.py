@@ -1,4 +1,5 @@
 import numpy
+import pandas
 import pytest
 from openff.evaluator import unit
 from openff.evaluator.datasets import PhysicalPropertyDataSet, PropertyPhase
@@ -182,6 +183,44 @@ def test_analysed_result_from_evaluator():
     assert numpy.isclose(full_statistics.value, expected_std, rtol=0.10)
 
 
+def test_results_frame_to_statistics():
+    """Test that the statistics of each group are matched to the correct property
+    type and category, including those of each property type as a whole."""
+
+    results_frame = pandas.DataFrame(
+        [
+            ("Density", 1, 0.0, numpy.nan, 1.0, 0.0, "Alcohol"),
+            ("Density", 1, 0.0, numpy.nan, 3.0, 0.0, None),
+            ("EnthalpyOfMixing", 2, 0.0, 0.0, 5.0, 0.0, "Alcohol + Aqueous"),
+        ],
+        columns=[
+            "Property Type",
+            "N Components",
+            "Reference Value",
+            "Reference Std",
+            "Estimated Value",
+            "Estimated Std",
+            "Category",
+        ],
+    )
+
+    statistics = DataSetResult._results_frame_to_statistics(
+        results_frame, 10, [StatisticType.MSE], random_seed=1
+    )
+
+    assert {
+        (statistic.property_type, statistic.n_components, statistic.category): (
+            statistic.value
+        )
+        for statistic in statistics
+    } == {
+        ("Density", 1, None): 2.0,
+        ("Density", 1, "Alcohol"): 1.0,
+        ("EnthalpyOfMixing", 2, None): 5.0,
+        ("EnthalpyOfMixing", 2, "Alcohol + Aqueous"): 5.0,
+    }
+
+
 def test_benchmark_result_from_evaluator(estimated_reference_sets):
     """Tests the `BenchmarkResult.from_evaluator` function."""
     estimated_data_set, reference_data_set = estimated_reference_sets
@@ -0,0 +1,88 @@
+import pickle
+
+import numpy
+import pytest
+
+from nonbonded.library.statistics.accumulators import StatisticsAccumulator
+from nonbonded.library.statistics.statistics import StatisticType, _compute_statistics
+
+N_DATA_POINTS = 1000
+
+
+@pytest.fixture()
+def data_points():
+
+    measured_values = numpy.random.normal(5.0, 1.0, N_DATA_POINTS)
+    estimated_values = measured_values + numpy.random.normal(0.2, 0.5, N_DATA_POINTS)
+
+    return measured_values, estimated_values
+
+
+def test_update_chunks(data_points):
+    """Test that accumulating data in chunks reproduces the statistics computed
+    from the full data set."""
+
+    measured_values, estimated_values = data_points
+
+    accumulator = StatisticsAccumulator()
+
+    for chunk in numpy.array_split(numpy.arange(N_DATA_POINTS), 7):
+        accumulator.update(measured_values[chunk], estimated_values[chunk])
+
+    statistic_types = [StatisticType.R2, StatisticType.RMSE, StatisticType.MSE]
+
+    expected_values, _ = _compute_statistics(
+        measured_values, estimated_values, statistic_types
+    )
+    statistic_values = accumulator.statistics(statistic_types)
+
+    assert accumulator.n_data_points == N_DATA_POINTS
+    assert numpy.allclose(
+        [statistic_values[x] for x in statistic_types], expected_values
+    )
+
+
+def test_merge(data_points):
+    """Test that merging accumulators of separate shards matches accumulating all
+    of the data at once, and that accumulators can be pickled between processes."""
+
+    measured_values, estimated_values = data_points
+
+    full_accumulator = StatisticsAccumulator().update(measured_values, estimated_values)
+
+    shard_a = StatisticsAccumulator().update(
+        measured_values[:300], estimated_values[:300]
+    )
+    shard_b = pickle.loads(
+        pickle.dumps(
+            StatisticsAccumulator().update(
+                measured_values[300:], estimated_values[300:]
+            )
+        )
+    )
+
+    merged_accumulator = shard_a + shard_b
+
+    assert merged_accumulator.n_data_points == N_DATA_POINTS
+    assert shard_a.n_data_points == 300
+
+    for statistic_type, value in full_accumulator.statistics().items():
+        assert numpy.isclose(merged_accumulator.statistics()[statistic_type], value)
+
+
+def test_std_and_empty():
+
+    accumulator = StatisticsAccumulator()
+
+    assert numpy.isnan(accumulator.rmse)
+    assert numpy.isnan(accumulator.r2)
+
+    accumulator.update([1.0, 1.0], [2.0, 2.0], [numpy.nan, 1.0], [1.0, 1.0])
+
+    assert numpy.isclose(accumulator.rmse, 1.0)
+    assert numpy.isclose(accumulator.mse, 1.0)
+    assert numpy.isclose(accumulator.r2, 0.0)
+    assert numpy.isclose(accumulator.mean_variance, 1.5)
+
+    with pytest.raises(ValueError):
+        accumulator.update([1.0], [1.0, 2.0])
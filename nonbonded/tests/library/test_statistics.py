@@ -1,8 +1,18 @@
 import numpy
+import pytest
 
 from nonbonded.library.statistics.statistics import (
+    ADAPTIVE_BOOTSTRAP_BATCH_ITERATIONS,
+    ConfidenceIntervalMethod,
     StatisticType,
+    _compute_batched_statistics,
+    _compute_bootstrapped_statistics,
+    _compute_statistics,
+    _leave_one_out_statistics,
+    bootstrap_grouped_residuals,
     bootstrap_residuals,
+    compute_grouped_residual_statistics,
+    compute_grouped_statistics,
     compute_statistics,
 )
 
@@ -97,3 +107,374 @@ def test_bootstrap_residuals():
     (rmse, _, _) = bootstrap_residuals(squared_residuals, 0.95, N_ITERATIONS)
 
     assert numpy.isclose(rmse, expected_std, rtol=0.1)
+
+
+def test_batched_statistics_match_linregress():
+    """Test that the closed form statistics match those computed using
+    ``scipy.stats.linregress``."""
+
+    import scipy.stats
+
+    measured_values = numpy.random.normal(0.0, 1.0, (5, N_DATA_POINTS))
+    estimated_values = measured_values + numpy.random.normal(0.0, 0.5, (5, 1))
+    estimated_values += numpy.random.normal(0.0, 0.5, (5, N_DATA_POINTS))
+
+    statistic_types = [StatisticType.R2, StatisticType.RMSE, StatisticType.MSE]
+
+    statistic_values, _ = _compute_batched_statistics(
+        measured_values, estimated_values, statistic_types
+    )
+    assert statistic_values.shape == (5, 3)
+
+    for batch_index in range(5):
+
+        _, _, r, _, _ = scipy.stats.linregress(
+            measured_values[batch_index], estimated_values[batch_index]
+        )
+        residuals = estimated_values[batch_index] - measured_values[batch_index]
+
+        assert numpy.allclose(
+            statistic_values[batch_index],
+            [r ** 2, numpy.sqrt(numpy.mean(residuals ** 2)), numpy.mean(residuals)],
+        )
+
+
+def test_batched_statistics_no_variance():
+    """Test that R^2 is defined as zero when the values have no variance."""
+
+    statistic_values, _ = _compute_batched_statistics(
+        numpy.zeros((2, 4)), numpy.ones((2, 4)), [StatisticType.R2]
+    )
+    assert numpy.allclose(statistic_values, 0.0)
+
+
+def test_bootstrapped_statistics_memory_limit():
+    """Test that the bootstrapped statistics are reproducible for a fixed seed and
+    that batching the iterations to respect a memory limit does not change the
+    samples which are drawn."""
+
+    measured_values = numpy.linspace(0.0, 1.0, N_DATA_POINTS)
+    estimated_values = measured_values + numpy.random.normal(0.0, 0.1, N_DATA_POINTS)
+
+    kwargs = dict(
+        measured_values=measured_values,
+        measured_stds=numpy.zeros(N_DATA_POINTS),
+        estimated_values=estimated_values,
+        estimated_stds=numpy.full(N_DATA_POINTS, 0.01),
+        bootstrap_iterations=N_ITERATIONS,
+    )
+
+    means_a, stds_a, cis_a = _compute_bootstrapped_statistics(
+        **kwargs, random_state=1234
+    )
+    means_b, stds_b, cis_b = _compute_bootstrapped_statistics(
+        **kwargs, random_state=1234
+    )
+
+    assert means_a == means_b
+    assert stds_a == stds_b
+    assert cis_a == cis_b
+
+    means_c, stds_c, cis_c = _compute_bootstrapped_statistics(
+        **kwargs, memory_limit=1, random_state=1234
+    )
+
+    assert means_a == means_c
+    assert stds_a == stds_c
+    assert cis_a == cis_c
+
+
+def test_bootstrap_grouped_residuals():
+    """Test that the grouped bootstrap returns the RMSE of each group."""
+
+    expected_stds = numpy.array([1.0, 2.0, 3.0])
+    group_sizes = [N_DATA_POINTS, 1, N_DATA_POINTS // 2]
+
+    squared_residuals = numpy.concatenate(
+        [
+            numpy.random.normal(0.0, expected_std, group_size) ** 2
+            for expected_std, group_size in zip(expected_stds, group_sizes)
+        ]
+    )
+    offsets = numpy.cumsum([0, *group_sizes])
+
+    rmse, rmse_std, rmse_ci, n_iterations = bootstrap_grouped_residuals(
+        squared_residuals, offsets, 0.95, N_ITERATIONS
+    )
+
+    assert rmse.shape == rmse_std.shape == (3,)
+    assert numpy.all(n_iterations == N_ITERATIONS)
+    assert rmse_ci.shape == (3, 2)
+
+    assert numpy.allclose(rmse[[0, 2]], expected_stds[[0, 2]], rtol=0.1)
+    assert numpy.isclose(rmse[1], numpy.sqrt(squared_residuals[N_DATA_POINTS]))
+
+    # A group with a single residual should always resample that residual.
+    assert numpy.isclose(rmse_std[1], 0.0)
+    assert numpy.allclose(rmse_ci[1], rmse[1])
+
+    assert numpy.all(rmse_ci[:, 0] <= rmse) and numpy.all(rmse_ci[:, 1] >= rmse)
+
+
+def test_bootstrap_grouped_residuals_empty_group():
+
+    with pytest.raises(ValueError, match="at least one squared residual"):
+        bootstrap_grouped_residuals(numpy.ones(2), [0, 2, 2])
+
+
+def test_compute_grouped_statistics():
+    """Test that the grouped statistics match those computed for each group
+    separately."""
+
+    group_codes = numpy.array([2, 0, 2, 0] * (N_DATA_POINTS // 4))
+
+    measured_values = numpy.linspace(0.0, 1.0, N_DATA_POINTS)
+    estimated_values = measured_values + numpy.random.normal(
+        group_codes * 0.1, 0.1, N_DATA_POINTS
+    )
+
+    measured_std = numpy.full(N_DATA_POINTS, numpy.nan)
+    estimated_std = numpy.zeros(N_DATA_POINTS)
+
+    statistic_types = [StatisticType.RMSE, StatisticType.R2, StatisticType.MSE]
+
+    statistics_frame = compute_grouped_statistics(
+        measured_values,
+        measured_std,
+        estimated_values,
+        estimated_std,
+        group_codes,
+        N_ITERATIONS,
+        statistic_types,
+    )
+
+    assert len(statistics_frame) == 2 * len(statistic_types)
+    assert {*statistics_frame["Group"]} == {0, 2}
+
+    for group_code in [0, 2]:
+
+        group_mask = group_codes == group_code
+
+        expected_values, expected_stds, _ = compute_statistics(
+            measured_values[group_mask],
+            measured_std[group_mask],
+            estimated_values[group_mask],
+            estimated_std[group_mask],
+            N_ITERATIONS,
+            statistic_types,
+        )
+
+        group_frame = statistics_frame[statistics_frame["Group"] == group_code]
+
+        for statistic_row in group_frame.to_dict("records"):
+
+            statistic_type = statistic_row["Statistic Type"]
+
+            assert numpy.isclose(
+                statistic_row["Value"], expected_values[statistic_type]
+            )
+            assert numpy.isclose(
+                statistic_row["Std"], expected_stds[statistic_type], rtol=0.3
+            )
+
+            assert statistic_row["Lower CI"] <= statistic_row["Value"]
+            assert statistic_row["Upper CI"] >= statistic_row["Value"]
+
+
+def test_compute_grouped_statistics_empty():
+
+    statistics_frame = compute_grouped_statistics(
+        *([numpy.zeros(0)] * 5), N_ITERATIONS, [StatisticType.RMSE]
+    )
+    assert len(statistics_frame) == 0
+
+
+def test_compute_grouped_statistics_reproducible():
+    """Test that the grouped statistics are reproducible for a fixed seed, and
+    that neither distributing the groups across processes nor batching them to
+    respect a memory limit changes the results."""
+
+    group_codes = numpy.arange(N_DATA_POINTS // 10) % 4
+
+    measured_values = numpy.random.normal(0.0, 1.0, len(group_codes))
+    estimated_values = measured_values + numpy.random.normal(0.0, 0.1, len(group_codes))
+
+    arguments = (
+        measured_values,
+        numpy.full(len(group_codes), 0.01),
+        estimated_values,
+        numpy.full(len(group_codes), 0.01),
+        group_codes,
+        N_ITERATIONS // 10,
+        [StatisticType.RMSE, StatisticType.R2],
+    )
+
+    serial_frame = compute_grouped_statistics(*arguments, random_state=1234)
+    repeat_frame = compute_grouped_statistics(*arguments, random_state=1234)
+    parallel_frame = compute_grouped_statistics(
+        *arguments, random_state=1234, n_processes=2
+    )
+
+    batched_frame = compute_grouped_statistics(
+        *arguments, random_state=1234, memory_limit=1
+    )
+
+    assert serial_frame.equals(repeat_frame)
+    assert serial_frame.equals(parallel_frame)
+    assert serial_frame.equals(batched_frame)
+
+    other_frame = compute_grouped_statistics(*arguments, random_state=4321)
+    assert not serial_frame.equals(other_frame)
+
+
+def test_bootstrap_grouped_residuals_reproducible():
+
+    squared_residuals = numpy.random.random(N_DATA_POINTS)
+    offsets = [0, 10, 600, N_DATA_POINTS]
+
+    serial_results = bootstrap_grouped_residuals(
+        squared_residuals, offsets, random_state=1234
+    )
+    parallel_results = bootstrap_grouped_residuals(
+        squared_residuals, offsets, random_state=1234, n_processes=2
+    )
+
+    for serial_result, parallel_result in zip(serial_results, parallel_results):
+        assert numpy.array_equal(serial_result, parallel_result)
+
+
+def test_compute_grouped_statistics_adaptive():
+    """Test that adaptive bootstrapping stops early for well determined groups while
+    respecting the maximum number of iterations."""
+
+    group_codes = numpy.array([0] * N_DATA_POINTS + [1] * 5)
+
+    measured_values = numpy.random.normal(0.0, 1.0, len(group_codes))
+    estimated_values = measured_values + numpy.random.normal(0.0, 0.1, len(group_codes))
+
+    arguments = (
+        measured_values,
+        numpy.zeros(len(group_codes)),
+        estimated_values,
+        numpy.zeros(len(group_codes)),
+        group_codes,
+        N_ITERATIONS,
+        [StatisticType.RMSE],
+    )
+
+    statistics_frame = compute_grouped_statistics(
+        *arguments, random_state=1234, convergence_tolerance=0.5
+    )
+
+    n_iterations = statistics_frame.set_index("Group")["Iterations"]
+
+    assert n_iterations[0] < N_ITERATIONS
+    assert n_iterations[0] % ADAPTIVE_BOOTSTRAP_BATCH_ITERATIONS == 0
+    assert n_iterations[1] <= N_ITERATIONS
+
+    fixed_frame = compute_grouped_statistics(*arguments, random_state=1234)
+    assert numpy.all(fixed_frame["Iterations"] == N_ITERATIONS)
+
+    strict_frame = compute_grouped_statistics(
+        *arguments, random_state=1234, convergence_tolerance=0.0
+    )
+    assert numpy.all(strict_frame["Iterations"] == N_ITERATIONS)
+
+
+def test_bootstrap_grouped_residuals_adaptive():
+
+    squared_residuals = numpy.random.random(N_DATA_POINTS)
+
+    _, _, _, n_iterations = bootstrap_grouped_residuals(
+        squared_residuals,
+        [0, 1, N_DATA_POINTS],
+        bootstrap_iterations=N_ITERATIONS,
+        convergence_tolerance=0.5,
+    )
+
+    # A single residual always resamples to the same RMSE and so converges
+    # immediately.
+    assert n_iterations[0] == 2 * ADAPTIVE_BOOTSTRAP_BATCH_ITERATIONS
+    assert n_iterations[1] <= N_ITERATIONS
+
+
+@pytest.mark.parametrize(
+    "confidence_interval_method",
+    [ConfidenceIntervalMethod.Analytic, ConfidenceIntervalMethod.Jackknife],
+)
+def test_compute_grouped_statistics_fast_methods(confidence_interval_method):
+    """Test that the analytic and jackknife confidence intervals are comparable
+    to those obtained by bootstrapping."""
+
+    group_codes = numpy.zeros(N_DATA_POINTS, dtype=int)
+
+    measured_values = numpy.random.normal(0.0, 1.0, N_DATA_POINTS)
+    estimated_values = measured_values + numpy.random.normal(0.5, 0.5, N_DATA_POINTS)
+
+    arguments = (
+        measured_values,
+        numpy.zeros(N_DATA_POINTS),
+        estimated_values,
+        numpy.zeros(N_DATA_POINTS),
+        group_codes,
+        N_ITERATIONS,
+        [StatisticType.RMSE, StatisticType.R2, StatisticType.MSE],
+    )
+
+    expected_frame = compute_grouped_statistics(*arguments, random_state=1234)
+    statistics_frame = compute_grouped_statistics(
+        *arguments, confidence_interval_method=confidence_interval_method
+    )
+
+    assert statistics_frame["Iterations"].isna().all()
+    assert numpy.allclose(statistics_frame["Value"], expected_frame["Value"])
+    assert numpy.allclose(statistics_frame["Std"], expected_frame["Std"], rtol=0.3)
+    assert numpy.allclose(
+        statistics_frame["Lower CI"], expected_frame["Lower CI"], rtol=0.1, atol=0.01
+    )
+    assert numpy.allclose(
+        statistics_frame["Upper CI"], expected_frame["Upper CI"], rtol=0.1, atol=0.01
+    )
+
+
+def test_leave_one_out_statistics():
+    """Test that the O(n) leave-one-out statistics match a brute force evaluation."""
+
+    measured_values = numpy.random.normal(0.0, 1.0, 20)
+    estimated_values = measured_values + numpy.random.normal(0.0, 0.5, 20)
+
+    statistic_types = [StatisticType.R2, StatisticType.RMSE, StatisticType.MSE]
+
+    subset_statistics = _leave_one_out_statistics(
+        measured_values, estimated_values, statistic_types
+    )
+
+    for index in range(20):
+
+        expected_statistics, _ = _compute_statistics(
+            numpy.delete(measured_values, index),
+            numpy.delete(estimated_values, index),
+            statistic_types,
+        )
+        assert numpy.allclose(subset_statistics[index], expected_statistics)
+
+
+@pytest.mark.parametrize(
+    "confidence_interval_method",
+    [ConfidenceIntervalMethod.Analytic, ConfidenceIntervalMethod.Jackknife],
+)
+def test_compute_grouped_residual_statistics(confidence_interval_method):
+
+    squared_residuals = numpy.random.normal(0.0, 2.0, N_DATA_POINTS) ** 2
+
+    rmse, rmse_std, rmse_ci, n_iterations = compute_grouped_residual_statistics(
+        squared_residuals,
+        [0, 1, N_DATA_POINTS],
+        confidence_interval_method=confidence_interval_method,
+    )
+
+    assert numpy.isclose(rmse[0], numpy.sqrt(squared_residuals[0]))
+    assert numpy.isclose(rmse[1], 2.0, rtol=0.1)
+
+    assert rmse_ci[1, 0] < rmse[1] < rmse_ci[1, 1]
+    assert all(value is None for value in n_iterations)
@@ -0,0 +1,134 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from nonbonded.library.utilities.cache import FunctionalGroupCache, ResponseCache
+from nonbonded.library.utilities.environments import ChemicalEnvironment
+
+
+def test_get_set(tmpdir):
+
+    cache = FunctionalGroupCache(os.path.join(tmpdir, "cache", "cache.sqlite"))
+
+    cache.set(
+        {"CO": {ChemicalEnvironment.Alcohol: 1}, "[Ar]": None},
+        version="1",
+    )
+
+    assert cache.get(["CO", "[Ar]", "C"], version="1") == {
+        "CO": {ChemicalEnvironment.Alcohol: 1},
+        "[Ar]": None,
+    }
+    assert cache.get(["CO"], version="2") == {}
+
+    # Make sure the entries persist between cache objects.
+    assert len(FunctionalGroupCache(cache.file_path).get(["CO"], version="1")) == 1
+
+    cache_size, entry_counts = cache.info()
+
+    assert cache_size > 0
+    assert entry_counts == {"1": 2}
+
+    cache.clear()
+    assert cache.info()[1] == {}
+
+
+def test_eviction(tmpdir):
+
+    cache = FunctionalGroupCache(os.path.join(tmpdir, "cache.sqlite"), max_size=2)
+
+    cache.set({"C": {ChemicalEnvironment.Alkane: 1}}, version="1")
+    cache.set({"CO": {ChemicalEnvironment.Alcohol: 1}}, version="1")
+
+    # Accessing 'C' should make 'CO' the least recently used entry.
+    cache.get(["C"], version="1")
+    cache.set({"CCO": {ChemicalEnvironment.Alcohol: 1}}, version="1")
+
+    assert {*cache.get(["C", "CO", "CCO"], version="1")} == {"C", "CCO"}
+
+
+def test_response_cache(tmpdir):
+
+    cache = ResponseCache(os.path.join(tmpdir, "cache", "responses.sqlite"))
+
+    assert cache.get("http://localhost/a") is None
+
+    cache.set("http://localhost/a", '"1"', '{"a": 1}')
+    assert cache.get("http://localhost/a") == ('"1"', '{"a": 1}')
+
+    cache.set("http://localhost/a", '"2"', '{"a": 2}')
+    assert ResponseCache(cache.file_path).get("http://localhost/a") == (
+        '"2"',
+        '{"a": 2}',
+    )
+
+    assert cache.info()[1] == 1
+
+    cache.clear()
+    assert cache.info()[1] == 0
+
+
+def test_response_cache_eviction(tmpdir):
+
+    cache = ResponseCache(os.path.join(tmpdir, "responses.sqlite"), max_size=2)
+
+    cache.set("http://localhost/a", '"a"', "a")
+    cache.set("http://localhost/b", '"b"', "b")
+
+    cache.get("http://localhost/a")
+    cache.set("http://localhost/c", '"c"', "c")
+
+    assert cache.get("http://localhost/b") is None
+    assert cache.get("http://localhost/a") is not None
+    assert cache.get("http://localhost/c") is not None
+
+
+def test_default(monkeypatch, tmpdir):
+
+    from nonbonded.library.config import settings
+
+    monkeypatch.setattr(settings, "CACHE_DIRECTORY", str(tmpdir))
+    monkeypatch.setattr(settings, "RESPONSE_CACHE_SIZE", 5)
+
+    cache = ResponseCache.default()
+
+    assert ResponseCache.default() is cache
+    assert cache.max_size == 5
+
+    monkeypatch.setattr(settings, "RESPONSE_CACHE_SIZE", 10)
+
+    assert ResponseCache.default() is cache
+    assert cache.max_size == 10
+
+    assert FunctionalGroupCache.default() is not cache
+
+
+def test_threads(tmpdir):
+
+    cache = ResponseCache(os.path.join(tmpdir, "responses.sqlite"))
+
+    def set_get(index: int):
+        cache.set(f"http://localhost/{index}", f'"{index}"', str(index))
+        return cache.get(f"http://localhost/{index}")
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        responses = [*executor.map(set_get, range(20))]
+
+    assert responses == [(f'"{index}"', str(index)) for index in range(20)]
+    assert cache.info()[1] == 20
+
+
+def test_connection_per_process(tmpdir):
+
+    cache = ResponseCache(os.path.join(tmpdir, "responses.sqlite"))
+    cache.set("http://localhost/a", '"a"', "a")
+
+    connection = cache._connection
+
+    # Emulate the connection having been opened by a parent process.
+    cache._connection_pid = os.getpid() + 1
+
+    assert cache.get("http://localhost/a") == ('"a"', "a")
+    assert cache._connection is not connection
+
+    connection.close()
+    cache.close()
@@ -1,11 +1,28 @@
+import os
+from collections import OrderedDict
+
 import pytest
 
 from nonbonded.library.models.datasets import Component
+from nonbonded.library.utilities.cache import FunctionalGroupCache
 from nonbonded.library.utilities.checkmol import (
+    FunctionalGroupBackend,
+    _map_chunks,
+    _masks_to_categories,
+    _split_batch_output,
+    analyse_environment_masks_batch,
     analyse_functional_groups,
+    analyse_functional_groups_batch,
+    category_cache_info,
+    checkmol_version,
+    clear_category_cache,
     components_to_categories,
+    components_to_categories_batch,
+)
+from nonbonded.library.utilities.environments import (
+    ChemicalEnvironment,
+    environments_to_mask,
 )
-from nonbonded.library.utilities.environments import ChemicalEnvironment
 
 
 @pytest.mark.parametrize(
@@ -30,6 +47,142 @@ def test_analyse_functional_groups_error():
     assert analyse_functional_groups("[Ar]") is None
 
 
+def test_analyse_functional_groups_batch():
+    """Tests that analysing a batch of smiles patterns yields the same groups as
+    analysing each pattern individually, including when one of the patterns cannot
+    be processed."""
+
+    smiles = ["C", "CO", "C=O", "CC(=O)CO", "[Ar]", "CCCC", "O"]
+
+    batch_groups = analyse_functional_groups_batch(smiles, chunk_size=4)
+
+    assert [*batch_groups] == smiles
+    assert batch_groups["[Ar]"] is None
+
+    for pattern in smiles:
+        assert batch_groups[pattern] == analyse_functional_groups(pattern)
+
+
+def test_analyse_functional_groups_parallel():
+
+    smiles = ["CO", "C=O", "CC(=O)CO", "CCCC", "CCOC(=O)C"]
+
+    assert analyse_functional_groups_batch(
+        smiles, chunk_size=2, cache=None, n_processes=2
+    ) == {pattern: analyse_functional_groups(pattern) for pattern in smiles}
+
+
+def test_analyse_functional_groups_failure(tmpdir, monkeypatch):
+    """Tests that molecules which could not be analysed are not stored in the
+    persistent cache."""
+
+    from nonbonded.library.utilities import checkmol
+
+    monkeypatch.setattr(checkmol, "_functional_group_cache", OrderedDict())
+
+    cache = FunctionalGroupCache(os.path.join(tmpdir, "functional-groups.sqlite"))
+
+    groups = analyse_functional_groups_batch(
+        ["CO", "[Ar]"], cache=cache, backend=FunctionalGroupBackend.Checkmol
+    )
+    assert groups["[Ar]"] is None
+
+    assert [*cache.get(["CO", "[Ar]"], checkmol_version())] == ["CO"]
+
+
+def test_analyse_environment_masks_batch():
+
+    smiles = ["CO", "OC", "[Ar]"]
+
+    assert analyse_environment_masks_batch(smiles) == {
+        "CO": environments_to_mask(analyse_functional_groups("CO")),
+        "OC": environments_to_mask(analyse_functional_groups("CO")),
+        "[Ar]": 0,
+    }
+
+
+def test_map_chunks():
+
+    assert _map_chunks(len, [*"abcde"], chunk_size=4, n_processes=2) == [3, 2]
+    assert _map_chunks(len, [], chunk_size=4, n_processes=2) == []
+
+
+def test_components_to_categories_precomputed():
+    """Tests that categories are assigned from a table of pre-computed functional
+    groups when one is provided."""
+
+    functional_groups = {
+        "CC(=O)CO": {ChemicalEnvironment.Alcohol: 1, ChemicalEnvironment.Ketone: 1}
+    }
+
+    categories = components_to_categories(
+        [Component(smiles="CC(=O)CO", mole_fraction=1.0)],
+        [ChemicalEnvironment.Alcohol, ChemicalEnvironment.Ketone],
+        functional_groups,
+    )
+
+    assert categories == ["Alcohol", "Ketone"]
+
+
+def test_components_to_categories_cache():
+    """Tests that mixtures of the same composition at different state points share
+    a single cache entry, and that the cache respects the amount of each component."""
+
+    functional_groups = {
+        "CCO": {ChemicalEnvironment.Alcohol: 1},
+        "CC(C)=O": {ChemicalEnvironment.Ketone: 1},
+    }
+    environments = [ChemicalEnvironment.Alcohol, ChemicalEnvironment.Ketone]
+
+    clear_category_cache()
+
+    for mole_fraction in [0.2, 0.3, 0.4]:
+
+        categories = components_to_categories(
+            [
+                Component(smiles="CCO", mole_fraction=mole_fraction),
+                Component(smiles="CC(C)=O", mole_fraction=1.0 - mole_fraction),
+            ],
+            environments,
+            functional_groups,
+        )
+        assert categories == ["Alcohol < Ketone"]
+
+    categories = components_to_categories(
+        [
+            Component(smiles="CC(C)=O", mole_fraction=0.2),
+            Component(smiles="CCO", mole_fraction=0.8),
+        ],
+        environments,
+        functional_groups,
+    )
+    assert categories == ["Alcohol > Ketone"]
+
+    cache_info = category_cache_info()
+
+    assert cache_info.hits == 2
+    assert cache_info.misses == 2
+    assert cache_info.size == 2
+
+
+def test_split_batch_output():
+
+    output = "\n".join(
+        [
+            "#072:1:1",
+            "#073:1:1",
+            "#027:1:2",
+            "#028:1:2",
+            "#072:1:1",
+            "#073:1:1",
+        ]
+    )
+
+    assert _split_batch_output(output, 2) == [[], ["#027:1:2", "#028:1:2"]]
+    assert _split_batch_output(output, 3) is None
+    assert _split_batch_output(output + "\n#027:1:2", 2) is None
+
+
 @pytest.mark.parametrize(
     "components, expected_categories",
     [
@@ -106,6 +259,86 @@ def test_components_to_category(components, expected_categories):
 
     assert components_to_categories(components, environments) == expected_categories
 
+    assert components_to_categories_batch([components], environments) == [
+        expected_categories
+    ]
+
+
+def test_components_to_categories_batch():
+    """Tests that categorizing a column of compositions at once yields the same
+    categories as categorizing each in turn, and that each distinct composition is
+    only looked up in the cache once."""
+
+    compositions = [
+        [Component(smiles="CCO", mole_fraction=1.0)],
+        [
+            Component(smiles="CCO", mole_fraction=0.2),
+            Component(smiles="CC(C)=O", mole_fraction=0.8),
+        ],
+        [
+            Component(smiles="CC(C)=O", mole_fraction=0.7),
+            Component(smiles="OCC", mole_fraction=0.3),
+        ],
+        [
+            Component(smiles="O", mole_fraction=1.0),
+            Component(smiles="CC(C)=O", mole_fraction=0.0, exact_amount=1),
+        ],
+        [Component(smiles="C", mole_fraction=1.0)],
+    ]
+    environments = [ChemicalEnvironment.Alcohol, ChemicalEnvironment.Ketone]
+
+    clear_category_cache()
+
+    categories = components_to_categories_batch(compositions, environments)
+
+    assert categories == [
+        ["Alcohol"],
+        ["Alcohol < Ketone"],
+        ["Alcohol < Ketone"],
+        ["Other (x=1.0) + Ketone (n=1)"],
+        ["Other"],
+    ]
+
+    cache_info = category_cache_info()
+
+    assert cache_info.hits == 0
+    assert cache_info.misses == 4
+
+    assert [
+        components_to_categories(composition, environments)
+        for composition in compositions
+    ] == categories
+
+    assert components_to_categories_batch([], environments) == []
+    assert components_to_categories_batch(compositions[:1], []) == [[]]
+
+    with pytest.raises(NotImplementedError):
+        components_to_categories_batch(
+            [[Component(smiles="C", mole_fraction=1.0)] * 3], environments
+        )
+
+
+def test_masks_to_categories():
+
+    alcohol, ketone = (
+        environments_to_mask([ChemicalEnvironment.Alcohol]),
+        environments_to_mask([ChemicalEnvironment.Ketone]),
+    )
+
+    assert _masks_to_categories((alcohol | ketone,), (0,), None) == (
+        "Alcohol",
+        "Ketone",
+    )
+    assert _masks_to_categories((0, 0), (0, 0), (True, False, False)) == (
+        "Other + Other",
+    )
+    assert _masks_to_categories(
+        (alcohol | ketone, alcohol), (0, 0), (False, True, False)
+    ) == ("Alcohol + Alcohol", "Alcohol > Ketone")
+    assert _masks_to_categories((ketone, 0), (2, 0), None) == (
+        "Other (x=1.0) + Ketone (n=2)",
+    )
+
 
 def test_three_components_to_categories():
 
@@ -0,0 +1,43 @@
+from nonbonded.library.utilities.environments import (
+    ENVIRONMENT_BITS,
+    ChemicalEnvironment,
+    environments_to_mask,
+    mask_to_environments,
+)
+
+
+def test_environment_bits_unique():
+
+    assert len({*ENVIRONMENT_BITS.values()}) == len(ChemicalEnvironment)
+
+
+def test_mask_round_trip():
+
+    environments = [
+        ChemicalEnvironment.Aqueous,
+        ChemicalEnvironment.Alcohol,
+        ChemicalEnvironment.Alkane,
+    ]
+
+    mask = environments_to_mask(environments)
+
+    assert mask_to_environments(mask) == (
+        ChemicalEnvironment.Alkane,
+        ChemicalEnvironment.Alcohol,
+        ChemicalEnvironment.Aqueous,
+    )
+    assert mask_to_environments(0) == ()
+
+
+def test_mask_filter():
+
+    matched_mask = environments_to_mask(
+        [ChemicalEnvironment.Alcohol, ChemicalEnvironment.Ketone]
+    )
+    requested_mask = environments_to_mask(
+        [ChemicalEnvironment.Alcohol, ChemicalEnvironment.Aqueous]
+    )
+
+    assert mask_to_environments(matched_mask & requested_mask) == (
+        ChemicalEnvironment.Alcohol,
+    )
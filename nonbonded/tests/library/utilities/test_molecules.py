@@ -1,4 +1,5 @@
 from nonbonded.library.utilities.molecules import (
+    canonical_smiles,
     smiles_to_url_string,
     url_string_to_smiles,
 )
@@ -13,3 +14,15 @@ def test_smiles_to_url_string():
 def test_url_string_to_smiles():
     """A simple test that a url encoded smiles pattern can be decoded."""
     assert url_string_to_smiles("N%23N") == "N#N"
+
+
+def test_canonical_smiles():
+    """Tests that different patterns which encode the same molecule are mapped to
+    the same canonical pattern."""
+
+    assert (
+        canonical_smiles("C(O)C")
+        == canonical_smiles("CCO")
+        == canonical_smiles("[H]OC([H])([H])C([H])([H])[H]")
+    )
+    assert canonical_smiles("not-a-smiles") == "not-a-smiles"
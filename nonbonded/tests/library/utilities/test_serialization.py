@@ -0,0 +1,141 @@
+import os
+
+import pytest
+
+from nonbonded.library.models.authors import Author
+from nonbonded.library.models.datasets import (
+    Component,
+    DataSet,
+    DataSetCollection,
+    DataSetEntry,
+)
+from nonbonded.library.models.results import (
+    BenchmarkResult,
+    DataSetResult,
+    DataSetResultEntry,
+)
+from nonbonded.library.utilities.serialization import (
+    SerializationFormat,
+    detect_format,
+    find_file,
+)
+
+
+def _create_data_set(data_set_id: str, n_entries: int) -> DataSet:
+
+    return DataSet(
+        id=data_set_id,
+        description=" ",
+        authors=[Author(name="Fake Name", email="fake@email.com", institute="None")],
+        entries=[
+            DataSetEntry(
+                id=None if index == 1 else index,
+                property_type="Density" if index % 2 == 0 else "EnthalpyOfMixing",
+                temperature=298.15 + index,
+                pressure=101.325,
+                value=1.0,
+                std_error=None if index % 2 == 0 else 0.1,
+                doi=f"doi-{index % 3}",
+                components=[
+                    Component(smiles="O", mole_fraction=1.0),
+                    Component(
+                        smiles="CO", mole_fraction=0.0, exact_amount=1, role="Solute"
+                    ),
+                ][: 1 + index % 2],
+            )
+            for index in range(n_entries)
+        ],
+    )
+
+
+def _create_benchmark_result() -> BenchmarkResult:
+
+    return BenchmarkResult(
+        id="benchmark-1",
+        study_id="study-1",
+        project_id="project-1",
+        calculation_environment={"openff-evaluator": "1.0.0"},
+        analysis_environment={},
+        data_set_result=DataSetResult(
+            result_entries=[
+                DataSetResultEntry(
+                    reference_id=index,
+                    estimated_value=1.0,
+                    estimated_std_error=0.1,
+                    categories=["Alcohol", "Ester"][: index % 3],
+                )
+                for index in range(4)
+            ],
+            statistic_entries=[],
+        ),
+    )
+
+
+@pytest.mark.parametrize(
+    "model",
+    [
+        _create_data_set("data-set-1", 5),
+        _create_data_set("data-set-1", 0),
+        DataSetCollection(
+            data_sets=[
+                _create_data_set("data-set-1", 3),
+                _create_data_set("data-set-2", 0),
+                _create_data_set("data-set-3", 4),
+            ]
+        ),
+        _create_benchmark_result(),
+    ],
+)
+@pytest.mark.parametrize(
+    "extension, compression",
+    [
+        ("json", None),
+        ("msgpack", None),
+        ("msgpack", "gzip"),
+        ("parquet", None),
+        ("parquet", "zstd"),
+    ],
+)
+def test_round_trip(model, extension, compression, tmpdir):
+
+    file_path = os.path.join(tmpdir, f"model.{extension}")
+    model.to_file(file_path, compression=compression)
+
+    assert detect_format(file_path) == SerializationFormat(extension)
+
+    loaded_model = model.__class__.from_file(file_path)
+
+    assert loaded_model == model
+    assert loaded_model.json() == model.json()
+
+
+def test_find_file(tmpdir):
+
+    file_path = os.path.join(tmpdir, "benchmark-results.json")
+
+    with pytest.raises(FileNotFoundError):
+        find_file(file_path)
+
+    _create_benchmark_result().to_file(
+        os.path.join(tmpdir, "benchmark-results.parquet")
+    )
+
+    assert find_file(file_path) == os.path.join(tmpdir, "benchmark-results.parquet")
+    assert BenchmarkResult.from_file(file_path) == _create_benchmark_result()
+
+
+def test_load_wrong_model(tmpdir):
+
+    file_path = os.path.join(tmpdir, "model.msgpack")
+    _create_data_set("data-set-1", 1).to_file(file_path)
+
+    with pytest.raises(ValueError, match="rather than a DataSetCollection"):
+        DataSetCollection.from_file(file_path)
+
+
+def test_json_compression(tmpdir):
+
+    with pytest.raises(ValueError, match="JSON files cannot be compressed"):
+        _create_data_set("data-set-1", 1).to_file(
+            os.path.join(tmpdir, "model.json"), compression="gzip"
+        )
@@ -0,0 +1,117 @@
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+from nonbonded.library.utilities import session as session_module
+from nonbonded.library.utilities.session import (
+    create_session,
+    get_session,
+    reset_session,
+)
+
+
+@pytest.fixture()
+def flaky_server():
+    """A local HTTP server which responds to the first two requests with a 503
+    error, and to every subsequent request with a 200."""
+
+    request_paths = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def _respond(self):
+
+            request_paths.append(self.path)
+            status_code = 503 if len(request_paths) <= 2 else 200
+
+            self.send_response(status_code)
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"{}")
+
+        do_GET = _respond
+        do_POST = _respond
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield f"http://127.0.0.1:{server.server_port}", request_paths
+
+    server.shutdown()
+    server.server_close()
+
+
+def test_get_session():
+
+    reset_session()
+
+    session = get_session()
+    assert get_session() is session
+
+    reset_session()
+    assert get_session() is not session
+
+
+def test_create_session():
+
+    session = create_session(timeout=5.0, max_retries=2, pool_size=4)
+
+    assert session.timeout == 5.0
+
+    adapter = session.get_adapter("https://mocked.com")
+
+    assert adapter.max_retries.total == 2
+    assert adapter._pool_maxsize == 4
+
+
+def test_retry(flaky_server):
+
+    url, request_paths = flaky_server
+
+    session = create_session(max_retries=3, backoff_factor=0.0)
+
+    response = session.get(f"{url}/data")
+    response.raise_for_status()
+
+    assert request_paths == ["/data"] * 3
+
+
+def test_retry_exhausted(flaky_server):
+
+    url, request_paths = flaky_server
+
+    session = create_session(max_retries=1, backoff_factor=0.0)
+
+    response = session.get(url)
+
+    assert response.status_code == 503
+    assert len(request_paths) == 2
+
+
+def test_no_post_retry(flaky_server):
+
+    url, request_paths = flaky_server
+
+    session = create_session(max_retries=3, backoff_factor=0.0)
+
+    assert session.post(url, data="{}").status_code == 503
+    assert len(request_paths) == 1
+
+
+def test_session_per_process():
+
+    reset_session()
+
+    session = get_session()
+
+    # Emulate the session having been created by a parent process.
+    session_module._session_pid = os.getpid() + 1
+    assert get_session() is not session
+
+    reset_session()
@@ -0,0 +1,170 @@
+import pytest
+
+from nonbonded.library.models.datasets import Component
+from nonbonded.library.utilities.checkmol import (
+    FunctionalGroupBackend,
+    analyse_functional_groups_batch,
+    components_to_categories,
+)
+from nonbonded.library.utilities.environments import ChemicalEnvironment
+from nonbonded.library.utilities.smarts import (
+    analyse_smarts_groups,
+    supported_environments,
+)
+
+# The environments most commonly used to categorize data sets, and over which the
+# SMARTS engine should exactly reproduce `checkmol`.
+PARITY_ENVIRONMENTS = [
+    ChemicalEnvironment.Alkane,
+    ChemicalEnvironment.Aqueous,
+    ChemicalEnvironment.Alcohol,
+    ChemicalEnvironment.Aldehyde,
+    ChemicalEnvironment.Ketone,
+    ChemicalEnvironment.CarboxylicAcid,
+    ChemicalEnvironment.CarboxylicAcidEster,
+    ChemicalEnvironment.CarboxylicAcidAmide,
+    ChemicalEnvironment.Ether,
+    ChemicalEnvironment.Amine,
+    ChemicalEnvironment.HalogenDeriv,
+    ChemicalEnvironment.Nitrile,
+    ChemicalEnvironment.Alkene,
+    ChemicalEnvironment.Heterocycle,
+]
+
+PARITY_SMILES = [
+    "O",
+    "C",
+    "CCCCCC",
+    "CCO",
+    "CC(C)O",
+    "OCCO",
+    "CC=O",
+    "CC(C)=O",
+    "O=C1CCCCC1",
+    "CC(=O)O",
+    "CCOC(C)=O",
+    "CC(N)=O",
+    "CN(C)C=O",
+    "CCOCC",
+    "C1CCOC1",
+    "CCN",
+    "CCN(CC)CC",
+    "ClCCl",
+    "FC(F)(F)C(F)(F)F",
+    "CC#N",
+    "C=CCC",
+    "c1ccncc1",
+]
+
+
+@pytest.mark.parametrize(
+    "smiles, expected_environments",
+    [
+        ("CCCC", {ChemicalEnvironment.Alkane}),
+        (
+            "CCO",
+            {
+                ChemicalEnvironment.Hydroxy,
+                ChemicalEnvironment.Alcohol,
+                ChemicalEnvironment.PrimaryAlcohol,
+            },
+        ),
+        ("CC(C)=O", {ChemicalEnvironment.Carbonyl, ChemicalEnvironment.Ketone}),
+        (
+            "CCOC(C)=O",
+            {
+                ChemicalEnvironment.CarboxylicAcidDeriv,
+                ChemicalEnvironment.CarboxylicAcidEster,
+            },
+        ),
+        (
+            "CC(=O)OC(C)=O",
+            {
+                ChemicalEnvironment.CarboxylicAcidDeriv,
+                ChemicalEnvironment.CarboxylicAcidAnhydride,
+            },
+        ),
+        (
+            "CCN(CC)CC",
+            {
+                ChemicalEnvironment.Amine,
+                ChemicalEnvironment.TertiaryAmine,
+                ChemicalEnvironment.TertiaryAliphAmine,
+            },
+        ),
+        (
+            "Clc1ccccc1",
+            {
+                ChemicalEnvironment.HalogenDeriv,
+                ChemicalEnvironment.ArylHalide,
+                ChemicalEnvironment.ArylChloride,
+                ChemicalEnvironment.Aromatic,
+            },
+        ),
+    ],
+)
+def test_analyse_smarts_groups(smiles, expected_environments):
+
+    (groups,) = analyse_smarts_groups([smiles])
+    assert {*groups} == expected_environments
+
+
+def test_analyse_smarts_groups_counts():
+
+    (groups,) = analyse_smarts_groups(["OCCO"])
+    assert groups[ChemicalEnvironment.Alcohol] == 2
+
+
+def test_analyse_smarts_groups_error():
+    """Tests that `None` is returned for patterns that cannot be analysed, mirroring
+    the behaviour of checkmol."""
+    assert analyse_smarts_groups(["[Ar]", "not-a-smiles"]) == [None, None]
+
+
+def test_smarts_backend(monkeypatch):
+
+    from nonbonded.library.config import settings
+
+    assert analyse_functional_groups_batch(
+        ["CCO", "OCC", "[H]O[H]"], backend=FunctionalGroupBackend.SMARTS
+    ) == {
+        "CCO": analyse_smarts_groups(["CCO"])[0],
+        "OCC": analyse_smarts_groups(["CCO"])[0],
+        "[H]O[H]": {ChemicalEnvironment.Aqueous: 1},
+    }
+
+    monkeypatch.setattr(settings, "FUNCTIONAL_GROUP_BACKEND", "smarts")
+
+    categories = components_to_categories(
+        [Component(smiles="CC(=O)CO", mole_fraction=1.0)],
+        [ChemicalEnvironment.Alcohol, ChemicalEnvironment.Ketone],
+    )
+    assert categories == ["Alcohol", "Ketone"]
+
+
+@pytest.mark.parametrize("smiles", PARITY_SMILES)
+def test_checkmol_parity(smiles):
+    """Tests that the SMARTS engine assigns the same environments as checkmol for
+    the most commonly analysed environments."""
+
+    groups = {
+        backend: analyse_functional_groups_batch([smiles], backend=backend)[smiles]
+        for backend in FunctionalGroupBackend
+    }
+
+    checkmol_environments = {
+        environment
+        for environment in groups[FunctionalGroupBackend.Checkmol]
+        if environment in PARITY_ENVIRONMENTS
+    }
+    smarts_environments = {
+        environment
+        for environment in groups[FunctionalGroupBackend.SMARTS]
+        if environment in PARITY_ENVIRONMENTS
+    }
+
+    assert checkmol_environments == smarts_environments
+
+
+def test_parity_environments_supported():
+    assert all(x in supported_environments() for x in PARITY_ENVIRONMENTS)
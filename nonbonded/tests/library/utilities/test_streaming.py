@@ -0,0 +1,161 @@
+import os
+
+import pytest
+
+from nonbonded.library.models.authors import Author
+from nonbonded.library.models.datasets import (
+    Component,
+    DataSet,
+    DataSetCollection,
+    DataSetEntry,
+)
+from nonbonded.library.models.results import (
+    BenchmarkResult,
+    DataSetResult,
+    DataSetResultEntry,
+)
+from nonbonded.library.utilities.streaming import (
+    iter_data_set_chunks,
+    iter_data_set_entries,
+    iter_result_entries,
+    load_without_entries,
+)
+
+
+def _create_data_set(data_set_id: str, n_entries: int) -> DataSet:
+
+    return DataSet(
+        id=data_set_id,
+        description=f"{data_set_id} description",
+        authors=[Author(name="Fake Name", email="fake@email.com", institute="None")],
+        entries=[
+            DataSetEntry(
+                id=index,
+                property_type="Density",
+                temperature=298.15 + index,
+                pressure=101.325,
+                value=1.0,
+                std_error=None if index % 2 == 0 else 0.1,
+                doi=" ",
+                components=[Component(smiles="CO", mole_fraction=1.0)],
+            )
+            for index in range(n_entries)
+        ],
+    )
+
+
+@pytest.fixture()
+def data_set_collection() -> DataSetCollection:
+
+    return DataSetCollection(
+        data_sets=[
+            _create_data_set("data-set-1", 3),
+            _create_data_set("data-set-2", 0),
+            _create_data_set("data-set-3", 5),
+        ]
+    )
+
+
+@pytest.fixture()
+def benchmark_result() -> BenchmarkResult:
+
+    return BenchmarkResult(
+        id="benchmark-1",
+        study_id="study-1",
+        project_id="project-1",
+        calculation_environment={},
+        analysis_environment={},
+        data_set_result=DataSetResult(
+            result_entries=[
+                DataSetResultEntry(
+                    reference_id=index,
+                    estimated_value=1.0,
+                    estimated_std_error=0.1,
+                    categories=["Alcohol"],
+                )
+                for index in range(3)
+            ],
+            statistic_entries=[],
+        ),
+    )
+
+
+@pytest.mark.parametrize("extension", ["json", "parquet"])
+def test_iter_data_set_entries(data_set_collection, extension, tmpdir):
+
+    file_path = os.path.join(tmpdir, f"collection.{extension}")
+    data_set_collection.to_file(file_path)
+
+    assert [*iter_data_set_entries(file_path)] == [
+        entry
+        for data_set in data_set_collection.data_sets
+        for entry in data_set.entries
+    ]
+
+    data_set = data_set_collection.data_sets[0]
+
+    file_path = os.path.join(tmpdir, f"data-set.{extension}")
+    data_set.to_file(file_path)
+
+    assert [*iter_data_set_entries(file_path)] == data_set.entries
+
+
+@pytest.mark.parametrize("extension", ["json", "parquet"])
+def test_iter_data_set_chunks(data_set_collection, extension, tmpdir):
+
+    file_path = os.path.join(tmpdir, f"collection.{extension}")
+    data_set_collection.to_file(file_path)
+
+    chunks = [*iter_data_set_chunks(file_path, chunk_size=2)]
+
+    assert [(chunk.id, len(chunk)) for chunk in chunks] == [
+        ("data-set-1", 2),
+        ("data-set-1", 1),
+        ("data-set-3", 2),
+        ("data-set-3", 2),
+        ("data-set-3", 1),
+    ]
+    assert chunks[0].description == "data-set-1 description"
+
+    assert [entry for chunk in chunks for entry in chunk.iter_entries()] == [
+        entry
+        for data_set in data_set_collection.data_sets
+        for entry in data_set.entries
+    ]
+
+
+@pytest.mark.parametrize("extension", ["json", "msgpack"])
+def test_iter_result_entries(benchmark_result, extension, tmpdir):
+
+    file_path = os.path.join(tmpdir, f"benchmark-results.{extension}")
+    benchmark_result.to_file(file_path)
+
+    assert [
+        *iter_result_entries(file_path)
+    ] == benchmark_result.data_set_result.result_entries
+
+
+@pytest.mark.parametrize("extension", ["json", "parquet"])
+def test_load_without_entries(data_set_collection, benchmark_result, extension, tmpdir):
+
+    file_path = os.path.join(tmpdir, f"benchmark-results.{extension}")
+    benchmark_result.to_file(file_path)
+
+    loaded_result = load_without_entries(BenchmarkResult, file_path)
+
+    assert loaded_result.data_set_result.result_entries == []
+    assert loaded_result.json(
+        exclude={"data_set_result": {"result_entries"}}
+    ) == benchmark_result.json(exclude={"data_set_result": {"result_entries"}})
+
+    file_path = os.path.join(tmpdir, f"collection.{extension}")
+    data_set_collection.to_file(file_path)
+
+    loaded_collection = load_without_entries(DataSetCollection, file_path)
+
+    assert [data_set.id for data_set in loaded_collection.data_sets] == [
+        "data-set-1",
+        "data-set-2",
+        "data-set-3",
+    ]
+    assert all(len(data_set.entries) == 0 for data_set in loaded_collection.data_sets)